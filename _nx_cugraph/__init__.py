@@ -154,6 +154,7 @@ _info = {
         "tetrahedral_graph",
         "to_dict_of_lists",
         "to_numpy_array",
+        "to_pandas_edgelist",
         "to_scipy_sparse_array",
         "tournament_matrix",
         "transitivity",
@@ -188,6 +189,12 @@ _info = {
         "bfs_successors": "`sort_neighbors` parameter is not yet supported.",
         "bfs_tree": "`sort_neighbors` parameter is not yet supported.",
         "clustering": "Directed graphs and `weight` parameter are not yet supported.",
+        "convert_node_labels_to_integers": (
+            "Orderings are computed on the GPU and applied by renumbering the graph.\n"
+            "\n"
+            "    Nodes are ordered by their new labels, so iteration order may differ from\n"
+            '    networkx for orderings other than "default".'
+        ),
         "core_number": "Directed graphs are not yet supported.",
         "edge_betweenness_centrality": "`weight` parameter is not yet supported, and RNG with seed may be different.",
         "ego_graph": "Weighted ego_graph with negative cycles is not yet supported. `NotImplementedError` will be raised if there are negative `distance` edge weights.",
@@ -199,12 +206,26 @@ _info = {
         "louvain_communities": "`seed` parameter is currently ignored, and self-loops are not yet supported.",
         "lowest_common_ancestor": "May not always raise NetworkXError for graphs that are not DAGs.",
         "pagerank": "`dangling` parameter is not supported, but it is checked for validity.",
+        "relabel_nodes": (
+            "Array-like mappings are relabeled with vectorized operations.\n"
+            "\n"
+            "    ``mapping`` may also be an integer offset to add to integer node keys, a NumPy\n"
+            "    or CuPy array indexed by integer node keys, or a pandas or cuDF Series indexed\n"
+            "    by node keys (nodes not in the index keep their keys). When the new keys are\n"
+            "    the integers ``0..N-1``, they are used as node ids, so nodes are ordered by key."
+        ),
         "shortest_path": "Negative weights are not yet supported.",
         "shortest_path_length": "Negative weights are not yet supported.",
         "single_source_bellman_ford": "Negative cycles are not yet supported. ``NotImplementedError`` will be raised if there are negative edge weights. We plan to support negative edge weights soon. Also, callable ``weight`` argument is not supported.",
         "single_source_bellman_ford_path": "Negative cycles are not yet supported. ``NotImplementedError`` will be raised if there are negative edge weights. We plan to support negative edge weights soon. Also, callable ``weight`` argument is not supported.",
         "single_source_bellman_ford_path_length": "Negative cycles are not yet supported. ``NotImplementedError`` will be raised if there are negative edge weights. We plan to support negative edge weights soon. Also, callable ``weight`` argument is not supported.",
-        "to_numpy_array": "MultiGraphs are not yet supported. Only valid CuPy dtypes are supported.",
+        "to_numpy_array": (
+            "Only valid CuPy dtypes are supported.\n"
+            "\n"
+            "    For multigraphs, ``multigraph_weight`` of sum, min, max, and mean (such as\n"
+            "    ``np.mean`` or ``statistics.mean``) are computed on the GPU; other functions\n"
+            "    are called once per pair of nodes on the host."
+        ),
         "transitivity": "Directed graphs are not yet supported.",
         # END: additional_docs
     },
@@ -290,6 +311,10 @@ _info = {
         "single_source_dijkstra_path_length": {
             "dtype : dtype or None, optional": "The data type (np.float32, np.float64, or None) to use for the edge weights in the algorithm. If None, then dtype is determined by the edge values.",
         },
+        "to_numpy_array": {
+            "chunksize : int, optional": "Number of rows to compute on the GPU and copy to the output at a time. If None (the default), then the full matrix is computed on the GPU unless `out` is given or it does not fit in GPU memory, in which case a chunk size is chosen to use about 256 MiB of GPU memory per block.",
+            "out : numpy.ndarray, optional": "Pre-allocated host array of shape (N, N), such as a ``numpy.memmap``, to write the result into. It is filled in blocks of rows, so the full dense matrix never needs to fit in GPU memory. If given, `out` is returned and `order` is ignored.",
+        },
         # END: additional_parameters
     },
 }
@@ -326,6 +351,10 @@ def get_info():
         .strip()
         .lower()
         == "true",
+        # Maximum total bytes of graphs converted to GPU and cached; None is unbounded
+        "cache_budget": _parse_cache_budget(
+            os.environ.get("NX_CUGRAPH_CACHE_BUDGET", "")
+        ),
     }
 
     # Enable zero-code change usage with a simple environment variable
@@ -370,6 +399,31 @@ def get_info():
     return d
 
 
+def _parse_cache_budget(budget: str) -> int | None:
+    """Parse bytes such as "1000000", "500MB", or "2GiB"; None if empty or invalid.
+
+    Invalid values warn instead of raising, since NetworkX ignores backends whose
+    ``get_info`` raises.
+    """
+    import re
+    import warnings
+
+    if not (budget := budget.strip()):
+        return None
+    match = re.fullmatch(r"(\d+(?:\.\d*)?)\s*([kmgt]?)(i?)b?", budget.lower())
+    if match is None or match[3] and not match[2]:
+        warnings.warn(
+            f"Ignoring invalid NX_CUGRAPH_CACHE_BUDGET={budget!r}; expected a number "
+            'of bytes with an optional unit such as "500MB" or "2GiB".',
+            UserWarning,
+            stacklevel=2,
+        )
+        return None
+    number, unit, binary = match.groups()
+    scale = (1024 if binary else 1000) ** " kmgt".index(unit or " ")
+    return int(float(number) * scale) if "." in number else int(number) * scale
+
+
 def _check_networkx_version(nx_version=None) -> tuple[int, int] | tuple[int, int, int]:
     """Check the version of networkx and return ``(major, minor)`` version tuple."""
     import re
@@ -431,9 +485,14 @@ if __name__ == "__main__":
     sys.modules["numpy"] = Stub()
     sys.modules["pylibcugraph"] = Stub()
 
-    from _nx_cugraph.core import main
+    from _nx_cugraph.core import main, update_lazy_attrs
 
     filepath = Path(__file__)
     text = main(filepath)
     with filepath.open("w") as f:
         f.write(text)
+
+    filepath = filepath.parent.parent / "nx_cugraph" / "__init__.py"
+    text = update_lazy_attrs(filepath)
+    with filepath.open("w") as f:
+        f.write(text)
@@ -1,12 +1,16 @@
-# SPDX-FileCopyrightText: Copyright (c) 2023-2024, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 """Utilities to help keep _nx_cugraph up to date."""
 
 
 def get_functions():
+    import nx_cugraph
     from nx_cugraph.interface import BackendInterface
     from nx_cugraph.utils import networkx_algorithm
 
+    # Algorithms are registered when their (lazily imported) modules are imported
+    nx_cugraph._load_all()
+
     return {
         key: val
         for key, val in vars(BackendInterface).items()
@@ -14,6 +18,23 @@ def get_functions():
     }
 
 
+def get_lazy_attrs():
+    """Return ``{name: submodule}`` of names star-imported into nx_cugraph."""
+    from importlib import import_module
+
+    import nx_cugraph
+
+    rv = {}
+    # Later submodules take precedence, like in nx_cugraph._load_all
+    for modname in nx_cugraph._star_submodules:
+        module = import_module(f"nx_cugraph.{modname}")
+        names = getattr(module, "__all__", None)
+        if names is None:
+            names = [key for key in vars(module) if not key.startswith("_")]
+        rv.update(dict.fromkeys(names, modname))
+    return rv
+
+
 def get_additional_docs(functions=None):
     if functions is None:
         functions = get_functions()
@@ -87,3 +108,13 @@ def main(filepath):
         to_add.append("},")
     text = update_text(text, to_add, "additional_parameters")
     return text
+
+
+def update_lazy_attrs(filepath):
+    """Return the text of nx_cugraph/__init__.py with ``_lazy_attrs`` updated."""
+    from pathlib import Path
+
+    text = Path(filepath).read_text()
+    lazy_attrs = get_lazy_attrs()
+    to_add = [f'"{name}": "{lazy_attrs[name]}",' for name in sorted(lazy_attrs)]
+    return update_text(text, to_add, "lazy_attrs", indent=" " * 4)
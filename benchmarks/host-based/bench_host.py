@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION.
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmarks of the host (Python) code of nx-cugraph that run without a GPU.
+
+NumPy stands in for CuPy (see ``conftest.py``), so these measure converting
+graphs, building results, and handling node keys, not GPU compute.
+"""
+import random
+
+import networkx as nx
+import numpy as np
+import pytest
+
+import nx_cugraph as nxcg
+from nx_cugraph.utils import _groupby, index_dtype
+
+################################################################################
+# Fixtures and params
+
+SEED = 42
+
+size_param_values = [
+    pytest.param(1_000, marks=pytest.mark.small),
+    pytest.param(100_000, marks=pytest.mark.medium),
+]
+
+
+def _add_weights(G, seed=SEED):
+    rng = random.Random(seed)
+    for *_, data in G.edges(data=True):
+        data["weight"] = rng.random()
+    return G
+
+
+def scale_free_graph(N):
+    """Undirected Barabási–Albert graph with ``4 * N`` edges and edge weights."""
+    return _add_weights(nx.barabasi_albert_graph(N, 4, seed=SEED))
+
+
+def grid_graph(N):
+    """Undirected 2-d grid graph with ``(row, col)`` tuples as node keys."""
+    n = max(int(N**0.5), 1)
+    return _add_weights(nx.grid_2d_graph(n, n))
+
+
+def multigraph(N):
+    """Undirected multigraph with about three parallel edges per node pair."""
+    rng = random.Random(SEED)
+    G = nx.MultiGraph()
+    G.add_nodes_from(range(N))
+    for _ in range(4 * N):
+        u = rng.randrange(N)
+        v = rng.randrange(N)
+        G.add_edges_from([(u, v)] * rng.randint(1, 5))
+    return _add_weights(G)
+
+
+graph_param_values = [scale_free_graph, grid_graph, multigraph]
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        pytest.param(
+            (gen, size), marks=size.marks, id=f"{gen.__name__}-N={size.values[0]}"
+        )
+        for gen in graph_param_values
+        for size in size_param_values
+    ],
+)
+def graph_obj(request):
+    gen, size = request.param
+    return gen(size.values[0])
+
+
+@pytest.fixture(scope="module")
+def cudagraph(graph_obj):
+    return nxcg.from_networkx(
+        graph_obj, preserve_all_attrs=True, use_compat_graph=False
+    )
+
+
+@pytest.fixture(scope="module")
+def node_values(cudagraph):
+    return np.random.default_rng(SEED).random(cudagraph._N)
+
+
+################################################################################
+# Benchmarks
+def bench_from_networkx(benchmark, graph_obj):
+    benchmark(nxcg.from_networkx, graph_obj, use_compat_graph=False)
+
+
+def bench_from_networkx_edge_attrs(benchmark, graph_obj):
+    benchmark(
+        nxcg.from_networkx,
+        graph_obj,
+        edge_attrs={"weight": 1.0},
+        use_compat_graph=False,
+    )
+
+
+def bench_to_networkx(benchmark, cudagraph):
+    benchmark(nxcg.to_networkx, cudagraph)
+
+
+def bench_nodearray_to_dict(benchmark, cudagraph, node_values):
+    benchmark(cudagraph._nodearray_to_dict, node_values)
+
+
+def bench_nodearrays_to_dict(benchmark, cudagraph, node_values):
+    node_ids = np.arange(0, cudagraph._N, 2, dtype=index_dtype)
+    benchmark(cudagraph._nodearrays_to_dict, node_ids, node_values[::2])
+
+
+def bench_groupby(benchmark, cudagraph):
+    num_groups = max(cudagraph._N // 100, 1)
+    groups = np.random.default_rng(SEED).integers(num_groups, size=cudagraph._N)
+    benchmark(_groupby, groups, np.arange(cudagraph._N, dtype=index_dtype))
+
+
+def bench_relabel_nodes_dict(benchmark, graph_obj, cudagraph):
+    mapping = {node: (node, "x") for node in graph_obj}
+    benchmark(nxcg.relabel_nodes, cudagraph, mapping)
+
+
+def bench_relabel_nodes_array(benchmark, cudagraph):
+    if cudagraph.key_to_id is not None:
+        pytest.skip("Array mappings are indexed by integer node keys")
+    mapping = np.arange(cudagraph._N)[::-1] * 2
+    benchmark(nxcg.relabel_nodes, cudagraph, mapping)
+
+
+@pytest.mark.parametrize("ordering", ["default", "sorted", "decreasing degree"])
+def bench_convert_node_labels_to_integers(benchmark, cudagraph, ordering):
+    benchmark(nxcg.convert_node_labels_to_integers, cudagraph, ordering=ordering)
@@ -0,0 +1,6 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION.
+# SPDX-License-Identifier: Apache-2.0
+import numpy_cupy
+
+# Must happen before anything imports nx_cugraph
+numpy_cupy.install()
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION.
+# SPDX-License-Identifier: Apache-2.0
+"""NumPy-backed stand-ins for CuPy and pylibcugraph to run nx-cugraph on the host.
+
+nx-cugraph only uses the NumPy-compatible subset of CuPy (plus ``asnumpy`` and
+``get_array_module``), so NumPy can stand in for it to measure the Python code
+that converts graphs and builds results. pylibcugraph is replaced by a module
+that raises when it is used, so algorithms that call it can't be measured here.
+
+``install()`` must be called before ``nx_cugraph`` is imported.
+"""
+import sys
+import types
+
+import numpy as np
+
+__all__ = ["install", "is_installed"]
+
+
+class _MissingModule(types.ModuleType):
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        raise RuntimeError(
+            f"{self.__name__}.{name} is not available when benchmarking on the host"
+        )
+
+
+def _make_cupy():
+    cupy = types.ModuleType("cupy", "NumPy standing in for CuPy")
+    cupy.__dict__.update(
+        (key, val) for key, val in vars(np).items() if not key.startswith("__")
+    )
+    cupy.__version__ = np.__version__
+    cupy.__numpy_stand_in__ = True
+    cupy.asnumpy = np.asarray
+    cupy.get_array_module = lambda *args: np
+    cuda = types.ModuleType("cupy.cuda")
+    cuda.is_available = lambda: False
+    cuda.runtime = types.SimpleNamespace(
+        CUDARuntimeError=RuntimeError, getDeviceCount=lambda: 0
+    )
+    cupy.cuda = cuda
+    return cupy
+
+
+def is_installed():
+    """Whether NumPy is standing in for CuPy in this process."""
+    return getattr(sys.modules.get("cupy"), "__numpy_stand_in__", False)
+
+
+def install():
+    """Use NumPy in place of CuPy and a placeholder for pylibcugraph."""
+    if is_installed():
+        return
+    if "nx_cugraph.classes" in sys.modules:
+        raise RuntimeError("install() must be called before nx_cugraph is imported")
+    sys.modules["cupy"] = _make_cupy()
+    sys.modules["pylibcugraph"] = _MissingModule("pylibcugraph")
@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import random
+import time
+import weakref
 from collections.abc import Mapping
 
 import cupy as cp
@@ -9,10 +11,16 @@ import networkx as nx
 import numpy as np
 import pandas as pd
 import pytest
-from cugraph import datasets
+from synthetic_datasets import SyntheticDataset
 
 import nx_cugraph as nxcg
 
+try:
+    from cugraph import datasets
+except ModuleNotFoundError:
+    # Only synthetic datasets can be used (they don't need to be downloaded)
+    datasets = None
+
 ################################################################################
 # Fixtures and params
 
@@ -22,37 +30,91 @@ rounds = 1
 iterations = 1
 warmup_rounds = 1
 
-dataset_param_values = [
-    # name: karate, nodes: 34, edges: 156
-    pytest.param(datasets.karate, marks=[pytest.mark.small, pytest.mark.undirected]),
-    # name: netscience, nodes: 1461, edges: 5484
-    pytest.param(datasets.netscience, marks=[pytest.mark.small, pytest.mark.directed]),
-    # name: email-Eu-core, nodes: 1005, edges: 25571
+if datasets is None:
+    cugraph_dataset_param_values = []
+else:
+    cugraph_dataset_param_values = [
+        # name: karate, nodes: 34, edges: 156
+        pytest.param(
+            datasets.karate, marks=[pytest.mark.small, pytest.mark.undirected]
+        ),
+        # name: netscience, nodes: 1461, edges: 5484
+        pytest.param(
+            datasets.netscience, marks=[pytest.mark.small, pytest.mark.directed]
+        ),
+        # name: email-Eu-core, nodes: 1005, edges: 25571
+        pytest.param(
+            datasets.email_Eu_core, marks=[pytest.mark.small, pytest.mark.directed]
+        ),
+        # name: amazon0302, nodes: 262111, edges: 1234877
+        pytest.param(
+            datasets.amazon0302, marks=[pytest.mark.medium, pytest.mark.directed]
+        ),
+        # name: cit-Patents, nodes: 3774768, edges: 16518948
+        pytest.param(
+            datasets.cit_patents, marks=[pytest.mark.medium, pytest.mark.directed]
+        ),
+        # name: hollywood, nodes: 1139905, edges: 57515616
+        pytest.param(
+            datasets.hollywood, marks=[pytest.mark.medium, pytest.mark.undirected]
+        ),
+        # name: soc-LiveJournal1, nodes: 4847571, edges: 68993773
+        pytest.param(
+            datasets.soc_livejournal, marks=[pytest.mark.medium, pytest.mark.directed]
+        ),
+        # name: europe_osm, nodes: 50912018, edges: 54054660
+        pytest.param(
+            datasets.europe_osm, marks=[pytest.mark.large, pytest.mark.undirected]
+        ),
+    ]
+
+# Generated from a seed and cached on disk (see synthetic_datasets.py)
+synthetic_dataset_param_values = [
+    # name: rmat-12, nodes: 4096, edges: 53252
+    pytest.param(
+        SyntheticDataset.from_name("rmat-12"),
+        marks=[pytest.mark.small, pytest.mark.directed, pytest.mark.synthetic],
+    ),
+    # name: road-100x100, nodes: 10000, edges: 16391
     pytest.param(
-        datasets.email_Eu_core, marks=[pytest.mark.small, pytest.mark.directed]
+        SyntheticDataset.from_name("road-100x100"),
+        marks=[pytest.mark.small, pytest.mark.undirected, pytest.mark.synthetic],
     ),
-    # name: amazon0302, nodes: 262111, edges: 1234877
-    pytest.param(datasets.amazon0302, marks=[pytest.mark.medium, pytest.mark.directed]),
-    # name: cit-Patents, nodes: 3774768, edges: 16518948
+    # name: ba-1000000-8, nodes: 1000000, edges: about 8000000
     pytest.param(
-        datasets.cit_patents, marks=[pytest.mark.medium, pytest.mark.directed]
+        SyntheticDataset.from_name("ba-1000000-8"),
+        marks=[pytest.mark.medium, pytest.mark.undirected, pytest.mark.synthetic],
     ),
-    # name: hollywood, nodes: 1139905, edges: 57515616
+    # name: grid-2000x2000, nodes: 4000000, edges: 7996000
     pytest.param(
-        datasets.hollywood, marks=[pytest.mark.medium, pytest.mark.undirected]
+        SyntheticDataset.from_name("grid-2000x2000"),
+        marks=[pytest.mark.medium, pytest.mark.undirected, pytest.mark.synthetic],
     ),
-    # name: soc-LiveJournal1, nodes: 4847571, edges: 68993773
+    # name: rmat-22, nodes: 4194304, edges: about 60000000
     pytest.param(
-        datasets.soc_livejournal, marks=[pytest.mark.medium, pytest.mark.directed]
+        SyntheticDataset.from_name("rmat-22"),
+        marks=[pytest.mark.medium, pytest.mark.directed, pytest.mark.synthetic],
     ),
-    # name: europe_osm, nodes: 50912018, edges: 54054660
+    # name: road-7000x7000, nodes: 49000000, edges: about 80000000
     pytest.param(
-        datasets.europe_osm, marks=[pytest.mark.large, pytest.mark.undirected]
+        SyntheticDataset.from_name("road-7000x7000"),
+        marks=[pytest.mark.large, pytest.mark.undirected, pytest.mark.synthetic],
     ),
 ]
 
+dataset_param_values = cugraph_dataset_param_values + synthetic_dataset_param_values
+
+# The last call of a wrapped algorithm as (func, args, kwargs, force_unlazy_eval),
+# which is called once more with nxcg.profile after the benchmark to get the
+# seconds per phase (see record_phase_timings).
+last_wrapped_call = []
+
 backend_param_values = ["cugraph", "cugraph-preconverted", None]
 
+# Synthetic datasets of graphs from the graph_obj fixture, so they may be built
+# on the GPU for "cugraph-preconverted" (see get_graph_obj_for_benchmark).
+synthetic_datasets_of_graphs = weakref.WeakKeyDictionary()
+
 
 def setup_module(module):
     """
@@ -86,7 +148,42 @@ def graph_obj(request):
     Returns a NX Graph or DiGraph obj from the dataset instance parameter.
     """
     dataset = request.param
-    return nx_graph_from_dataset(dataset)
+    G = nx_graph_from_dataset(dataset)
+    if isinstance(dataset, SyntheticDataset):
+        synthetic_datasets_of_graphs[G] = dataset
+    return G
+
+
+@pytest.fixture(autouse=True)
+def record_phase_timings(request):
+    """
+    Calls the last wrapped algorithm of a benchmark once more with nxcg.profile
+    and adds its seconds per phase to the "phases" extra_info of the benchmark,
+    and counters such as bytes converted and cache hits to "counters".
+
+    This is done after the timed rounds so profiling (which synchronizes the
+    GPU between phases) doesn't change the benchmark timings. Calls with the
+    NetworkX backend aren't traced, so they aren't profiled.
+    """
+    last_wrapped_call.clear()
+    yield
+    benchmark = request.node.funcargs.get("benchmark")
+    if benchmark is None or not last_wrapped_call:
+        return
+    [(func, args, kwargs, force_unlazy_eval)] = last_wrapped_call
+    last_wrapped_call.clear()
+    if kwargs["backend"] is None:
+        return
+    with nxcg.profile() as report:
+        start = time.perf_counter()
+        retval = func(*args, **kwargs)
+        call_end = time.perf_counter()
+        if force_unlazy_eval:
+            materialize(retval)
+        end = time.perf_counter()
+    timings = get_phase_timings(report, start, call_end, end)
+    benchmark.extra_info["phases"] = timings["phases"]
+    benchmark.extra_info["counters"] = timings["counters"]
 
 
 @pytest.fixture(
@@ -110,6 +207,8 @@ def nx_graph_from_dataset(dataset_obj):
     Read the dataset specified by the dataset_obj and create and return a
     nx.Graph or nx.DiGraph instance based on the dataset is_directed metadata.
     """
+    if isinstance(dataset_obj, SyntheticDataset):
+        return dataset_obj.get_graph()
     create_using = nx.DiGraph if dataset_obj.metadata["is_directed"] else nx.Graph
     names = dataset_obj.metadata["col_names"]
     dtypes = dataset_obj.metadata["col_types"]
@@ -131,27 +230,56 @@ def nx_graph_from_dataset(dataset_obj):
     return G
 
 
+def get_phase_timings(report, start, call_end, end):
+    """
+    Returns seconds per phase of a call traced by nxcg.profile that started at
+    start, returned at call_end, and finished materializing results at end.
+    Phases sum to the total time of the call.
+    """
+    summary = report.summary()
+    phases = {phase: info["seconds"] for phase, info in summary.pop("phases").items()}
+    del summary["calls"]
+    # Time not in any traced span is spent in dispatching, NetworkX, or Python
+    # code of nx-cugraph that isn't traced.
+    call_traced = materialize_traced = 0.0
+    for event in report.events:
+        if event["depth"] == 0:
+            if event["start"] < call_end:
+                call_traced += event["seconds"]
+            else:
+                materialize_traced += event["seconds"]
+    phases["materialize"] = max(end - call_end - materialize_traced, 0.0)
+    phases["other"] = max(call_end - start - call_traced, 0.0)
+    phases["total"] = end - start
+    return {"phases": phases, "counters": summary}
+
+
+def materialize(retval):
+    """
+    Returns the complete results of an iterator or other container.
+    """
+    if isinstance(retval, Mapping):
+        return dict(retval)
+    return list(retval)
+
+
 def get_backend_wrapper(backend_name):
     """
     Returns a callable that wraps an algo function in order to set the
     "backend" kwarg on it.
     """
 
-    # FIXME: consider a pytest param to run force_unlazy_eval=False for
-    # benchmarks that set it to True in order to measure the time spent for any
-    # deferred computation/conversions.
     def wrap_callable_for_dispatch(func, force_unlazy_eval=False):
         # force_unlazy_eval=True forces iterators and other containers to
         # generate a complete set of results in order to include any deferred
-        # compute or conversion in the benchmark
+        # compute or conversion in the benchmark. The time spent doing this is
+        # profiled separately as the "materialize" phase.
         def wrapper(*args, **kwargs):
             kwargs["backend"] = backend_name
+            last_wrapped_call[:] = [(func, args, kwargs, force_unlazy_eval)]
             retval = func(*args, **kwargs)
             if force_unlazy_eval:
-                if isinstance(retval, Mapping):
-                    retval = dict(retval)
-                else:
-                    retval = list(retval)
+                retval = materialize(retval)
             return retval
 
         return wrapper
@@ -201,6 +329,9 @@ def get_graph_obj_for_benchmark(graph_obj, backend_wrapper):
     """
     G = graph_obj
     if backend_wrapper.backend_name == "cugraph-preconverted":
+        if (dataset := synthetic_datasets_of_graphs.get(G)) is not None:
+            # Build the graph on the GPU from the edge list of the dataset
+            return dataset.get_cudagraph(use_compat_graph=True)
         G = nxcg.from_networkx(
             G,
             preserve_all_attrs=True,
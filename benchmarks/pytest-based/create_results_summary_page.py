@@ -1,16 +1,69 @@
-# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 
 
+import argparse
+import html
 import json
+import math
 import pathlib
 import platform
 import re
 import socket
 import subprocess
+import sys
 
 import psutil
 
+dataset_patt = re.compile(r".*ds=([\w-]+).*")
+backend_patt = re.compile(r".*backend=(\w+).*")
+k_patt = re.compile(".*k=(10*).*")
+
+html_head = """
+    <html>
+    <head>
+    <style>
+        table {
+            table-layout: fixed;
+            width: 100%;
+            border-collapse: collapse;
+        }
+        tbody tr:nth-child(odd) {
+            background-color: #ffffff;
+        }
+        tbody tr:nth-child(even) {
+            background-color: #d3d3d3;
+        }
+        tbody td {
+            text-align: center;
+            color: black;
+        }
+        th,
+        td {
+            padding: 12px;
+        }
+        .footer-main {
+            background-color: #d1d1d1;
+            padding: 20px;
+            padding-top: 0px;
+            font-size: 12px;
+            color: black;
+            width: 100%;
+            display: flex;
+        }
+        .box1{
+            flex: 1;
+            padding-right: 30px;
+        }
+        .box2{
+            flex: 4;
+        }
+        .indent {
+            text-indent: 20px;
+        }
+    </style>
+    </head>"""
+
 
 def get_formatted_time_value(time):
     if time < 1:
@@ -25,10 +78,43 @@ def get_formatted_time_value(time):
     return f"{time:.3f}{units}"
 
 
-def get_all_benchmark_info():
-    benchmarks = {}
-    # Populate benchmarks dir from .json files
-    for json_file in logs_dir.glob("*.json"):
+def get_benchmark_key(name, json_file):
+    """Return ``(algo_name, dataset, backend)`` from the name of a benchmark."""
+    # example name: "bench_triangles[ds=netscience-backend=cugraph-preconverted]"
+    algo_name = name.split("[")[0]
+    algo_name = algo_name.removeprefix("bench_")
+    # special case for betweenness_centrality
+    match = k_patt.match(name)
+    if match is not None:
+        algo_name += f", k={match.group(1)}"
+
+    match = dataset_patt.match(name)
+    if match is None:
+        raise RuntimeError(
+            f"benchmark name {name} in file {json_file} has an unexpected format"
+        )
+    dataset = match.group(1)
+    dataset = dataset.removesuffix("-backend")
+
+    match = backend_patt.match(name)
+    if match is None:
+        raise RuntimeError(
+            f"benchmark name {name} in file {json_file} has an unexpected format"
+        )
+    backend = match.group(1)
+    if backend == "None":
+        backend = "networkx"
+    return algo_name, dataset, backend
+
+
+def get_benchmark_runs(logs_path):
+    """Yield ``(json_file, benchmark_run)`` from ``--benchmark-json`` logs.
+
+    ``logs_path`` may be a directory of .json files or a single .json file.
+    """
+    logs_path = pathlib.Path(logs_path)
+    json_files = sorted(logs_path.glob("*.json")) if logs_path.is_dir() else [logs_path]
+    for json_file in json_files:
         try:
             with open(json_file) as file:
                 data = json.loads(file.read())
@@ -36,40 +122,84 @@ def get_all_benchmark_info():
             continue
 
         for benchmark_run in data["benchmarks"]:
-            # example name: "bench_triangles[ds=netscience-backend=cugraph-preconverted]"
-            name = benchmark_run["name"]
-
-            algo_name = name.split("[")[0]
-            algo_name = algo_name.removeprefix("bench_")
-            # special case for betweenness_centrality
-            match = k_patt.match(name)
-            if match is not None:
-                algo_name += f", k={match.group(1)}"
-
-            match = dataset_patt.match(name)
-            if match is None:
-                raise RuntimeError(
-                    f"benchmark name {name} in file {json_file} has an unexpected format"
-                )
-            dataset = match.group(1)
-            dataset = dataset.removesuffix("-backend")
+            yield json_file, benchmark_run
 
-            match = backend_patt.match(name)
-            if match is None:
-                raise RuntimeError(
-                    f"benchmark name {name} in file {json_file} has an unexpected format"
-                )
-            backend = match.group(1)
-            if backend == "None":
-                backend = "networkx"
-
-            runtime = benchmark_run["stats"]["mean"]
-            benchmarks.setdefault(algo_name, {}).setdefault(backend, {})[
-                dataset
-            ] = runtime
+
+def get_all_benchmark_info(logs_dir):
+    benchmarks = {}
+    # Populate benchmarks dir from .json files
+    for json_file, benchmark_run in get_benchmark_runs(logs_dir):
+        algo_name, dataset, backend = get_benchmark_key(
+            benchmark_run["name"], json_file
+        )
+        runtime = benchmark_run["stats"]["mean"]
+        benchmarks.setdefault(algo_name, {}).setdefault(backend, {})[dataset] = runtime
     return benchmarks
 
 
+def get_all_phase_info(logs_dir):
+    """Return ``{algo: {backend: {dataset: phases}}}`` of seconds per phase.
+
+    Phases are recorded in extra_info by ``bench_algos.py``, so older logs and
+    benchmarks that don't call algorithms through a backend have none.
+    """
+    phase_info = {}
+    for json_file, benchmark_run in get_benchmark_runs(logs_dir):
+        if not (phases := benchmark_run.get("extra_info", {}).get("phases")):
+            continue
+        algo_name, dataset, backend = get_benchmark_key(
+            benchmark_run["name"], json_file
+        )
+        phase_info.setdefault(algo_name, {}).setdefault(backend, {})[dataset] = phases
+    return phase_info
+
+
+def print_phase_table(phase_info, ordered_datasets):
+    """Print a table of where time is spent in nx-cugraph benchmarks by phase."""
+    rows = [
+        (algo_name, backend, phase_info[algo_name][backend])
+        for algo_name in sorted(phase_info)
+        for backend in sorted(phase_info[algo_name])
+        if backend != "networkx"
+    ]
+    if not rows:
+        return
+    print(
+        """    <h4>Time per phase: conversion to GPU ("convert" and "plc_graph"),
+    "compute", results to Python ("result", "to_networkx", and "materialize"),
+    and "other" (dispatching and untraced Python). The GPU is synchronized
+    between phases so asynchronous work is timed in the phase that launched
+    it.</h4>
+    <table>
+    <thead>
+    <tr>
+        <th>Algorithm<br>Backend</th>"""
+    )
+    for ds in ordered_datasets:
+        print(f"      <th>{ds}</th>")
+    print(
+        """   </tr>
+    </thead>
+    <tbody>"""
+    )
+    for algo_name, backend, dataset_phases in rows:
+        print("   <tr>")
+        print(f"      <td>{algo_name}<br>{backend}</td>")
+        for dataset in ordered_datasets:
+            if (phases := dataset_phases.get(dataset)) is None:
+                print("      <td></td>")
+                continue
+            total = phases["total"] or 1
+            lines = [
+                f"{phase}: {get_formatted_time_value(seconds)} ({seconds / total:.0%})"
+                for phase, seconds in phases.items()
+                if phase != "total" and seconds / total >= 0.005
+            ]
+            print(f"      <td>{'<br>'.join(lines)}</td>")
+        print("   </tr>")
+    print("""    </tbody>\n</table>""")
+
+
 def compute_perf_vals(cugraph_runtime, networkx_runtime):
     speedup_string = f"{networkx_runtime / cugraph_runtime:.3f}X"
     delta = networkx_runtime - cugraph_runtime
@@ -87,6 +217,192 @@ def compute_perf_vals(cugraph_runtime, networkx_runtime):
     return (speedup_string, delta_string)
 
 
+def get_benchmark_stats(logs_path):
+    """Return ``{(algo_name, dataset, backend): stats}`` from one set of logs."""
+    return {
+        get_benchmark_key(benchmark_run["name"], json_file): {
+            **{
+                key: benchmark_run["stats"][key] for key in ["mean", "stddev", "rounds"]
+            },
+            **benchmark_run.get("extra_info", {}),
+        }
+        for json_file, benchmark_run in get_benchmark_runs(logs_path)
+    }
+
+
+def compare_stats(baseline, candidate, threshold, noise_factor, spread=None):
+    """Return the ratio of mean runtimes and whether ``candidate`` changed.
+
+    A change is significant only if the ratio is beyond ``1 + threshold`` and the
+    difference of means is more than ``noise_factor`` times its standard error,
+    so noisy benchmarks don't fail comparisons.
+
+    The standard error of a mean of several rounds is from its ``stddev``. A
+    single round has no ``stddev``, so its error is ``spread``, the standard
+    deviation of the means of the benchmark in repeated runs of the baseline.
+    Changes of single rounds are "inconclusive" if ``spread`` is None.
+    """
+    ratio = candidate["mean"] / baseline["mean"]
+    variance = 0.0
+    for stats in [baseline, candidate]:
+        if stats["rounds"] > 1:
+            variance += stats["stddev"] ** 2 / stats["rounds"]
+        elif spread is not None:
+            variance += spread**2
+        else:
+            variance = None
+            break
+    delta = candidate["mean"] - baseline["mean"]
+    if 1 / (1 + threshold) <= ratio <= 1 + threshold:
+        status = "unchanged"
+    elif variance is None:
+        status = "inconclusive"
+    elif abs(delta) <= noise_factor * math.sqrt(variance):
+        status = "unchanged"
+    else:
+        status = "regression" if delta > 0 else "improvement"
+    return ratio, status
+
+
+def get_spread(means):
+    """Return the sample standard deviation of ``means``, or None if too few."""
+    if len(means) < 2:
+        return None
+    avg = sum(means) / len(means)
+    return math.sqrt(sum((x - avg) ** 2 for x in means) / (len(means) - 1))
+
+
+def get_comparison(logs_paths, threshold, noise_factor, repeat_paths=()):
+    """Compare sets of benchmark logs to the first set, which is the baseline.
+
+    The status of a benchmark is from comparing the last set to the baseline;
+    intermediate sets show the trend. Benchmarks missing from the baseline are
+    "new", and benchmarks missing from the last set are "missing". For
+    benchmarks with a single round, the noise is estimated from the spread of
+    means in the baseline and ``repeat_paths``, which are repeated runs of the
+    baseline (see ``compare_stats``).
+    """
+    all_stats = [get_benchmark_stats(logs_path) for logs_path in logs_paths]
+    baseline_stats = all_stats[0]
+    baseline_runs = [
+        baseline_stats,
+        *(get_benchmark_stats(logs_path) for logs_path in repeat_paths),
+    ]
+    keys = set().union(*all_stats)
+    results = []
+    for algo_name, dataset, backend in sorted(keys):
+        key = (algo_name, dataset, backend)
+        baseline = baseline_stats.get(key)
+        runs = []
+        spread = get_spread(
+            [stats[key]["mean"] for stats in baseline_runs if key in stats]
+        )
+        for stats in all_stats[1:]:
+            if (candidate := stats.get(key)) is None:
+                runs.append(None)
+            elif baseline is None:
+                runs.append({**candidate, "ratio": None, "status": "new"})
+            else:
+                ratio, status = compare_stats(
+                    baseline, candidate, threshold, noise_factor, spread
+                )
+                runs.append({**candidate, "ratio": ratio, "status": status})
+        results.append(
+            {
+                "algo": algo_name,
+                "dataset": dataset,
+                "backend": backend,
+                "baseline": baseline,
+                "runs": runs,
+                "status": "missing" if runs[-1] is None else runs[-1]["status"],
+            }
+        )
+    return {
+        "logs": [str(logs_path) for logs_path in logs_paths],
+        "baseline_repeats": [str(logs_path) for logs_path in repeat_paths],
+        "threshold": threshold,
+        "noise_factor": noise_factor,
+        "regressions": sum(result["status"] == "regression" for result in results),
+        "improvements": sum(result["status"] == "improvement" for result in results),
+        "inconclusive": sum(result["status"] == "inconclusive" for result in results),
+        "results": results,
+    }
+
+
+def print_comparison_report(comparison):
+    status_colors = {
+        "regression": "#f4a6a6",
+        "improvement": "#a6e3a6",
+        "new": "#a6c8f4",
+        "missing": "#f4dca6",
+        "inconclusive": "#e0e0e0",
+    }
+    print(html_head)
+    print(
+        f"""    <h3>{comparison["regressions"]} regressions and
+    {comparison["improvements"]} improvements ({comparison["inconclusive"]}
+    inconclusive) compared to
+    {html.escape(comparison["logs"][0])}</h3>
+    <table>
+    <thead>
+    <tr>
+        <th>Algorithm</th>
+        <th>Dataset</th>
+        <th>Backend</th>
+        <th>Baseline</th>"""
+    )
+    for logs_path in comparison["logs"][1:]:
+        print(f"        <th>{html.escape(logs_path)}</th>")
+    print(
+        """        <th>Status</th>
+    </tr>
+    </thead>
+    <tbody>"""
+    )
+    for result in comparison["results"]:
+        color = status_colors.get(result["status"])
+        style = f' style="background-color: {color}"' if color else ""
+        print(f"   <tr{style}>")
+        print(f"      <td>{html.escape(result['algo'])}</td>")
+        print(f"      <td>{html.escape(result['dataset'])}</td>")
+        print(f"      <td>{html.escape(result['backend'])}</td>")
+        if (baseline := result["baseline"]) is None:
+            print("      <td></td>")
+        else:
+            print(f"      <td>{get_formatted_time_value(baseline['mean'])}</td>")
+        for run in result["runs"]:
+            if run is None:
+                print("      <td></td>")
+            elif run["ratio"] is None:
+                print(f"      <td>{get_formatted_time_value(run['mean'])}</td>")
+            else:
+                print(
+                    f"      <td>{get_formatted_time_value(run['mean'])}"
+                    f"<br>{run['ratio']:.3f}X</td>"
+                )
+        print(f"      <td>{result['status']}</td>")
+        print("   </tr>")
+    print(
+        f"""
+    </tbody>\n</table>
+    <div class="footer-main">
+        <div class="box1">
+            <h4>Table Format:</h4>
+            <ul>
+                <li><strong>Mean time</strong></li>
+                <li><strong>Time relative to baseline (higher is slower)</strong></li>
+            </ul>
+            <p>Changes are significant if they are more than
+            {comparison["threshold"]:.1%} and {comparison["noise_factor"]}
+            standard errors. Changes of benchmarks with a single round are
+            inconclusive unless there are repeated runs of the baseline to
+            estimate the noise from.</p>
+        </div>"""
+    )
+    get_system_info()
+    print("""</div>\n</div>\n</html>""")
+
+
 def get_mem_info():
     return round(psutil.virtual_memory().total / (1024**3), 2)
 
@@ -141,14 +457,81 @@ def get_system_info():
 
 
 if __name__ == "__main__":
-    logs_dir = pathlib.Path("logs")
+    parser = argparse.ArgumentParser(
+        description=(
+            "Print an HTML summary of benchmark results in the 'logs' directory, "
+            "or compare sets of results to a baseline with --compare."
+        )
+    )
+    parser.add_argument(
+        "--compare",
+        nargs="+",
+        metavar="LOGS",
+        help=(
+            "directories or files of --benchmark-json logs to compare; the first "
+            "is the baseline (unless --baseline is given) and the last is "
+            "compared to it for regressions"
+        ),
+    )
+    parser.add_argument(
+        "--baseline",
+        nargs="+",
+        metavar="LOGS",
+        help=(
+            "repeated runs of the baseline for --compare; the first is the "
+            "baseline, and all are used to estimate the noise of benchmarks "
+            "with a single round"
+        ),
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help="relative change in mean time to be significant (default: 0.05)",
+    )
+    parser.add_argument(
+        "--noise-factor",
+        type=float,
+        default=2.0,
+        help=(
+            "number of standard errors a change in mean time must exceed to be "
+            "significant; single rounds need two or more --baseline LOGS to "
+            "estimate errors (default: 2.0)"
+        ),
+    )
+    parser.add_argument(
+        "--json",
+        dest="json_path",
+        type=pathlib.Path,
+        help="also write the comparison to this JSON file",
+    )
+    args = parser.parse_args()
+
+    if args.baseline is not None and args.compare is None:
+        parser.error("--baseline requires --compare")
+    if args.compare is not None:
+        if args.baseline is not None:
+            logs_paths = [args.baseline[0], *args.compare]
+            repeat_paths = args.baseline[1:]
+        else:
+            logs_paths = args.compare
+            repeat_paths = []
+        if len(logs_paths) < 2:
+            parser.error("--compare needs a baseline and at least one other LOGS")
+        comparison = get_comparison(
+            logs_paths, args.threshold, args.noise_factor, repeat_paths
+        )
+        if args.json_path is not None:
+            with open(args.json_path, "w") as file:
+                json.dump(comparison, file, indent=2)
+        print_comparison_report(comparison)
+        # Non-zero exit status to fail pipelines on significant regressions
+        sys.exit(1 if comparison["regressions"] else 0)
 
-    dataset_patt = re.compile(r".*ds=([\w-]+).*")
-    backend_patt = re.compile(r".*backend=(\w+).*")
-    k_patt = re.compile(".*k=(10*).*")
+    logs_dir = pathlib.Path("logs")
 
     # Organize all benchmark runs by the following hierarchy: algo -> backend -> dataset
-    benchmarks = get_all_benchmark_info()
+    benchmarks = get_all_benchmark_info(logs_dir)
 
     # dump HTML table
     ordered_datasets = [
@@ -167,52 +550,9 @@ if __name__ == "__main__":
         "soc-livejournal1": ["4,847,571", "68,993,773", "Yes"],
     }
 
+    print(html_head)
     print(
-        """
-    <html>
-    <head>
-    <style>
-        table {
-            table-layout: fixed;
-            width: 100%;
-            border-collapse: collapse;
-        }
-        tbody tr:nth-child(odd) {
-            background-color: #ffffff;
-        }
-        tbody tr:nth-child(even) {
-            background-color: #d3d3d3;
-        }
-        tbody td {
-            text-align: center;
-            color: black;
-        }
-        th,
-        td {
-            padding: 12px;
-        }
-        .footer-main {
-            background-color: #d1d1d1;
-            padding: 20px;
-            padding-top: 0px;
-            font-size: 12px;
-            color: black;
-            width: 100%;
-            display: flex;
-        }
-        .box1{
-            flex: 1;
-            padding-right: 30px;
-        }
-        .box2{
-            flex: 4;
-        }
-        .indent {
-            text-indent: 20px;
-        }
-    </style>
-    </head>
-    <table>
+        """    <table>
     <thead>
     <tr>
         <th>Dataset<br>Nodes<br>Edges<Br>Directed</th>"""
@@ -264,8 +604,11 @@ if __name__ == "__main__":
         print("   </tr>")
     print(
         """
-    </tbody>\n</table>
-    <div class="footer-main">
+    </tbody>\n</table>"""
+    )
+    print_phase_table(get_all_phase_info(logs_dir), ordered_datasets)
+    print(
+        """    <div class="footer-main">
         <div class="box1">
             <h4>Table Format:</h4>
             <ul>
@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 
 """
@@ -6,17 +6,31 @@ Checks if a particular dataset has been downloaded inside the datasets dir
 (RAPIDS_DATASET_ROOT_DIR). If not, the file will be downloaded using the
 datasets API.
 
+Synthetic datasets (e.g. 'rmat-20', 'road-1000x1000') are generated and cached
+instead; see `synthetic_datasets.py`.
+
 Positional Arguments:
-    1) dataset name (e.g. 'email_Eu_core', 'cit-patents')
+    1) dataset name (e.g. 'email_Eu_core', 'cit-patents', 'rmat-20')
        available datasets can be found here:
         - `python/cugraph/cugraph/datasets/__init__.py`
 """
 
 import sys
 
-import cugraph.datasets as cgds
+from synthetic_datasets import SyntheticDataset
 
 if __name__ == "__main__":
+    try:
+        synthetic_dataset = SyntheticDataset.from_name(sys.argv[1])
+    except ValueError:
+        pass
+    else:
+        # generate and store dataset without network access
+        synthetic_dataset.get_path()
+        sys.exit()
+
+    import cugraph.datasets as cgds
+
     # download and store dataset (csv) by using the Datasets API
     dataset = sys.argv[1].replace("-", "_")
     dataset_obj = getattr(cgds, dataset)
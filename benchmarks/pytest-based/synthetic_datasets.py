@@ -0,0 +1,295 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION.
+# SPDX-License-Identifier: Apache-2.0
+"""Deterministic synthetic graphs to benchmark with instead of downloaded datasets.
+
+Graphs are generated from a seed with NumPy and cached on disk as ``.npz`` edge
+lists in ``NX_CUGRAPH_BENCHMARK_DATASETS_DIR`` (default is
+``~/.cache/nx-cugraph/benchmarks``), so they don't need network access.
+
+Generators:
+
+- ``rmat``: R-MAT (Kronecker) directed graphs with ``2**scale`` nodes and
+  ``edge_factor * 2**scale`` edges before removing duplicates, like Graph500.
+- ``ba``: Barabási-Albert preferential attachment undirected graphs.
+- ``grid``: 2-d grid undirected graphs.
+- ``road``: road-like undirected graphs: 2-d grids with some edges removed and
+  some diagonal shortcuts added, and edge weights as lengths.
+
+Datasets may be created by name such as ``"rmat-20"``, ``"ba-1000000-8"``,
+``"grid-1000x1000"``, or ``"road-2000x2000"``; see ``SyntheticDataset.from_name``.
+"""
+import os
+import re
+import sys
+import zipfile
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
+
+__all__ = ["SyntheticDataset", "generate_edges"]
+
+DEFAULT_SEED = 42
+
+
+def _rmat_edges(rng, scale, edge_factor=16, a=0.57, b=0.19, c=0.19):
+    num_edges = edge_factor * 2**scale
+    src = np.zeros(num_edges, dtype=np.int64)
+    dst = np.zeros(num_edges, dtype=np.int64)
+    for bit in range(scale):
+        r = rng.random(num_edges)
+        # Quadrants: a (0, 0), b (0, 1), c (1, 0), and d (1, 1)
+        src_bit = r >= a + b
+        dst_bit = (r >= a) & (r < a + b) | (r >= a + b + c)
+        src |= src_bit.astype(np.int64) << bit
+        dst |= dst_bit.astype(np.int64) << bit
+    # Permute node ids so that high-degree nodes aren't clustered at low ids
+    perm = rng.permutation(2**scale)
+    return 2**scale, perm[src], perm[dst]
+
+
+def _ba_edges(rng, n, m):
+    # Nodes appear in `repeated` once per incident edge, so sampling from it is
+    # proportional to degree. Begin with a star from node `m` to nodes `0..m-1`.
+    if not 1 <= m < n:
+        raise ValueError(f"Barabási-Albert graphs need 1 <= m < n; got {m=}, {n=}")
+    num_edges = m * (n - m)
+    src = np.repeat(np.arange(m, n), m)
+    dst = np.empty(num_edges, dtype=np.int64)
+    repeated = np.empty(2 * num_edges, dtype=np.int64)
+    dst[:m] = np.arange(m)
+    repeated[:m] = np.arange(m)
+    repeated[m : 2 * m] = m
+    size = 2 * m
+    for i, node in enumerate(range(m + 1, n), 1):
+        targets = repeated[rng.integers(size, size=m)]
+        dst[i * m : (i + 1) * m] = targets
+        repeated[size : size + m] = targets
+        repeated[size + m : size + 2 * m] = node
+        size += 2 * m
+    return n, src, dst
+
+
+def _grid_edges(rows, cols):
+    ids = np.arange(rows * cols).reshape(rows, cols)
+    src = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])
+    dst = np.concatenate([ids[:, 1:].ravel(), ids[1:, :].ravel()])
+    return rows * cols, src, dst
+
+
+def _road_edges(rng, rows, cols, keep=0.8, shortcuts=0.05):
+    N, src, dst = _grid_edges(rows, cols)
+    mask = rng.random(src.size) < keep
+    src = src[mask]
+    dst = dst[mask]
+    ids = np.arange(N).reshape(rows, cols)
+    diag_src = ids[:-1, :-1].ravel()
+    mask = rng.random(diag_src.size) < shortcuts
+    src = np.concatenate([src, diag_src[mask]])
+    dst = np.concatenate([dst, ids[1:, 1:].ravel()[mask]])
+    return N, src, dst
+
+
+def generate_edges(kind, *, seed=DEFAULT_SEED, **params):
+    """Return ``(N, src, dst, weight)`` NumPy arrays of a synthetic graph.
+
+    Edges have no duplicates or self-loops. Undirected graphs have each edge once
+    with ``src < dst``. Weights are random in ``[1, 10)`` except for "road"
+    graphs, where they are the distances between perturbed grid coordinates.
+    """
+    rng = np.random.default_rng(seed)
+    if kind == "rmat":
+        N, src, dst = _rmat_edges(rng, **params)
+    elif kind == "ba":
+        N, src, dst = _ba_edges(rng, **params)
+    elif kind == "grid":
+        N, src, dst = _grid_edges(**params)
+    elif kind == "road":
+        N, src, dst = _road_edges(rng, **params)
+    else:
+        raise ValueError(f'kind must be "rmat", "ba", "grid", or "road"; got {kind!r}')
+    if kind != "rmat":
+        src, dst = np.minimum(src, dst), np.maximum(src, dst)
+    mask = src != dst
+    edges = np.unique(np.stack([src[mask], dst[mask]]), axis=1)
+    src, dst = edges
+    if kind == "road":
+        cols = params["cols"]
+        coords = np.stack(np.divmod(np.arange(N), cols), axis=1).astype(np.float64)
+        coords += rng.uniform(-0.25, 0.25, size=coords.shape)
+        weight = np.hypot(*(coords[src] - coords[dst]).T)
+    else:
+        weight = rng.uniform(1, 10, size=src.size)
+    index_dtype = np.int32 if N < 2**31 else np.int64
+    return N, src.astype(index_dtype), dst.astype(index_dtype), weight
+
+
+class SyntheticDataset:
+    """A seeded synthetic graph that is generated once and cached on disk.
+
+    This provides ``metadata`` and ``get_path()`` like ``cugraph.datasets``
+    objects, so it can be used as a benchmark dataset parameter. The column types
+    in ``metadata`` are read from the cached file, so getting them may generate
+    the graph.
+
+    Parameters
+    ----------
+    kind : {"rmat", "ba", "grid", "road"}
+    seed : int, optional
+    **params
+        Parameters of the generator, such as ``scale`` and ``edge_factor`` for
+        "rmat", ``n`` and ``m`` for "ba", and ``rows`` and ``cols`` for "grid"
+        and "road".
+    """
+
+    _directed_kinds = {"rmat"}
+
+    def __init__(self, kind, *, seed=DEFAULT_SEED, **params):
+        self.kind = kind
+        self.seed = seed
+        self.params = params
+        self.name = self._get_name(kind, seed, params)
+        self.is_directed = kind in self._directed_kinds
+        self._col_types = None
+
+    @property
+    def metadata(self):
+        col_names = ["src", "dst", "weight"]
+        if self._col_types is None:
+            # Index dtypes depend on the number of nodes, so read them from the
+            # headers of the arrays without loading the arrays.
+            col_types = []
+            with zipfile.ZipFile(self.get_path()) as zf:
+                for name in col_names:
+                    with zf.open(f"{name}.npy") as f:
+                        version = np.lib.format.read_magic(f)
+                        if version == (1, 0):
+                            header = np.lib.format.read_array_header_1_0(f)
+                        else:
+                            header = np.lib.format.read_array_header_2_0(f)
+                    col_types.append(str(header[2]))
+            self._col_types = col_types
+        return {
+            "name": self.name,
+            "is_directed": self.is_directed,
+            "col_names": col_names,
+            "col_types": list(self._col_types),
+        }
+
+    @staticmethod
+    def _get_name(kind, seed, params):
+        params = dict(params)
+        if kind == "rmat" and "scale" in params:
+            name = f"rmat-{params.pop('scale')}"
+            if "edge_factor" in params:
+                name += f"-{params.pop('edge_factor')}"
+        elif kind == "ba" and {"n", "m"} <= params.keys():
+            name = f"ba-{params.pop('n')}-{params.pop('m')}"
+        elif kind in {"grid", "road"} and {"rows", "cols"} <= params.keys():
+            name = f"{kind}-{params.pop('rows')}x{params.pop('cols')}"
+        else:
+            name = kind
+        # Other parameters and the seed are included so cached files are unique
+        name += "".join(f"-{key}{val}" for key, val in sorted(params.items()))
+        if seed != DEFAULT_SEED:
+            name += f"-seed{seed}"
+        return name
+
+    @classmethod
+    def from_name(cls, name, *, seed=DEFAULT_SEED):
+        """Create from a short name such as "rmat-20", "ba-10000-4", or "grid-100x200".
+
+        "rmat-<scale>[-<edge_factor>]", "ba-<n>-<m>", "grid-<rows>x<cols>", and
+        "road-<rows>x<cols>" are understood.
+        """
+        if match := re.fullmatch(r"rmat-(\d+)(?:-(\d+))?", name):
+            scale, edge_factor = match.groups()
+            params = {"scale": int(scale)}
+            if edge_factor is not None:
+                params["edge_factor"] = int(edge_factor)
+            return cls("rmat", seed=seed, **params)
+        if match := re.fullmatch(r"ba-(\d+)-(\d+)", name):
+            n, m = map(int, match.groups())
+            return cls("ba", seed=seed, n=n, m=m)
+        if match := re.fullmatch(r"(grid|road)-(\d+)x(\d+)", name):
+            kind, rows, cols = match.groups()
+            return cls(kind, seed=seed, rows=int(rows), cols=int(cols))
+        raise ValueError(f"Unknown synthetic dataset name: {name!r}")
+
+    def __str__(self):
+        return self.name
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name!r})"
+
+    def get_path(self):
+        """Return the path of the cached edge list, generating it if necessary."""
+        root = os.environ.get("NX_CUGRAPH_BENCHMARK_DATASETS_DIR")
+        root = (
+            Path(root) if root else Path.home() / ".cache" / "nx-cugraph" / "benchmarks"
+        )
+        path = root / f"{self.name}.npz"
+        if not path.exists():
+            N, src, dst, weight = generate_edges(
+                self.kind, seed=self.seed, **self.params
+            )
+            root.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so partial files are never used
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp.npz")
+            np.savez(tmp_path, N=N, src=src, dst=dst, weight=weight)
+            tmp_path.replace(path)
+        return path
+
+    def get_edges(self):
+        """Return ``(N, src, dst, weight)`` NumPy arrays."""
+        with np.load(self.get_path()) as data:
+            return int(data["N"]), data["src"], data["dst"], data["weight"]
+
+    def get_graph(self, create_using=None):
+        """Return a NetworkX graph with "weight" edge attributes.
+
+        The default graph type is ``nx.DiGraph`` for directed datasets and
+        ``nx.Graph`` otherwise.
+        """
+        if create_using is None:
+            create_using = nx.DiGraph if self.is_directed else nx.Graph
+        N, src, dst, weight = self.get_edges()
+        G = nx.empty_graph(N, create_using=create_using)
+        G.add_weighted_edges_from(zip(src.tolist(), dst.tolist(), weight.tolist()))
+        return G
+
+    def get_cudagraph(self, *, use_compat_graph=False):
+        """Return an nx-cugraph graph with "weight" edge attributes built on the GPU.
+
+        This is a ``CudaDiGraph`` for directed datasets and a ``CudaGraph``
+        otherwise, or an ``nx_cugraph.DiGraph`` or ``nx_cugraph.Graph`` if
+        ``use_compat_graph`` is True. The NetworkX graph is never created.
+        """
+        import cupy as cp
+
+        import nx_cugraph as nxcg
+
+        N, src, dst, weight = self.get_edges()
+        if self.is_directed:
+            return nxcg.CudaDiGraph.from_coo(
+                N,
+                cp.asarray(src),
+                cp.asarray(dst),
+                edge_values={"weight": cp.asarray(weight)},
+                use_compat_graph=use_compat_graph,
+            )
+        # Undirected graphs have edges in both directions
+        return nxcg.CudaGraph.from_coo(
+            N,
+            cp.asarray(np.concatenate([src, dst])),
+            cp.asarray(np.concatenate([dst, src])),
+            edge_values={"weight": cp.asarray(np.concatenate([weight, weight]))},
+            use_compat_graph=use_compat_graph,
+        )
+
+
+if __name__ == "__main__":
+    # Generate and cache datasets by name, e.g. `python synthetic_datasets.py rmat-20`
+    for name in sys.argv[1:]:
+        dataset = SyntheticDataset.from_name(name)
+        print(f"{dataset}: {dataset.get_path()}")
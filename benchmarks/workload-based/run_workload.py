@@ -0,0 +1,344 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION.
+# SPDX-License-Identifier: Apache-2.0
+"""Replay a service-like workload of many algorithm calls on a pool of graphs.
+
+Unlike ``bench_algos.py``, which times one call of one algorithm on one graph,
+this issues requests from a scenario file concurrently from a thread pool, so
+cache thrashing, contention, and dispatch overhead show up in the results.
+
+Scenarios are YAML (requires PyYAML) or JSON files such as::
+
+    name: service-mix
+    seed: 42
+    backend: cugraph        # or null to dispatch by graph type
+    graph_type: nx-cugraph  # or "networkx"
+    concurrency: 8          # number of threads
+    arrival_rate: 50        # requests per second; null to send back-to-back
+    requests: 1000          # number of measured requests
+    warmup_requests: 50     # requests before measuring
+    cache_budget: null      # nx.config.backends.cugraph.cache_budget in bytes
+    graphs:                 # pool of graphs: synthetic datasets by name
+      - {name: rmat-16, copies: 4, weight: 3}
+      - {name: road-300x300, copies: 2, weight: 1}
+    algorithms:             # mix of NetworkX functions
+      - {name: pagerank, weight: 5}
+      - {name: bfs_edges, weight: 2, random_node: [source]}
+      - {name: betweenness_centrality, weight: 1, kwargs: {k: 10}}
+
+Requests arrive as a Poisson process at ``arrival_rate``, and latency includes
+time spent waiting for a free thread. Each request picks a graph from the pool
+and an algorithm from the mix by weight. Results that are iterators are consumed.
+
+Usage::
+
+    python run_workload.py scenarios/service-mix.yaml --json results.json
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
+
+import nx_cugraph as nxcg
+
+# Synthetic datasets are shared with the pytest-based benchmarks
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "pytest-based"))
+from synthetic_datasets import SyntheticDataset  # isort: skip
+
+scenario_defaults = {
+    "name": None,
+    "seed": 42,
+    "backend": "cugraph",
+    "graph_type": "nx-cugraph",
+    "concurrency": 1,
+    "arrival_rate": None,
+    "requests": 100,
+    "warmup_requests": 0,
+    "cache_budget": None,
+}
+
+
+def load_scenario(path):
+    """Return the scenario in a YAML or JSON file with defaults filled in."""
+    path = Path(path)
+    text = path.read_text()
+    if path.suffix in {".yaml", ".yml"}:
+        try:
+            import yaml
+        except ModuleNotFoundError as exc:
+            raise ModuleNotFoundError(
+                "PyYAML is required to read YAML scenarios; use JSON instead or "
+                "install it with `pip install pyyaml`"
+            ) from exc
+        scenario = yaml.safe_load(text)
+    else:
+        scenario = json.loads(text)
+    scenario = {**scenario_defaults, **scenario}
+    if scenario["name"] is None:
+        scenario["name"] = path.stem
+    if not scenario.get("graphs") or not scenario.get("algorithms"):
+        raise ValueError(f"Scenario {path} must have 'graphs' and 'algorithms'")
+    if scenario["graph_type"] not in {"nx-cugraph", "networkx"}:
+        raise ValueError(
+            'graph_type must be "nx-cugraph" or "networkx"; '
+            f"got {scenario['graph_type']!r}"
+        )
+    return scenario
+
+
+def make_graph_pool(scenario):
+    """Return ``[(name, graph, weight)]`` with ``copies`` distinct graphs per entry.
+
+    Copies are separate graph objects, so each has its own conversion cache.
+    """
+    pool = []
+    for spec in scenario["graphs"]:
+        G = SyntheticDataset.from_name(spec["name"]).get_graph()
+        for _ in range(spec.get("copies", 1)):
+            if scenario["graph_type"] == "nx-cugraph":
+                graph = nxcg.from_networkx(
+                    G, preserve_all_attrs=True, use_compat_graph=True
+                )
+            else:
+                graph = G.copy()
+            pool.append((spec["name"], graph, spec.get("weight", 1)))
+    return pool
+
+
+def make_requests(scenario, pool, nodes):
+    """Return the list of ``(graph_index, algorithm_spec, kwargs)`` to issue."""
+    rng = random.Random(scenario["seed"])
+    algorithms = scenario["algorithms"]
+    num_requests = scenario["warmup_requests"] + scenario["requests"]
+    graph_indices = rng.choices(
+        range(len(pool)), weights=[weight for *_, weight in pool], k=num_requests
+    )
+    algos = rng.choices(
+        algorithms,
+        weights=[spec.get("weight", 1) for spec in algorithms],
+        k=num_requests,
+    )
+    requests = []
+    for graph_index, spec in zip(graph_indices, algos):
+        kwargs = dict(spec.get("kwargs", {}))
+        for key in spec.get("random_node", []):
+            kwargs[key] = rng.choice(nodes[graph_index])
+        requests.append((graph_index, spec, kwargs))
+    return requests
+
+
+def get_arrival_times(scenario, num_requests):
+    """Return seconds from the start at which to issue each request, or None.
+
+    Requests arrive as a Poisson process, or all at once (and are issued as
+    threads become free) if there is no ``arrival_rate``.
+    """
+    if not scenario["arrival_rate"]:
+        return None
+    rng = np.random.default_rng(scenario["seed"])
+    return np.cumsum(rng.exponential(1 / scenario["arrival_rate"], num_requests))
+
+
+def run_request(func, G, backend, kwargs):
+    if backend is not None:
+        kwargs = {**kwargs, "backend": backend}
+    result = func(G, **kwargs)
+    if isinstance(result, Iterator):
+        # Include deferred compute and conversions
+        result = list(result)
+    return result
+
+
+def run_scenario(scenario):
+    """Run the scenario and return a dict of results (see ``summarize``)."""
+    config = {}
+    if scenario["cache_budget"] is not None:
+        config["cache_budget"] = scenario["cache_budget"]
+    # The cache budget also applies to graphs converted when creating the pool
+    with nx.config.backends.cugraph(**config):
+        pool = make_graph_pool(scenario)
+        nodes = [list(graph) for _, graph, _ in pool]
+        return run_requests(scenario, pool, make_requests(scenario, pool, nodes))
+
+
+def run_requests(scenario, pool, requests):
+    num_warmup = scenario["warmup_requests"]
+    arrivals = get_arrival_times(scenario, len(requests) - num_warmup)
+    backend = scenario["backend"]
+    records = [None] * len(requests)
+
+    def task(i, scheduled):
+        graph_index, spec, kwargs = requests[i]
+        start = time.perf_counter()
+        error = None
+        try:
+            run_request(
+                getattr(nx, spec["name"]), pool[graph_index][1], backend, kwargs
+            )
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+        end = time.perf_counter()
+        records[i] = {
+            "graph": pool[graph_index][0],
+            "algorithm": spec["name"],
+            # Latency of open-loop requests includes waiting for a free thread
+            "latency": end - (start if scheduled is None else scheduled),
+            "end": end,
+            "error": error,
+        }
+
+    with ThreadPoolExecutor(max_workers=scenario["concurrency"]) as executor:
+        # Warmup requests are issued back-to-back before measuring
+        for future in [executor.submit(task, i, None) for i in range(num_warmup)]:
+            future.result()
+        cache_before = nxcg.cache_info()
+        origin = time.perf_counter()
+        futures = []
+        for i in range(num_warmup, len(requests)):
+            scheduled = None
+            if arrivals is not None:
+                scheduled = origin + arrivals[i - num_warmup]
+                if (delay := scheduled - time.perf_counter()) > 0:
+                    time.sleep(delay)
+            futures.append(executor.submit(task, i, scheduled))
+        for future in futures:
+            future.result()
+    cache_after = nxcg.cache_info()
+    return summarize(scenario, records[num_warmup:], origin, cache_before, cache_after)
+
+
+def get_latency_stats(latencies):
+    latencies = np.asarray(latencies)
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99]).tolist()
+    return {
+        "count": latencies.size,
+        "mean": latencies.mean().item(),
+        "p50": p50,
+        "p90": p90,
+        "p99": p99,
+        "max": latencies.max().item(),
+    }
+
+
+def summarize(scenario, records, origin, cache_before, cache_after):
+    """Return throughput, latency percentiles, errors, and cache statistics.
+
+    Latencies are in seconds. Cache statistics are the changes while measuring
+    in the conversion caches of nx-cugraph graphs (see ``nxcg.cache_info``);
+    conversions cached by NetworkX for NetworkX graphs aren't counted.
+    """
+    ok = [record for record in records if record["error"] is None]
+    elapsed = max(record["end"] for record in records) - origin
+    by_algorithm = {}
+    for record in ok:
+        by_algorithm.setdefault(record["algorithm"], []).append(record["latency"])
+    errors = {}
+    for record in records:
+        if record["error"] is not None:
+            key = f"{record['algorithm']}: {record['error']}"
+            errors[key] = errors.get(key, 0) + 1
+    cache = {
+        key: cache_after[key] - cache_before[key]
+        for key in ["hits", "misses", "evictions", "spills"]
+    }
+    lookups = cache["hits"] + cache["misses"]
+    cache["hit_rate"] = cache["hits"] / lookups if lookups else None
+    cache["nbytes"] = cache_after["nbytes"]
+    cache["budget"] = cache_after["budget"]
+    return {
+        "scenario": scenario,
+        "requests": len(records),
+        "completed": len(ok),
+        "errors": errors,
+        "seconds": elapsed,
+        "throughput": len(ok) / elapsed,
+        "latency": (
+            get_latency_stats([record["latency"] for record in ok]) if ok else None
+        ),
+        "algorithms": {
+            name: get_latency_stats(latencies)
+            for name, latencies in sorted(by_algorithm.items())
+        },
+        "cache": cache,
+    }
+
+
+def format_seconds(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f}ms"
+    return f"{seconds:.2f}s"
+
+
+def print_summary(results):
+    scenario = results["scenario"]
+    arrival_rate = scenario["arrival_rate"]
+    print(
+        f"Scenario {scenario['name']!r}: {results['requests']} requests with "
+        f"concurrency {scenario['concurrency']}, "
+        + (f"{arrival_rate} requests/s" if arrival_rate else "back-to-back")
+    )
+    print(
+        f"Throughput: {results['throughput']:.2f} requests/s "
+        f"({results['completed']} completed in {results['seconds']:.2f}s)"
+    )
+    rows = [("all", results["latency"]), *results["algorithms"].items()]
+    print(f"{'Latency':<32}{'count':>8}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}")
+    for name, stats in rows:
+        if stats is None:
+            continue
+        print(
+            f"  {name:<30}{stats['count']:>8}"
+            + "".join(
+                f"{format_seconds(stats[key]):>10}"
+                for key in ["p50", "p90", "p99", "max"]
+            )
+        )
+    cache = results["cache"]
+    hit_rate = "n/a" if cache["hit_rate"] is None else f"{cache['hit_rate']:.1%}"
+    print(
+        f"Cache: {hit_rate} hit rate ({cache['hits']} hits, {cache['misses']} "
+        f"misses), {cache['evictions']} evictions, {cache['spills']} spills, "
+        f"{cache['nbytes']} bytes cached (budget: {cache['budget']})"
+    )
+    for error, count in results["errors"].items():
+        print(f"Error ({count}x): {error}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Replay a workload scenario of concurrent algorithm calls."
+    )
+    parser.add_argument("scenario", type=Path, help="YAML or JSON scenario file")
+    parser.add_argument("--concurrency", type=int, help="override the scenario")
+    parser.add_argument("--arrival-rate", type=float, help="override the scenario")
+    parser.add_argument("--requests", type=int, help="override the scenario")
+    parser.add_argument(
+        "--json",
+        dest="json_path",
+        type=Path,
+        help="also write the results to this JSON file",
+    )
+    args = parser.parse_args(argv)
+    scenario = load_scenario(args.scenario)
+    for key in ["concurrency", "arrival_rate", "requests"]:
+        if (val := getattr(args, key)) is not None:
+            scenario[key] = val
+    results = run_scenario(scenario)
+    print_summary(results)
+    if args.json_path is not None:
+        with args.json_path.open("w") as f:
+            json.dump(results, f, indent=2)
+    # Non-zero exit status if any request failed
+    return 1 if results["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
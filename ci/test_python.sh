@@ -1,5 +1,5 @@
 #!/bin/bash
-# SPDX-FileCopyrightText: Copyright (c) 2022-2025, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2022-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 
 set -euo pipefail
@@ -50,6 +50,9 @@ rapids-logger "pytest nx-cugraph"
   --cov-report=xml:"${RAPIDS_COVERAGE_DIR}/nx-cugraph-coverage.xml" \
   --cov-report=term
 
+rapids-logger "host-side benchmarks (NumPy standing in for CuPy)"
+python -m pytest benchmarks/host-based -m small --benchmark-disable
+
 rapids-logger "pytest networkx using nx-cugraph backend"
 
 pushd nx_cugraph
@@ -85,6 +88,7 @@ python -m nx_cugraph.tests.ensure_algos_covered
 # Exercise (and show results of) scripts that show implemented networkx algorithms
 python -m nx_cugraph.scripts.print_tree --dispatch-name --plc --incomplete --different
 python -m nx_cugraph.scripts.print_table
+python -m nx_cugraph.scripts profile_startup --top 20
 popd
 
 rapids-logger "Test script exiting with value: $EXITCODE"
@@ -1,5 +1,8 @@
-# SPDX-FileCopyrightText: Copyright (c) 2023-2025, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
+from importlib import import_module as _import_module
+from threading import RLock as _RLock
+
 from networkx.exception import *
 
 from _nx_cugraph._version import __git_commit__, __version__
@@ -7,36 +10,268 @@ from _nx_cugraph import _check_networkx_version
 
 _nxver: tuple[int, int] | tuple[int, int, int] = _check_networkx_version()
 
-from . import utils
-
-from . import classes
-from .classes import *
-
-from . import convert
-from .convert import *
+# Submodules are imported lazily (on first attribute access) so that importing
+# nx_cugraph, such as when NetworkX loads the backend, does not import CuPy or run
+# the `networkx_algorithm` decorators. Names from `from <submodule> import *` of
+# these submodules are available here: each name imports only its submodule (see
+# `_lazy_attrs`), and `_load_all` imports everything (also for dir() and import *).
+_star_submodules = (
+    "classes",
+    "convert",
+    "convert_matrix",
+    "renumber",
+    "readwrite",
+    "relabel",
+    "generators",
+    "algorithms",
+    "linalg",
+    "drawing",
+    "profiling",
+    "cache",
+)
+_submodules = {"interface", "scripts", "utils", *_star_submodules}
+# Submodule that defines each name star-imported from it, so that first access of
+# a name only imports the submodule that implements it. Entries between BEGIN and
+# END are automatically generated by `make plugin-info`.
+_lazy_attrs = {
+    # BEGIN: lazy_attrs
+    "CudaDiGraph": "classes",
+    "CudaGraph": "classes",
+    "CudaMultiDiGraph": "classes",
+    "CudaMultiGraph": "classes",
+    "DiGraph": "classes",
+    "Graph": "classes",
+    "MultiDiGraph": "classes",
+    "MultiGraph": "classes",
+    "NodeRenumberer": "renumber",
+    "ProfileReport": "profiling",
+    "adjacency_matrix": "linalg",
+    "all_pairs_bellman_ford_path": "algorithms",
+    "all_pairs_bellman_ford_path_length": "algorithms",
+    "all_pairs_dijkstra": "algorithms",
+    "all_pairs_dijkstra_path": "algorithms",
+    "all_pairs_dijkstra_path_length": "algorithms",
+    "all_pairs_shortest_path": "algorithms",
+    "all_pairs_shortest_path_length": "algorithms",
+    "ancestors": "algorithms",
+    "average_clustering": "algorithms",
+    "barbell_graph": "generators",
+    "bellman_ford_path": "algorithms",
+    "bellman_ford_path_length": "algorithms",
+    "betweenness": "algorithms",
+    "betweenness_centrality": "algorithms",
+    "bfs_edges": "algorithms",
+    "bfs_layers": "algorithms",
+    "bfs_predecessors": "algorithms",
+    "bfs_successors": "algorithms",
+    "bfs_tree": "algorithms",
+    "bidirectional_shortest_path": "algorithms",
+    "bipartite": "algorithms",
+    "breadth_first_search": "algorithms",
+    "bull_graph": "generators",
+    "cache_clear": "cache",
+    "cache_info": "cache",
+    "caveman_graph": "generators",
+    "centrality": "algorithms",
+    "chvatal_graph": "generators",
+    "circular_ladder_graph": "generators",
+    "classic": "generators",
+    "cluster": "algorithms",
+    "clustering": "algorithms",
+    "community": "algorithms",
+    "complement": "algorithms",
+    "complete_bipartite_graph": "algorithms",
+    "complete_graph": "generators",
+    "complete_multipartite_graph": "generators",
+    "components": "algorithms",
+    "connected": "algorithms",
+    "connected_components": "algorithms",
+    "convert_node_labels_to_integers": "relabel",
+    "core": "algorithms",
+    "core_number": "algorithms",
+    "cubical_graph": "generators",
+    "cycle_graph": "generators",
+    "dag": "algorithms",
+    "davis_southern_women_graph": "generators",
+    "degree_alg": "algorithms",
+    "degree_centrality": "algorithms",
+    "desargues_graph": "generators",
+    "descendants": "algorithms",
+    "descendants_at_distance": "algorithms",
+    "diamond_graph": "generators",
+    "digraph": "classes",
+    "dijkstra_path": "algorithms",
+    "dijkstra_path_length": "algorithms",
+    "dodecahedral_graph": "generators",
+    "edge_betweenness_centrality": "algorithms",
+    "ego": "generators",
+    "ego_graph": "generators",
+    "eigenvector": "algorithms",
+    "eigenvector_centrality": "algorithms",
+    "empty_graph": "generators",
+    "florentine_families_graph": "generators",
+    "forceatlas2_layout": "drawing",
+    "from_arrow_edgelist": "readwrite",
+    "from_dict_of_lists": "convert",
+    "from_edgelist_arrays": "convert_matrix",
+    "from_networkx": "convert",
+    "from_pandas_edgelist": "convert_matrix",
+    "from_scipy_sparse_array": "convert_matrix",
+    "frucht_graph": "generators",
+    "function": "classes",
+    "generic": "algorithms",
+    "generic_bfs_edges": "algorithms",
+    "graph": "classes",
+    "graphmatrix": "linalg",
+    "has_path": "algorithms",
+    "heawood_graph": "generators",
+    "hits": "algorithms",
+    "hits_alg": "algorithms",
+    "house_graph": "generators",
+    "house_x_graph": "generators",
+    "icosahedral_graph": "generators",
+    "in_degree_centrality": "algorithms",
+    "is_arborescence": "algorithms",
+    "is_branching": "algorithms",
+    "is_connected": "algorithms",
+    "is_forest": "algorithms",
+    "is_isolate": "algorithms",
+    "is_negatively_weighted": "classes",
+    "is_strongly_connected": "algorithms",
+    "is_tree": "algorithms",
+    "is_weakly_connected": "algorithms",
+    "isolate": "algorithms",
+    "isolates": "algorithms",
+    "jaccard_coefficient": "algorithms",
+    "k_truss": "algorithms",
+    "karate_club_graph": "generators",
+    "katz": "algorithms",
+    "katz_centrality": "algorithms",
+    "krackhardt_kite_graph": "generators",
+    "ladder_graph": "generators",
+    "layout": "drawing",
+    "les_miserables_graph": "generators",
+    "link_analysis": "algorithms",
+    "link_prediction": "algorithms",
+    "lollipop_graph": "generators",
+    "lowest_common_ancestor": "algorithms",
+    "lowest_common_ancestors": "algorithms",
+    "moebius_kantor_graph": "generators",
+    "multidigraph": "classes",
+    "multigraph": "classes",
+    "node_connected_component": "algorithms",
+    "null_graph": "generators",
+    "number_connected_components": "algorithms",
+    "number_of_isolates": "algorithms",
+    "number_of_selfloops": "classes",
+    "number_strongly_connected_components": "algorithms",
+    "number_weakly_connected_components": "algorithms",
+    "octahedral_graph": "generators",
+    "operators": "algorithms",
+    "out_degree_centrality": "algorithms",
+    "overall_reciprocity": "algorithms",
+    "pagerank": "algorithms",
+    "pagerank_alg": "algorithms",
+    "pappus_graph": "generators",
+    "path_graph": "generators",
+    "petersen_graph": "generators",
+    "profile": "profiling",
+    "read_edgelist_files": "readwrite",
+    "read_parquet_edgelist": "readwrite",
+    "reciprocity": "algorithms",
+    "relabel_nodes": "relabel",
+    "reportviews": "classes",
+    "reverse": "algorithms",
+    "sedgewick_maze_graph": "generators",
+    "shortest_path": "algorithms",
+    "shortest_path_length": "algorithms",
+    "shortest_paths": "algorithms",
+    "single_source_bellman_ford": "algorithms",
+    "single_source_bellman_ford_path": "algorithms",
+    "single_source_bellman_ford_path_length": "algorithms",
+    "single_source_dijkstra": "algorithms",
+    "single_source_dijkstra_path": "algorithms",
+    "single_source_dijkstra_path_length": "algorithms",
+    "single_source_shortest_path": "algorithms",
+    "single_source_shortest_path_length": "algorithms",
+    "single_target_shortest_path": "algorithms",
+    "single_target_shortest_path_length": "algorithms",
+    "small": "generators",
+    "social": "generators",
+    "star_graph": "generators",
+    "strongly_connected": "algorithms",
+    "strongly_connected_components": "algorithms",
+    "tadpole_graph": "generators",
+    "tetrahedral_graph": "generators",
+    "to_arrow": "convert_matrix",
+    "to_dict_of_lists": "convert",
+    "to_networkx": "convert",
+    "to_numpy_array": "convert_matrix",
+    "to_pandas_edgelist": "convert_matrix",
+    "to_scipy_sparse_array": "convert_matrix",
+    "tournament": "algorithms",
+    "transitivity": "algorithms",
+    "traversal": "algorithms",
+    "tree": "algorithms",
+    "triangles": "algorithms",
+    "trivial_graph": "generators",
+    "truncated_cube_graph": "generators",
+    "truncated_tetrahedron_graph": "generators",
+    "turan_graph": "generators",
+    "tutte_graph": "generators",
+    "unary": "algorithms",
+    "unweighted": "algorithms",
+    "weakly_connected": "algorithms",
+    "weakly_connected_components": "algorithms",
+    "weighted": "algorithms",
+    "wheel_graph": "generators",
+    # END: lazy_attrs
+}
+_load_lock = _RLock()
+_load_state = {"is_loading": False, "is_loaded": False}
 
-from . import convert_matrix
-from .convert_matrix import *
 
-from . import relabel
-from .relabel import *
+def _load_all():
+    """Import all submodules, which registers all algorithms with the backend."""
+    with _load_lock:
+        if _load_state["is_loaded"] or _load_state["is_loading"]:
+            # Already loaded, or this is a recursive call while loading
+            return
+        _load_state["is_loading"] = True
+        try:
+            g = globals()
+            _import_module(".utils", __name__)
+            for modname in _star_submodules:
+                module = _import_module(f".{modname}", __name__)
+                names = getattr(module, "__all__", None)
+                if names is None:
+                    names = [key for key in vars(module) if not key.startswith("_")]
+                g.update((key, getattr(module, key)) for key in names)
 
-from . import generators
-from .generators import *
+            from .interface import BackendInterface
 
-from . import algorithms
-from .algorithms import *
+            BackendInterface.Graph = g["Graph"]
+            BackendInterface.DiGraph = g["DiGraph"]
+            BackendInterface.MultiGraph = g["MultiGraph"]
+            BackendInterface.MultiDiGraph = g["MultiDiGraph"]
+            _load_state["is_loaded"] = True
+        finally:
+            _load_state["is_loading"] = False
 
-from . import linalg
-from .linalg import *
 
-from . import drawing
-from .drawing import *
+def __getattr__(name):
+    if name in _submodules:
+        return _import_module(f".{name}", __name__)
+    if name == "__all__":
+        # For `from nx_cugraph import *`
+        _load_all()
+        return [key for key in globals() if not key.startswith("_")]
+    if (modname := _lazy_attrs.get(name)) is not None:
+        val = globals()[name] = getattr(_import_module(f".{modname}", __name__), name)
+        return val
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from .interface import BackendInterface
 
-BackendInterface.Graph = classes.Graph
-BackendInterface.DiGraph = classes.DiGraph
-BackendInterface.MultiGraph = classes.MultiGraph
-BackendInterface.MultiDiGraph = classes.MultiDiGraph
-del BackendInterface
+def __dir__():
+    _load_all()
+    return sorted(globals().keys() | _submodules)
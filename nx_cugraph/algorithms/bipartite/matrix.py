@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2023-2025, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 import cupy as cp
 import networkx as nx
@@ -6,6 +6,7 @@ import numpy as np
 
 from nx_cugraph import _nxver
 from nx_cugraph.convert import _to_graph
+from nx_cugraph.convert_matrix import _coo_to_scipy_sparse
 from nx_cugraph.generators._utils import _create_using_class
 from nx_cugraph.utils import index_dtype, networkx_algorithm
 
@@ -30,8 +31,6 @@ else:
 def biadjacency_matrix(
     G, row_order, column_order=None, dtype=None, weight="weight", format="csr"
 ):
-    import scipy as sp
-
     G = _to_graph(G, weight, 1, dtype)
 
     nrows = len(row_order)
@@ -69,26 +68,17 @@ def biadjacency_matrix(
             src_indices = dst_indices = edge_array = ()
         else:
             dst_indices = dst_indices[mask]
-
-            src_indices = cp.asnumpy(src_indices)
-            dst_indices = cp.asnumpy(dst_indices)
-            if weight in G.edge_values:
-                edge_array = G.edge_values[weight]
-                if weight in G.edge_masks:
-                    edge_array = cp.where(G.edge_masks[weight], edge_array, 1)
-                edge_array = edge_array[mask]
-                edge_array = cp.asnumpy(edge_array)
-            else:
-                edge_array = np.repeat(1, src_indices.size)
-
-    # PERF: convert to desired sparse format on GPU before copying to CPU
-    A = sp.sparse.coo_array(
-        (edge_array, (src_indices, dst_indices)), shape=(nrows, ncols), dtype=dtype
+            edge_array = G._subgraph_weights(mask, weight, 1)
+
+    return _coo_to_scipy_sparse(
+        nrows,
+        ncols,
+        src_indices,
+        dst_indices,
+        edge_array,
+        dtype=dtype,
+        format=format,
     )
-    try:
-        return A.asformat(format)
-    except ValueError as exc:
-        raise nx.NetworkXError(f"Unknown sparse matrix format: {format}") from exc
 
 
 @networkx_algorithm(
@@ -1,14 +1,13 @@
-# SPDX-FileCopyrightText: Copyright (c) 2023-2024, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
 import cupy as cp
-import numpy as np
 
 from nx_cugraph.convert import _to_graph
-from nx_cugraph.utils import index_dtype, networkx_algorithm
+from nx_cugraph.utils import networkx_algorithm
 
 if TYPE_CHECKING:  # pragma: no cover
     from nx_cugraph.typing import IndexValue
@@ -36,13 +35,8 @@ def _mark_isolates(G, symmetrize=None) -> cp.ndarray[bool]:
     """Return a boolean mask array indicating indices of isolated nodes."""
     mark_isolates = cp.ones(len(G), bool)
     if G.is_directed() and symmetrize == "intersection":
-        N = G._N
-        # Upcast to int64 so indices don't overflow
-        src_dst = N * G.src_indices.astype(np.int64) + G.dst_indices
-        src_dst_T = G.src_indices + N * G.dst_indices.astype(np.int64)
-        src_dst_new = cp.intersect1d(src_dst, src_dst_T)
-        new_indices = cp.floor_divide(src_dst_new, N, dtype=index_dtype)
-        mark_isolates[new_indices] = False
+        src_indices, _ = G._get_symmetrized_indices("intersection")
+        mark_isolates[src_indices] = False
     else:
         mark_isolates[G.src_indices] = False
         if G.is_directed():
@@ -59,10 +53,12 @@ def _isolates(G, symmetrize=None) -> cp.ndarray[IndexValue]:
 @networkx_algorithm(version_added="23.10")
 def isolates(G):
     G = _to_graph(G)
+    if G._num_isolates() == 0:
+        return iter([])
     return G._nodeiter_to_iter(iter(_isolates(G).tolist()))
 
 
 @networkx_algorithm(version_added="23.10")
 def number_of_isolates(G):
     G = _to_graph(G)
-    return int(cp.count_nonzero(_mark_isolates(G)))
+    return G._num_isolates()
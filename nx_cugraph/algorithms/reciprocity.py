@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2023-2024, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 import cupy as cp
 import networkx as nx
@@ -43,22 +43,10 @@ def reciprocity(G, nodes=None):
         num_selfloops = (src_indices == dst_indices).sum().tolist()
         return (recip_indices.size - num_selfloops) / edges_a_b.size
 
-    # Don't include self-loops
-    mask = G.src_indices != G.dst_indices
-    src_indices = G.src_indices[mask]
-    dst_indices = G.dst_indices[mask]
-    # Create two lists of edges, one for each direction, and find the matching
-    # IDs in each list (see description above).
-    edges_a_b = N * src_indices.astype(np.int64) + dst_indices
-    edges_b_a = src_indices + N * dst_indices.astype(np.int64)
-    recip_indices = cp.intersect1d(
-        edges_a_b,
-        edges_b_a,
-        # assume_unique=True,  # cupy <= 12.2.0 also assumes sorted
-    )
-    numer = cp.bincount(recip_indices // N, minlength=N)
-    denom = cp.bincount(src_indices, minlength=N)
-    denom += cp.bincount(dst_indices, minlength=N)
+    # Reciprocal edges and degrees are cached on the graph; don't include self-loops
+    src_indices, dst_indices = G._get_symmetrized_indices("intersection")
+    numer = cp.bincount(src_indices[src_indices != dst_indices], minlength=N)
+    denom = G._degrees_array(ignore_selfloops=True)
     recip = 2 * numer / denom
     node_ids = G._nodekeys_to_nodearray(nodes)
     return G._nodearrays_to_dict(node_ids, recip[node_ids])
@@ -70,14 +58,6 @@ def overall_reciprocity(G):
     G = _to_directed_graph(G)
     if G.number_of_edges() == 0:
         raise nx.NetworkXError("Not defined for empty graphs")
-    # Create two lists of edges, one for each direction, and find the matching
-    # IDs in each list (see description in reciprocity()).
-    edges_a_b = G._N * G.src_indices.astype(np.int64) + G.dst_indices
-    edges_b_a = G.src_indices + G._N * G.dst_indices.astype(np.int64)
-    recip_indices = cp.intersect1d(
-        edges_a_b,
-        edges_b_a,
-        # assume_unique=True,  # cupy <= 12.2.0 also assumes sorted
-    )
-    num_selfloops = (G.src_indices == G.dst_indices).sum().tolist()
-    return (recip_indices.size - num_selfloops) / edges_a_b.size
+    # Reciprocal edges (including self-loops) are cached on the graph
+    num_recip = G._get_symmetrized_indices("intersection")[0].size
+    return (num_recip - G._num_selfloops()) / G.src_indices.size
@@ -0,0 +1,264 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION.
+# SPDX-License-Identifier: Apache-2.0
+"""Inspect, clear, and bound graphs converted to the GPU that are cached on graphs.
+
+Conversions are cached in ``G.__networkx_cache__["backends"]["cugraph"]`` as
+``{cache_key: CudaGraph}``, where cache keys describe which edge and node
+attributes were converted. Hits and misses of lookups done by nx-cugraph (such as
+when using ``nx_cugraph.Graph``) are counted here, per graph and process-wide.
+
+Cached graphs are tracked with weak references so that the total size of all
+caches can be kept below ``nx.config.backends.cugraph.cache_budget`` bytes by
+evicting the least recently used graphs. The default budget is read from the
+``NX_CUGRAPH_CACHE_BUDGET`` environment variable, which is a number of bytes with
+an optional unit such as ``"500MB"`` or ``"2GiB"``.
+"""
+import threading
+import time
+import weakref
+
+import networkx as nx
+
+import nx_cugraph as nxcg
+from nx_cugraph import _nxver
+
+from .profiling import _count
+
+__all__ = ["cache_clear", "cache_info"]
+
+_lock = threading.Lock()
+_evict_lock = threading.RLock()
+_totals = {"hits": 0, "misses": 0, "evictions": 0, "spills": 0}
+# Statistics of input graphs and of cached CudaGraphs; weak so they don't leak.
+# Entries know their input graph (by weakref) and cache key so they can be evicted.
+_graph_stats = weakref.WeakKeyDictionary()  # {G: {"hits": int, "misses": int}}
+_entry_stats = weakref.WeakKeyDictionary()  # {CudaGraph: {"hits": int, ...}}
+
+
+def _get_cache_budget():
+    """Return the maximum total bytes of cached graphs, or None if unbounded."""
+    if _nxver < (3, 3):
+        return None
+    return nx.config.backends.cugraph.cache_budget
+
+
+def _get_cache(G):
+    """Return the nx-cugraph conversion cache of ``G``, or None if it has none."""
+    if (nx_cache := getattr(G, "__networkx_cache__", None)) is None:
+        return None
+    return nx_cache.get("backends", {}).get("cugraph")
+
+
+def _new_graph_stats():
+    return {"hits": 0, "misses": 0}
+
+
+def _new_entry_stats(G, key):
+    now = time.time()
+    return {
+        "hits": 0,
+        "created": now,
+        "last_used": now,
+        "graph": weakref.ref(G),
+        "key": key,
+    }
+
+
+def _record_hit(G, key, Gcg):
+    """Count a lookup in the cache of ``G`` that found ``Gcg`` under ``key``."""
+    with _lock:
+        _totals["hits"] += 1
+        _graph_stats.setdefault(G, _new_graph_stats())["hits"] += 1
+        stats = _entry_stats.get(Gcg)
+        if stats is None or stats["graph"]() is not G:
+            stats = _entry_stats[Gcg] = _new_entry_stats(G, key)
+            stats["created"] = None  # Added to the cache elsewhere
+        stats["hits"] += 1
+        stats["last_used"] = time.time()
+    _count(cache_hits=1)
+
+
+def _record_miss(G):
+    """Count a lookup in the cache of ``G`` that found nothing compatible."""
+    with _lock:
+        _totals["misses"] += 1
+        _graph_stats.setdefault(G, _new_graph_stats())["misses"] += 1
+    _count(cache_misses=1)
+
+
+def _record_set(G, key, Gcg):
+    """Track ``Gcg`` that was just added to the cache of ``G`` and enforce budget."""
+    with _lock:
+        _graph_stats.setdefault(G, _new_graph_stats())
+        _entry_stats[Gcg] = _new_entry_stats(G, key)
+    _enforce_budget(protect=Gcg)
+
+
+def _cached_entries():
+    """Return ``[(G, key, Gcg, stats)]`` of tracked graphs that are still cached.
+
+    Entries that are no longer cached (for example, because the input graph
+    was mutated) are no longer tracked.
+    """
+    with _lock:
+        items = list(_entry_stats.items())
+    rv = []
+    for Gcg, stats in items:
+        G = stats["graph"]()
+        cache = _get_cache(G) if G is not None else None
+        if cache is not None and cache.get(stats["key"]) is Gcg:
+            rv.append((G, stats["key"], Gcg, stats))
+        else:
+            with _lock:
+                if _entry_stats.get(Gcg) is stats:
+                    del _entry_stats[Gcg]
+    return rv
+
+
+def _enforce_budget(*, protect=None):
+    """Evict least recently used cached graphs to be within ``cache_budget``.
+
+    Entries that are not the canonical (full) conversion of an ``nx_cugraph.Graph``
+    are evicted first. Canonical entries of graphs that are only on the GPU are
+    copied to host before they are evicted. ``protect`` is never evicted.
+    """
+    if (budget := _get_cache_budget()) is None:
+        return
+    with _evict_lock:
+        entries = [(*entry, entry[2]._nbytes()) for entry in _cached_entries()]
+        total = sum(entry[-1] for entry in entries)
+        if total <= budget:
+            return
+        canonical_key = nxcg.classes.graph._CACHE_KEY
+        entries.sort(
+            key=lambda entry: (entry[1] == canonical_key, entry[3]["last_used"] or 0)
+        )
+        for G, key, Gcg, _, nbytes in entries:
+            if total <= budget:
+                break
+            if Gcg is protect:
+                continue
+            if key == canonical_key and isinstance(G, nxcg.Graph) and not G._is_on_cpu:
+                G._reify_networkx()
+                with _lock:
+                    _totals["spills"] += 1
+            if (cache := _get_cache(G)) is None or cache.pop(key, None) is None:
+                continue
+            total -= nbytes
+            with _lock:
+                _totals["evictions"] += 1
+                _entry_stats.pop(Gcg, None)
+
+
+def _entry_info(key, Gcg):
+    with _lock:
+        stats = dict(_entry_stats.get(Gcg, {}))
+    return {
+        "key": key,
+        "canonical": key == nxcg.classes.graph._CACHE_KEY,
+        "nbytes": Gcg._nbytes(),
+        "hits": stats.get("hits", 0),
+        "created": stats.get("created"),
+        "last_used": stats.get("last_used"),
+    }
+
+
+def cache_info(G=None):
+    """Return statistics of graphs converted to the GPU and cached on ``G``.
+
+    Parameters
+    ----------
+    G : graph, optional
+        NetworkX or nx-cugraph graph. If not given, return process-wide totals.
+
+    Returns
+    -------
+    dict
+        For a graph, "hits" and "misses" of cache lookups, total "nbytes" of
+        device arrays, and "entries", which is a list of dicts with keys "key"
+        (the cache key), "canonical" (whether this is the full conversion of an
+        ``nx_cugraph.Graph``), "nbytes", "hits", and "created" and "last_used"
+        (from ``time.time``, or None if unknown).
+
+        Without a graph, "hits" and "misses" of all lookups, the number of
+        "graphs", "entries", and "nbytes" of tracked graphs that are still
+        cached, the "budget" in bytes (or None), and the number of "evictions"
+        and "spills" (copies to host of graphs only on the GPU) to stay within it.
+
+    Examples
+    --------
+    >>> G = nxcg.Graph(nx.path_graph(5))  # doctest: +SKIP
+    >>> nx.pagerank(G)  # doctest: +SKIP
+    >>> nxcg.cache_info(G)["entries"][0]["nbytes"]  # doctest: +SKIP
+    112
+    """
+    if G is None:
+        entries = _cached_entries()
+        with _lock:
+            rv = dict(_totals)
+            rv["graphs"] = len(_graph_stats)
+        rv["entries"] = len(entries)
+        rv["nbytes"] = sum(Gcg._nbytes() for _, _, Gcg, _ in entries)
+        rv["budget"] = _get_cache_budget()
+        return rv
+    with _lock:
+        rv = dict(_graph_stats.get(G, _new_graph_stats()))
+    cache = _get_cache(G) or {}
+    rv["entries"] = [
+        _entry_info(key, Gcg)
+        for key, Gcg in list(cache.items())
+        if isinstance(Gcg, nxcg.CudaGraph)
+    ]
+    rv["nbytes"] = sum(entry["nbytes"] for entry in rv["entries"])
+    return rv
+
+
+def cache_clear(G, *, keep=None):
+    """Remove graphs converted to the GPU from the cache of ``G``.
+
+    Unlike ``G.__networkx_cache__.clear()``, this never copies an
+    ``nx_cugraph.Graph`` to host. Hence, the canonical (full) conversion of an
+    ``nx_cugraph.Graph`` is always kept if the graph is only on the GPU.
+
+    Parameters
+    ----------
+    G : graph
+        NetworkX or nx-cugraph graph.
+    keep : "canonical", callable, or container of cache keys, optional
+        Which entries to keep: the canonical entry, entries for which
+        ``keep(key)`` is True, or entries whose keys are in ``keep``.
+        By default, remove all entries that can be removed.
+
+    Returns
+    -------
+    list
+        The cache keys of the removed entries.
+    """
+    canonical_key = nxcg.classes.graph._CACHE_KEY
+    if keep is None:
+        keep_func = None
+    elif isinstance(keep, str):
+        if keep != "canonical":
+            raise ValueError(f'keep must be "canonical" if it is a string; got {keep}')
+        keep_func = canonical_key.__eq__
+    elif callable(keep):
+        keep_func = keep
+    else:
+        keep_func = keep.__contains__
+    if not (cache := _get_cache(G)):
+        return []
+    must_keep = isinstance(G, nxcg.Graph) and not G._is_on_cpu
+    removed = []
+    for key in list(cache):
+        if keep_func is not None and keep_func(key):
+            continue
+        if must_keep and key == canonical_key:
+            continue
+        Gcg = cache.pop(key, None)
+        if Gcg is None:
+            continue
+        removed.append(key)
+        if isinstance(Gcg, nxcg.CudaGraph):
+            with _lock:
+                _entry_stats.pop(Gcg, None)
+    return removed
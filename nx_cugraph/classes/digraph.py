@@ -15,8 +15,16 @@ from networkx.classes.digraph import (
 
 import nx_cugraph as nxcg
 
-from ..utils import index_dtype, networkx_algorithm
+from ..utils import networkx_algorithm
 from .graph import CudaGraph, Graph, _GraphCache
+from .reportviews import (
+    AdjacencyView,
+    DiDegreeView,
+    EdgeView,
+    InDegreeView,
+    InEdgeView,
+    OutDegreeView,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from nx_cugraph.typing import AttrKey
@@ -127,6 +135,16 @@ class DiGraph(nx.DiGraph, Graph):
             cudagraph.clear_edges()
             self._set_cudagraph(cudagraph, clear_cpu=False)
 
+    adj = gpu_cpu_api("adj", edge_data=True)
+    succ = gpu_cpu_api("succ", edge_data=True)
+    pred = gpu_cpu_api("pred", edge_data=True)
+    degree = gpu_cpu_api("degree", edge_data=True)
+    in_degree = gpu_cpu_api("in_degree", edge_data=True)
+    out_degree = gpu_cpu_api("out_degree", edge_data=True)
+    edges = gpu_cpu_api("edges", edge_data=True)
+    in_edges = gpu_cpu_api("in_edges", edge_data=True)
+    out_edges = gpu_cpu_api("out_edges", edge_data=True)
+    nodes = gpu_cpu_api("nodes", node_data=True)
     get_edge_data = gpu_cpu_api("get_edge_data", edge_data=True)
     has_edge = gpu_cpu_api("has_edge")
     neighbors = gpu_cpu_api("neighbors")
@@ -162,6 +180,41 @@ class CudaDiGraph(CudaGraph):
     # NetworkX graph methods #
     ##########################
 
+    @property
+    @networkx_api
+    def degree(self) -> DiDegreeView:
+        return DiDegreeView(self)
+
+    @property
+    @networkx_api
+    def in_edges(self) -> InEdgeView:
+        return InEdgeView(self)
+
+    @property
+    @networkx_api
+    def out_edges(self) -> EdgeView:
+        return EdgeView(self)
+
+    @property
+    @networkx_api
+    def pred(self) -> AdjacencyView:
+        return AdjacencyView(self, reverse=True)
+
+    @property
+    @networkx_api
+    def succ(self) -> AdjacencyView:
+        return AdjacencyView(self)
+
+    @property
+    @networkx_api
+    def in_degree(self) -> InDegreeView:
+        return InDegreeView(self)
+
+    @property
+    @networkx_api
+    def out_degree(self) -> OutDegreeView:
+        return OutDegreeView(self)
+
     @networkx_api
     def reverse(self, copy: bool = True) -> CudaDiGraph:
         return self._copy(not copy, self.__class__, reverse=True)
@@ -169,15 +222,14 @@ class CudaDiGraph(CudaGraph):
     @networkx_api
     def to_undirected(self, reciprocal=False, as_view=False):
         N = self._N
-        # Upcast to int64 so indices don't overflow
-        src_dst_indices_old = N * self.src_indices.astype(np.int64) + self.dst_indices
         if reciprocal:
-            src_dst_indices_new = cp.intersect1d(
-                src_dst_indices_old,
-                self.src_indices + N * self.dst_indices.astype(np.int64),
-                # assume_unique=True,  # cupy <= 12.2.0 also assumes sorted
-            )
+            src_indices, dst_indices = self._get_symmetrized_indices("intersection")
             if self.edge_values:
+                # Upcast to int64 so indices don't overflow
+                src_dst_indices_old = (
+                    N * self.src_indices.astype(np.int64) + self.dst_indices
+                )
+                src_dst_indices_new = N * src_indices.astype(np.int64) + dst_indices
                 sorter = cp.argsort(src_dst_indices_old)
                 idx = cp.searchsorted(
                     src_dst_indices_old, src_dst_indices_new, sorter=sorter
@@ -191,40 +243,32 @@ class CudaDiGraph(CudaGraph):
                 edge_masks = {
                     key: val[indices].copy() for key, val in self.edge_masks.items()
                 }
-            else:
-                src_indices, dst_indices = cp.divmod(src_dst_indices_new, N)
-                src_indices = src_indices.astype(index_dtype)
-                dst_indices = dst_indices.astype(index_dtype)
-        else:
+        elif self.edge_values:
+            # Upcast to int64 so indices don't overflow
+            src_dst_indices_old = (
+                N * self.src_indices.astype(np.int64) + self.dst_indices
+            )
             src_dst_indices_old_T = self.src_indices + N * self.dst_indices.astype(
                 np.int64
             )
-            if self.edge_values:
-                src_dst_extra = cp.setdiff1d(
-                    src_dst_indices_old_T, src_dst_indices_old, assume_unique=True
-                )
-                sorter = cp.argsort(src_dst_indices_old_T)
-                idx = cp.searchsorted(
-                    src_dst_indices_old_T, src_dst_extra, sorter=sorter
-                )
-                indices = sorter[idx]
-                src_indices = cp.hstack((self.src_indices, self.dst_indices[indices]))
-                dst_indices = cp.hstack((self.dst_indices, self.src_indices[indices]))
-                edge_values = {
-                    key: cp.hstack((val, val[indices]))
-                    for key, val in self.edge_values.items()
-                }
-                edge_masks = {
-                    key: cp.hstack((val, val[indices]))
-                    for key, val in self.edge_masks.items()
-                }
-            else:
-                src_dst_indices_new = cp.union1d(
-                    src_dst_indices_old, src_dst_indices_old_T
-                )
-                src_indices, dst_indices = cp.divmod(src_dst_indices_new, N)
-                src_indices = src_indices.astype(index_dtype)
-                dst_indices = dst_indices.astype(index_dtype)
+            src_dst_extra = cp.setdiff1d(
+                src_dst_indices_old_T, src_dst_indices_old, assume_unique=True
+            )
+            sorter = cp.argsort(src_dst_indices_old_T)
+            idx = cp.searchsorted(src_dst_indices_old_T, src_dst_extra, sorter=sorter)
+            indices = sorter[idx]
+            src_indices = cp.hstack((self.src_indices, self.dst_indices[indices]))
+            dst_indices = cp.hstack((self.dst_indices, self.src_indices[indices]))
+            edge_values = {
+                key: cp.hstack((val, val[indices]))
+                for key, val in self.edge_values.items()
+            }
+            edge_masks = {
+                key: cp.hstack((val, val[indices]))
+                for key, val in self.edge_masks.items()
+            }
+        else:
+            src_indices, dst_indices = self._get_symmetrized_indices("union")
 
         if self.edge_values:
             recip_indices = cp.lexsort(cp.vstack((src_indices, dst_indices)))
@@ -246,6 +290,11 @@ class CudaDiGraph(CudaGraph):
         else:
             edge_values = {}
             edge_masks = {}
+            symmetrized_indices = (src_indices, dst_indices)
+            if not as_view:
+                # Don't share the cached arrays with the new graph
+                src_indices = src_indices.copy()
+                dst_indices = dst_indices.copy()
 
         node_values = self.node_values
         node_masks = self.node_masks
@@ -274,6 +323,13 @@ class CudaDiGraph(CudaGraph):
             rv.graph = self.graph
         else:
             rv.graph.update(deepcopy(self.graph))
+        if not self.edge_values:
+            # The new graph is symmetric, sorted, and has no duplicate edges, so
+            # it is its own union and intersection with its reverse edges.
+            rv._symmetrized_indices["union"] = symmetrized_indices
+            rv._symmetrized_indices["intersection"] = symmetrized_indices
+            rv._is_sorted_by_src = True
+            rv._structure_cache["has_duplicates"] = False
         return rv
 
     successors = CudaGraph.neighbors  # Alias
@@ -284,22 +340,40 @@ class CudaDiGraph(CudaGraph):
     ###################
 
     def _in_degrees_array(self, *, ignore_selfloops=False):
+        """Return the in-degree of each node; this is cached, so don't modify it."""
+        if ignore_selfloops and not self._has_selfloops():
+            ignore_selfloops = False
+        key = ("in_degrees", ignore_selfloops)
+        if (degrees := self._structure_cache.get(key)) is not None:
+            return degrees
         dst_indices = self.dst_indices
         if ignore_selfloops:
             not_selfloops = self.src_indices != dst_indices
             dst_indices = dst_indices[not_selfloops]
         if dst_indices.size == 0:
-            return cp.zeros(self._N, dtype=np.int64)
-        return cp.bincount(dst_indices, minlength=self._N)
+            degrees = cp.zeros(self._N, dtype=np.int64)
+        else:
+            degrees = cp.bincount(dst_indices, minlength=self._N)
+        self._structure_cache[key] = degrees
+        return degrees
 
     def _out_degrees_array(self, *, ignore_selfloops=False):
+        """Return the out-degree of each node; this is cached, so don't modify it."""
+        if ignore_selfloops and not self._has_selfloops():
+            ignore_selfloops = False
+        key = ("out_degrees", ignore_selfloops)
+        if (degrees := self._structure_cache.get(key)) is not None:
+            return degrees
         src_indices = self.src_indices
         if ignore_selfloops:
             not_selfloops = src_indices != self.dst_indices
             src_indices = src_indices[not_selfloops]
         if src_indices.size == 0:
-            return cp.zeros(self._N, dtype=np.int64)
-        return cp.bincount(src_indices, minlength=self._N)
+            degrees = cp.zeros(self._N, dtype=np.int64)
+        else:
+            degrees = cp.bincount(src_indices, minlength=self._N)
+        self._structure_cache[key] = degrees
+        return degrees
 
 
 # rapids-pre-commit-hooks: disable-next-line[verify-hardcoded-version]
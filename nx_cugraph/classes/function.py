@@ -1,6 +1,5 @@
-# SPDX-FileCopyrightText: Copyright (c) 2023-2024, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
-import cupy as cp
 import networkx as nx
 
 from nx_cugraph.convert import _to_graph
@@ -31,8 +30,7 @@ def is_negatively_weighted(G, edge=None, weight="weight"):
 @networkx_algorithm(version_added="23.12")
 def number_of_selfloops(G):
     G = _to_graph(G)
-    is_selfloop = G.src_indices == G.dst_indices
-    return int(cp.count_nonzero(is_selfloop))
+    return G._num_selfloops()
 
 
 @number_of_selfloops._should_run
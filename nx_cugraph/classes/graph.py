@@ -18,7 +18,10 @@ from networkx.classes.graph import (
 import nx_cugraph as nxcg
 from nx_cugraph import _nxver
 
-from ..utils import index_dtype, networkx_algorithm
+from ..cache import _record_hit, _record_set
+from ..profiling import _traced
+from ..utils import _symmetrize_sorted_indices, index_dtype, networkx_algorithm
+from .reportviews import AdjacencyView, AtlasView, DegreeView, EdgeView, NodeView
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Iterable, Iterator
@@ -186,6 +189,7 @@ class Graph(nx.Graph):
             if isinstance(Gcg, Graph):
                 # This shouldn't happen during normal use, but be extra-careful anyway
                 return Gcg._cudagraph
+            _record_hit(self, _CACHE_KEY, Gcg)
             return Gcg
         if self.__dict__["_node"] is None:
             raise RuntimeError(
@@ -204,6 +208,7 @@ class Graph(nx.Graph):
             return None
         Gcg.graph = self.graph
         cache[_CACHE_KEY] = Gcg
+        _record_set(self, _CACHE_KEY, Gcg)
         return Gcg
 
     def _set_cudagraph(self, val, *, clear_cpu=True):
@@ -219,6 +224,7 @@ class Graph(nx.Graph):
         else:
             self.graph = val.graph
             cache[_CACHE_KEY] = val
+            _record_set(self, _CACHE_KEY, val)
             if clear_cpu:
                 for key in self._nx_attrs:
                     self.__dict__[key] = None
@@ -324,6 +330,7 @@ class Graph(nx.Graph):
         key_to_id: dict[NodeKey, IndexValue] | None = None,
         id_to_key: list[NodeKey] | None = None,
         use_compat_graph: bool | None = None,
+        reorder: str | None = None,
         **attr,
     ) -> Graph | CudaGraph:
         new_graph = object.__new__(cls.to_cudagraph_class())
@@ -338,6 +345,10 @@ class Graph(nx.Graph):
         new_graph._id_to_key = None if id_to_key is None else list(id_to_key)
         new_graph._N = op.index(N)  # Ensure N is integral
         new_graph._node_ids = None
+        new_graph._is_sorted_by_src = False
+        new_graph._is_sorted_by_dst = False
+        new_graph._structure_cache = {}
+        new_graph._symmetrized_indices = {}
         new_graph.graph = new_graph.graph_attr_dict_factory()
         new_graph.graph.update(attr)
         size = new_graph.src_indices.size
@@ -379,15 +390,8 @@ class Graph(nx.Graph):
                     f"(got {new_graph.dst_indices.dtype.name})."
                 )
             new_graph.dst_indices = dst_indices
-
-        # If the graph contains isolates, plc.SGGraph() must be passed a value
-        # for vertices_array that contains every vertex ID, since the
-        # src/dst_indices arrays will not contain IDs for isolates. Create this
-        # only if needed. Like src/dst_indices, the _node_ids array must be
-        # maintained for the lifetime of the plc.SGGraph
-        isolates = nxcg.algorithms.isolate._isolates(new_graph)
-        if len(isolates) > 0:
-            new_graph._node_ids = cp.arange(new_graph._N, dtype=index_dtype)
+        if reorder is not None:
+            new_graph._reorder_nodes(reorder)
         if use_compat_graph or use_compat_graph is None and issubclass(cls, Graph):
             new_graph = new_graph._to_compat_graph()
         return new_graph
@@ -575,6 +579,11 @@ class Graph(nx.Graph):
             cudagraph.clear_edges()
             self._set_cudagraph(cudagraph, clear_cpu=False)
 
+    # Read-only views may include data, so they need all edge or node data
+    adj = gpu_cpu_api("adj", edge_data=True)
+    degree = gpu_cpu_api("degree", edge_data=True)
+    edges = gpu_cpu_api("edges", edge_data=True)
+    nodes = gpu_cpu_api("nodes", node_data=True)
     get_edge_data = gpu_cpu_api("get_edge_data", edge_data=True)
     has_edge = gpu_cpu_api("has_edge")
     neighbors = gpu_cpu_api("neighbors")
@@ -621,6 +630,17 @@ class CudaGraph:
     _id_to_key: list[NodeKey] | None
     _N: int
     _node_ids: cp.ndarray[IndexValue] | None  # holds plc.SGGraph.vertices_array data
+    # Structural metadata used to skip redundant sorts and scans. The sorted flags
+    # are maintained by `_sort_edge_indices`. Other values such as the number of
+    # self-loops and isolates, whether there are duplicate edges, and degree arrays
+    # are computed lazily and kept in `_structure_cache` until edges are mutated.
+    _is_sorted_by_src: bool  # Whether edges are known to be sorted by (src, dst)
+    _is_sorted_by_dst: bool  # Whether edges are known to be sorted by (dst, src)
+    _structure_cache: dict[str | tuple[str, bool], bool | int | cp.ndarray]
+    # Cached results of `_get_symmetrized_indices`; cleared when edges are mutated
+    _symmetrized_indices: dict[
+        str, tuple[cp.ndarray[IndexValue], cp.ndarray[IndexValue]]
+    ]
 
     # Used by graph._get_plc_graph
     _plc_type_map: ClassVar[dict[np.dtype, np.dtype]] = {
@@ -737,6 +757,10 @@ class CudaGraph:
             return iter(self.key_to_id)
         return iter(range(self._N))
 
+    @networkx_api
+    def __getitem__(self, n: NodeKey) -> AtlasView:
+        return self.adj[n]
+
     @networkx_api
     def __len__(self) -> int:
         return self._N
@@ -769,6 +793,8 @@ class CudaGraph:
         self.dst_indices = cp.empty(0, self.dst_indices.dtype)
         self._N = 0
         self._node_ids = None
+        self._structure_cache = {}
+        self._symmetrized_indices = {}
         self.key_to_id = None
         self._id_to_key = None
         if cache := self.__networkx_cache__:
@@ -780,6 +806,8 @@ class CudaGraph:
         self.edge_masks.clear()
         self.src_indices = cp.empty(0, self.src_indices.dtype)
         self.dst_indices = cp.empty(0, self.dst_indices.dtype)
+        self._structure_cache = {}
+        self._symmetrized_indices = {}
         if cache := self.__networkx_cache__:
             cache.clear()
 
@@ -788,6 +816,26 @@ class CudaGraph:
         # Does shallow copy in networkx
         return self._copy(as_view, self.__class__)
 
+    @property
+    @networkx_api
+    def adj(self) -> AdjacencyView:
+        return AdjacencyView(self)
+
+    @property
+    @networkx_api
+    def degree(self) -> DegreeView:
+        return DegreeView(self)
+
+    @property
+    @networkx_api
+    def edges(self) -> EdgeView:
+        return EdgeView(self)
+
+    @property
+    @networkx_api
+    def nodes(self) -> NodeView:
+        return NodeView(self)
+
     @networkx_api
     def get_edge_data(
         self, u: NodeKey, v: NodeKey, default: EdgeValue | None = None
@@ -908,9 +956,9 @@ class CudaGraph:
         return rv
 
     # Not implemented...
-    # adj, adjacency, add_edge, add_edges_from, add_node,
-    # add_nodes_from, add_weighted_edges_from, degree,
-    # edge_subgraph, edges, neighbors, nodes, remove_edge,
+    # adjacency, add_edge, add_edges_from, add_node,
+    # add_nodes_from, add_weighted_edges_from,
+    # edge_subgraph, remove_edge,
     # remove_edges_from, remove_node, remove_nodes_from, subgraph, update
 
     ###################
@@ -965,8 +1013,10 @@ class CudaGraph:
         else:
             rv.graph.update(deepcopy(self.graph))
         rv.__networkx_cache__ = __networkx_cache__
+        rv._copy_structure_from(self, reverse=reverse)
         return rv
 
+    @_traced("plc_graph")
     def _get_plc_graph(
         self,
         edge_attr: AttrKey | None = None,
@@ -1044,21 +1094,16 @@ class CudaGraph:
                 raise NotImplementedError(
                     "edge_array must be None when symmetrizing the graph"
                 )
-            N = self._N
-            # Upcast to int64 so indices don't overflow
-            src_dst = N * src_indices.astype(np.int64) + dst_indices
-            src_dst_T = src_indices + N * dst_indices.astype(np.int64)
-            if symmetrize == "union":
-                src_dst_new = cp.union1d(src_dst, src_dst_T)
-            elif symmetrize == "intersection":
-                src_dst_new = cp.intersect1d(src_dst, src_dst_T)
-            else:
-                raise ValueError(
-                    f'symmetrize must be "union" or "intersection"; got "{symmetrize}"'
-                )
-            src_indices, dst_indices = cp.divmod(src_dst_new, N)
-            src_indices = src_indices.astype(index_dtype)
-            dst_indices = dst_indices.astype(index_dtype)
+            # Symmetrized indices are the same whether or not indices are switched
+            src_indices, dst_indices = self._get_symmetrized_indices(symmetrize)
+
+        # If the graph contains isolates, plc.SGGraph() must be passed a value
+        # for vertices_array that contains every vertex ID, since the
+        # src/dst_indices arrays will not contain IDs for isolates. Create this
+        # only if needed. Like src/dst_indices, the _node_ids array must be
+        # maintained for the lifetime of the plc.SGGraph
+        if self._node_ids is None and self._num_isolates() > 0:
+            self._node_ids = cp.arange(self._N, dtype=index_dtype)
 
         # This sets drop_multi_edges=True for non-multigraph input, which means
         # the data in self.src_indices and self.dst_indices may not be
@@ -1067,7 +1112,13 @@ class CudaGraph:
         # self.src_indices and self.dst_indices would be updated to have
         # duplicate edges removed for non-multigraph instances, but that
         # requires additional code which would be redundant and likely not as
-        # performant as the code in PLC.
+        # performant as the code in PLC. We skip this if we know there are no
+        # duplicate edges, such as after symmetrizing.
+        drop_multi_edges = (
+            not self.is_multigraph()
+            and symmetrize is None
+            and self._structure_cache.get("has_duplicates", True)
+        )
         return plc.SGGraph(
             resource_handle=plc.ResourceHandle(),
             graph_properties=plc.GraphProperties(
@@ -1081,11 +1132,243 @@ class CudaGraph:
             renumber=False,
             do_expensive_check=False,
             vertices_array=self._node_ids,
-            drop_multi_edges=not self.is_multigraph(),
+            drop_multi_edges=drop_multi_edges,
         )
 
+    def _has_duplicates(self) -> bool:
+        """Whether any (src, dst) edge occurs more than once; cached."""
+        if (rv := self._structure_cache.get("has_duplicates")) is not None:
+            return rv
+        src_indices = self.src_indices
+        dst_indices = self.dst_indices
+        if not (self._is_sorted_by_src or self._is_sorted_by_dst):
+            # Sort a copy so we don't reorder the edges of this graph
+            indices = cp.lexsort(cp.vstack((dst_indices, src_indices)))
+            src_indices = src_indices[indices]
+            dst_indices = dst_indices[indices]
+        rv = bool(
+            (
+                (src_indices[1:] == src_indices[:-1])
+                & (dst_indices[1:] == dst_indices[:-1])
+            ).any()
+        )
+        self._structure_cache["has_duplicates"] = rv
+        return rv
+
+    def _num_selfloops(self) -> int:
+        """Return the number of self-loops; cached."""
+        if (rv := self._structure_cache.get("num_selfloops")) is None:
+            rv = int(cp.count_nonzero(self.src_indices == self.dst_indices))
+            self._structure_cache["num_selfloops"] = rv
+        return rv
+
+    def _has_selfloops(self) -> bool:
+        return self._num_selfloops() > 0
+
+    def _num_isolates(self) -> int:
+        """Return the number of nodes without edges; cached."""
+        if (rv := self._structure_cache.get("num_isolates")) is None:
+            mark_isolates = nxcg.algorithms.isolate._mark_isolates(self)
+            rv = int(cp.count_nonzero(mark_isolates))
+            self._structure_cache["num_isolates"] = rv
+        return rv
+
+    def _copy_structure_from(self, other: CudaGraph, *, reverse: bool = False):
+        """Reuse structural metadata of ``other``, which has the same edges as self.
+
+        ``self`` may be a copy, a reversed graph, or a directed version of ``other``.
+        """
+        if reverse:
+            self._is_sorted_by_src = other._is_sorted_by_dst
+            self._is_sorted_by_dst = other._is_sorted_by_src
+        else:
+            self._is_sorted_by_src = other._is_sorted_by_src
+            self._is_sorted_by_dst = other._is_sorted_by_dst
+        for key in ["has_duplicates", "num_selfloops", "num_isolates"]:
+            if key in other._structure_cache:
+                self._structure_cache[key] = other._structure_cache[key]
+        if self.is_directed() == other.is_directed():
+            if not reverse:
+                # Cached arrays are never modified in-place, so they may be shared
+                self._structure_cache.update(
+                    (key, val)
+                    for key, val in other._structure_cache.items()
+                    if isinstance(key, tuple)
+                )
+            # Symmetrized edges are the same for copies and reversed graphs
+            self._symmetrized_indices = dict(other._symmetrized_indices)
+
+    def _permute_nodes(self, order: cp.ndarray[IndexValue], *, keep_keys: bool = True):
+        """Renumber nodes in-place so that the node with id ``order[i]`` gets id ``i``.
+
+        Edges and node data are updated with one gather each. If ``keep_keys`` is
+        True, ``key_to_id`` and ``id_to_key`` are updated so that nodes keep their
+        keys; otherwise, the new ids become the node keys.
+        """
+        N = self._N
+        order = cp.asarray(order, dtype=index_dtype)
+        if order.size != N:
+            raise ValueError(f"order must have {N} elements; got {order.size}")
+        new_ids = cp.empty(N, dtype=index_dtype)
+        new_ids[order] = cp.arange(N, dtype=index_dtype)
+        self.src_indices = new_ids[self.src_indices]
+        self.dst_indices = new_ids[self.dst_indices]
+        if self.node_values or self.node_masks:
+            # Node data may be cupy or numpy arrays
+            order_np = cp.asnumpy(order)
+            self.node_values = {
+                key: val[order if isinstance(val, cp.ndarray) else order_np]
+                for key, val in self.node_values.items()
+            }
+            self.node_masks = {
+                key: val[order if isinstance(val, cp.ndarray) else order_np]
+                for key, val in self.node_masks.items()
+            }
+        if not keep_keys:
+            self.key_to_id = None
+            self._id_to_key = None
+        else:
+            if self.key_to_id is None:
+                id_to_key = order.tolist()
+            else:
+                prev_id_to_key = self.id_to_key
+                id_to_key = [prev_id_to_key[i] for i in order.tolist()]
+            self._id_to_key = id_to_key
+            self.key_to_id = dict(zip(id_to_key, range(N)))
+        # Edges are no longer sorted, and cached arrays are indexed by old node ids
+        self._is_sorted_by_src = False
+        self._is_sorted_by_dst = False
+        self._node_ids = None
+        self._structure_cache = {
+            key: val
+            for key, val in self._structure_cache.items()
+            if key in {"has_duplicates", "num_selfloops", "num_isolates"}
+        }
+        self._symmetrized_indices = {}
+        if cache := self.__networkx_cache__:
+            cache.clear()
+
+    def _reorder_nodes(self, reorder: str):
+        """Renumber nodes in-place with a locality-friendly ordering.
+
+        ``reorder`` may be "degree" (decreasing degree, so high-degree nodes are
+        adjacent) or "rcm" (reverse Cuthill-McKee, which reduces the bandwidth of
+        the adjacency matrix). Node keys are kept, and edges are sorted by the new
+        ``(src, dst)`` ids.
+        """
+        if reorder == "degree":
+            order = cp.lexsort(cp.vstack((cp.arange(self._N), -self._degrees_array())))
+        elif reorder == "rcm":
+            order = self._rcm_ordering()
+        else:
+            raise ValueError(
+                f'reorder must be "degree", "rcm", or None; got {reorder!r}'
+            )
+        self._permute_nodes(order)
+        self._sort_edge_indices("src")
+
+    def _rcm_ordering(self) -> cp.ndarray[IndexValue]:
+        """Return node ids in reverse Cuthill-McKee order.
+
+        Each connected component (of the symmetrized graph) is traversed
+        breadth-first from an unvisited node of minimum degree. One BFS level is
+        computed at a time: new nodes are ordered by the position of the first
+        node of the previous level that reaches them, then by degree, then by id,
+        which gives the same order as the sequential algorithm.
+        """
+        N = self._N
+        src_indices, dst_indices = self._get_symmetrized_indices("union")
+        not_selfloops = src_indices != dst_indices
+        src_indices = src_indices[not_selfloops]
+        dst_indices = dst_indices[not_selfloops]
+        indptr = cp.searchsorted(src_indices, cp.arange(N + 1, dtype=index_dtype))
+        degrees = cp.diff(indptr)
+        node_ids = cp.arange(N, dtype=index_dtype)
+        # Position of each node in Cuthill-McKee order; -1 if not yet visited
+        position = cp.full(N, -1, dtype=np.int64)
+        # Isolated nodes are their own components and have minimum degree
+        isolates = cp.nonzero(degrees == 0)[0]
+        position[isolates] = cp.arange(isolates.size)
+        num_ordered = isolates.size
+        candidates = cp.lexsort(cp.vstack((node_ids, degrees)))[isolates.size :]
+        while num_ordered < N:
+            candidates = candidates[position[candidates] < 0]
+            frontier = candidates[:1]
+            position[frontier] = num_ordered
+            num_ordered += 1
+            while frontier.size > 0:
+                starts = indptr[frontier]
+                counts = indptr[frontier + 1] - starts
+                offsets = cp.cumsum(counts)
+                total = int(offsets[-1])
+                if total == 0:
+                    break
+                # Expand the neighbors of all nodes in the frontier
+                edge_ids = cp.arange(total, dtype=np.int64)
+                seg = cp.searchsorted(offsets, edge_ids, side="right")
+                neighbors = dst_indices[
+                    starts[seg] + edge_ids - (offsets - counts)[seg]
+                ]
+                parent_positions = position[frontier][seg]
+                is_new = position[neighbors] < 0
+                neighbors = neighbors[is_new]
+                if neighbors.size == 0:
+                    break
+                parent_positions = parent_positions[is_new]
+                # Keep the first parent that reaches each new node
+                indices = cp.lexsort(cp.vstack((parent_positions, neighbors)))
+                neighbors = neighbors[indices]
+                parent_positions = parent_positions[indices]
+                is_first = cp.ones(neighbors.size, dtype=bool)
+                is_first[1:] = neighbors[1:] != neighbors[:-1]
+                neighbors = neighbors[is_first]
+                parent_positions = parent_positions[is_first]
+                indices = cp.lexsort(
+                    cp.vstack((neighbors, degrees[neighbors], parent_positions))
+                )
+                frontier = neighbors[indices]
+                position[frontier] = cp.arange(num_ordered, num_ordered + frontier.size)
+                num_ordered += frontier.size
+        order = cp.empty(N, dtype=index_dtype)
+        order[position] = node_ids
+        return order[::-1]
+
+    def _get_symmetrized_indices(
+        self, symmetrize: str
+    ) -> tuple[cp.ndarray[IndexValue], cp.ndarray[IndexValue]]:
+        """Return ``(src_indices, dst_indices)`` of the symmetrized graph.
+
+        ``symmetrize`` may be "union" or "intersection" of the edges and their
+        reverse edges. The returned edges are sorted by (src, dst) and contain no
+        duplicates. The result is cached until the edges of the graph change,
+        so the returned arrays must not be modified in-place.
+        """
+        if symmetrize not in {"union", "intersection"}:
+            raise ValueError(
+                f'symmetrize must be "union" or "intersection"; got "{symmetrize}"'
+            )
+        if (rv := self._symmetrized_indices.get(symmetrize)) is not None:
+            return rv
+        src_indices = self.src_indices
+        dst_indices = self.dst_indices
+        if not self._is_sorted_by_src:
+            # Sort a copy so we don't reorder the edges of this graph
+            indices = cp.lexsort(cp.vstack((dst_indices, src_indices)))
+            src_indices = src_indices[indices]
+            dst_indices = dst_indices[indices]
+        rv = _symmetrize_sorted_indices(self._N, src_indices, dst_indices, symmetrize)
+        self._symmetrized_indices[symmetrize] = rv
+        return rv
+
     def _sort_edge_indices(self, primary="src"):
         # DRY warning: see also CudaMultiGraph._sort_edge_indices
+        if (
+            primary == "src"
+            and self._is_sorted_by_src
+            or primary == "dst"
+            and self._is_sorted_by_dst
+        ):
+            return
         if primary == "src":
             stacked = cp.vstack((self.dst_indices, self.src_indices))
         elif primary == "dst":
@@ -1095,6 +1378,8 @@ class CudaGraph:
                 f'Bad `primary` argument; expected "src" or "dst", got {primary!r}'
             )
         indices = cp.lexsort(stacked)
+        self._is_sorted_by_src = primary == "src"
+        self._is_sorted_by_dst = primary == "dst"
         if (cp.diff(indices) > 0).all():
             # Already sorted
             return
@@ -1106,6 +1391,10 @@ class CudaGraph:
         self.edge_masks.update(
             {key: val[indices] for key, val in self.edge_masks.items()}
         )
+        # Cached neighbor orders index the edges, which were reordered
+        for reverse in [False, True]:
+            self._structure_cache.pop(("neighbor_indptr", reverse), None)
+            self._structure_cache.pop(("neighbor_order", reverse), None)
 
     def _become(self, other: CudaGraph):
         if self.__class__ is not other.__class__:
@@ -1140,6 +1429,12 @@ class CudaGraph:
         return self
 
     def _degrees_array(self, *, ignore_selfloops=False):
+        """Return the degree of each node; this is cached, so don't modify it."""
+        if ignore_selfloops and not self._has_selfloops():
+            ignore_selfloops = False
+        key = ("degrees", ignore_selfloops)
+        if (degrees := self._structure_cache.get(key)) is not None:
+            return degrees
         src_indices = self.src_indices
         dst_indices = self.dst_indices
         if ignore_selfloops:
@@ -1148,15 +1443,61 @@ class CudaGraph:
             if self.is_directed():
                 dst_indices = dst_indices[not_selfloops]
         if src_indices.size == 0:
-            return cp.zeros(self._N, dtype=np.int64)
-        degrees = cp.bincount(src_indices, minlength=self._N)
-        if self.is_directed():
-            degrees += cp.bincount(dst_indices, minlength=self._N)
+            degrees = cp.zeros(self._N, dtype=np.int64)
+        else:
+            degrees = cp.bincount(src_indices, minlength=self._N)
+            if self.is_directed():
+                degrees += cp.bincount(dst_indices, minlength=self._N)
+        self._structure_cache[key] = degrees
         return degrees
 
     _in_degrees_array = _degrees_array
     _out_degrees_array = _degrees_array
 
+    def _neighbor_edges(
+        self, *, reverse: bool = False
+    ) -> tuple[cp.ndarray[IndexValue] | None, cp.ndarray[IndexValue]]:
+        """Return ``(order, indptr)`` to find the edges of each node; cached.
+
+        The edges from node ``i`` (or to node ``i`` if ``reverse``) are
+        ``order[indptr[i]:indptr[i + 1]]``, or ``indptr[i]:indptr[i + 1]`` if
+        ``order`` is None, which is when the edges are already sorted.
+        """
+        key = ("neighbor_indptr", reverse)
+        if (indptr := self._structure_cache.get(key)) is not None:
+            return self._structure_cache[("neighbor_order", reverse)], indptr
+        src_indices = self.dst_indices if reverse else self.src_indices
+        if self._is_sorted_by_dst if reverse else self._is_sorted_by_src:
+            order = None
+        else:
+            # Stable, so neighbors are in the same order as the edges
+            order = cp.argsort(src_indices, kind="stable")
+        indptr = cp.zeros(self._N + 1, dtype=np.int64)
+        if src_indices.size > 0:
+            cp.cumsum(cp.bincount(src_indices, minlength=self._N), out=indptr[1:])
+        self._structure_cache[("neighbor_order", reverse)] = order
+        self._structure_cache[key] = indptr
+        return order, indptr
+
+    def _nbytes(self) -> int:
+        """Return the number of bytes of device arrays held by this graph.
+
+        This includes edge and node data and cached structural arrays.
+        """
+        arrays = [
+            self.src_indices,
+            self.dst_indices,
+            self._node_ids,
+            *self.edge_values.values(),
+            *self.edge_masks.values(),
+            *self.node_values.values(),
+            *self.node_masks.values(),
+            *self._structure_cache.values(),
+        ]
+        for indices in self._symmetrized_indices.values():
+            arrays.extend(indices)
+        return sum(val.nbytes for val in arrays if isinstance(val, cp.ndarray))
+
     # Data conversions
     def _nodekeys_to_nodearray(self, nodes: Iterable[NodeKey]) -> cp.array[IndexValue]:
         if self.key_to_id is None:
@@ -1169,6 +1510,7 @@ class CudaGraph:
             return map(id_to_key.__getitem__, node_ids)
         return node_ids
 
+    @_traced("result", device_to_host=True)
     def _nodearray_to_list(self, node_ids: cp.ndarray[IndexValue]) -> list[NodeKey]:
         if self.key_to_id is None:
             return node_ids.tolist()
@@ -1188,11 +1530,13 @@ class CudaGraph:
                     raise KeyError(node)
         return cp.array(nodes, dtype=index_dtype)
 
+    @_traced("result", device_to_host=True)
     def _nodearray_to_set(self, node_ids: cp.ndarray[IndexValue]) -> set[NodeKey]:
         if self.key_to_id is None:
             return set(node_ids.tolist())
         return set(self._nodeiter_to_iter(node_ids.tolist()))
 
+    @_traced("result", device_to_host=True)
     def _nodearray_to_dict(
         self,
         values: cp.ndarray[NodeValue],
@@ -1206,6 +1550,7 @@ class CudaGraph:
             return {id_to_key[key]: val for key, val in it}
         return dict(it)
 
+    @_traced("result", device_to_host=True)
     def _nodearrays_to_dict(
         self,
         node_ids: cp.ndarray[IndexValue],
@@ -1221,6 +1566,7 @@ class CudaGraph:
             return {id_to_key[key]: val for key, val in it}
         return dict(it)
 
+    @_traced("result", device_to_host=True)
     def _edgearrays_to_dict(
         self,
         src_ids: cp.ndarray[IndexValue],
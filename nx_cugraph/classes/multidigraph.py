@@ -56,6 +56,16 @@ class MultiDiGraph(nx.MultiDiGraph, MultiGraph, DiGraph):
     __iter__ = gpu_cpu_api("__iter__")
     clear = DiGraph.clear
     clear_edges = DiGraph.clear_edges
+    adj = gpu_cpu_api("adj", edge_data=True)
+    succ = gpu_cpu_api("succ", edge_data=True)
+    pred = gpu_cpu_api("pred", edge_data=True)
+    degree = gpu_cpu_api("degree", edge_data=True)
+    in_degree = gpu_cpu_api("in_degree", edge_data=True)
+    out_degree = gpu_cpu_api("out_degree", edge_data=True)
+    edges = gpu_cpu_api("edges", edge_data=True)
+    in_edges = gpu_cpu_api("in_edges", edge_data=True)
+    out_edges = gpu_cpu_api("out_edges", edge_data=True)
+    nodes = gpu_cpu_api("nodes", node_data=True)
     get_edge_data = gpu_cpu_api("get_edge_data", edge_data=True)
     has_edge = gpu_cpu_api("has_edge")
     neighbors = gpu_cpu_api("neighbors")
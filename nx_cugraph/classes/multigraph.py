@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, ClassVar
 
 import cupy as cp
 import networkx as nx
+import numpy as np
 
 import nx_cugraph as nxcg
 
@@ -86,6 +87,7 @@ class MultiGraph(nx.MultiGraph, Graph):
         id_to_key: list[NodeKey] | None = None,
         edge_keys: list[EdgeKey] | None = None,
         use_compat_graph: bool | None = None,
+        reorder: str | None = None,
         **attr,
     ) -> MultiGraph | CudaMultiGraph:
         new_graph = super(cls.to_undirected_class(), cls).from_coo(
@@ -109,6 +111,9 @@ class MultiGraph(nx.MultiGraph, Graph):
             and len(new_graph.edge_keys) != src_indices.size
         ):
             raise ValueError
+        if reorder is not None:
+            # Edge indices and keys must be set before edges are sorted
+            new_graph._reorder_nodes(reorder)
         if use_compat_graph or use_compat_graph is None and issubclass(cls, Graph):
             new_graph = new_graph._to_compat_graph()
         return new_graph
@@ -295,6 +300,10 @@ class MultiGraph(nx.MultiGraph, Graph):
     __iter__ = gpu_cpu_api("__iter__")
     clear = Graph.clear
     clear_edges = Graph.clear_edges
+    adj = gpu_cpu_api("adj", edge_data=True)
+    degree = gpu_cpu_api("degree", edge_data=True)
+    edges = gpu_cpu_api("edges", edge_data=True)
+    nodes = gpu_cpu_api("nodes", node_data=True)
     get_edge_data = gpu_cpu_api("get_edge_data", edge_data=True)
     has_edge = gpu_cpu_api("has_edge")
     neighbors = gpu_cpu_api("neighbors")
@@ -495,6 +504,22 @@ class CudaMultiGraph(CudaGraph):
     # Private methods #
     ###################
 
+    def _calculate_edge_indices(self) -> None:
+        """Compute the default edge keys (0, 1, ...) for each (src, dst) pair.
+
+        Edges between the same nodes are numbered in the order they are stored.
+        """
+        # Upcast to int64 so indices don't overflow
+        src_dst_indices = self._N * self.src_indices.astype(np.int64) + self.dst_indices
+        # Stable sort keeps multiedges in the order they are stored
+        sorter = cp.argsort(src_dst_indices, kind="stable")
+        src_dst_indices = src_dst_indices[sorter]
+        edge_indices = cp.empty(sorter.size, dtype=index_dtype)
+        edge_indices[sorter] = cp.arange(sorter.size, dtype=index_dtype) - (
+            cp.searchsorted(src_dst_indices, src_dst_indices)
+        )
+        self.edge_indices = edge_indices
+
     def _copy(self, as_view: bool, cls: type[CudaGraph], reverse: bool = False):
         # DRY warning: see also CudaGraph._copy
         src_indices = self.src_indices
@@ -550,12 +575,26 @@ class CudaMultiGraph(CudaGraph):
         else:
             rv.graph.update(deepcopy(self.graph))
         rv.__networkx_cache__ = __networkx_cache__
+        rv._copy_structure_from(self, reverse=reverse)
+        return rv
+
+    def _nbytes(self) -> int:
+        rv = super()._nbytes()
+        if self.edge_indices is not None:
+            rv += self.edge_indices.nbytes
         return rv
 
     def _sort_edge_indices(self, primary="src"):
         # DRY warning: see also CudaGraph._sort_edge_indices
         if self.edge_indices is None and self.edge_keys is None:
             return super()._sort_edge_indices(primary=primary)
+        if (
+            primary == "src"
+            and self._is_sorted_by_src
+            or primary == "dst"
+            and self._is_sorted_by_dst
+        ):
+            return
         if primary == "src":
             if self.edge_indices is None:
                 stacked = (self.dst_indices, self.src_indices)
@@ -565,12 +604,14 @@ class CudaMultiGraph(CudaGraph):
             if self.edge_indices is None:
                 stacked = (self.src_indices, self.dst_indices)
             else:
-                stacked = (self.edge_indices, self.dst_indices, self.src_indices)
+                stacked = (self.edge_indices, self.src_indices, self.dst_indices)
         else:
             raise ValueError(
                 f'Bad `primary` argument; expected "src" or "dst", got {primary!r}'
             )
         indices = cp.lexsort(cp.vstack(stacked))
+        self._is_sorted_by_src = primary == "src"
+        self._is_sorted_by_dst = primary == "dst"
         if (cp.diff(indices) > 0).all():
             # Already sorted
             return
@@ -587,6 +628,10 @@ class CudaMultiGraph(CudaGraph):
         if self.edge_keys is not None:
             edge_keys = self.edge_keys
             self.edge_keys = [edge_keys[i] for i in indices.tolist()]
+        # Cached neighbor orders index the edges, which were reordered
+        for reverse in [False, True]:
+            self._structure_cache.pop(("neighbor_indptr", reverse), None)
+            self._structure_cache.pop(("neighbor_order", reverse), None)
 
 
 # rapids-pre-commit-hooks: disable-next-line[verify-hardcoded-version]
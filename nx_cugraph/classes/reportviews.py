@@ -0,0 +1,678 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION.
+# SPDX-License-Identifier: Apache-2.0
+"""Read-only views of graph data that are computed from device arrays.
+
+These mirror the views in ``networkx.classes.reportviews`` (such as ``G.degree``
+and ``G.edges``), but they are computed from a ``CudaGraph`` so compat graphs don't
+need to create NetworkX data structures to answer them. Nodes and edges are copied
+to the host in chunks when iterating.
+
+Attribute dicts are live (and mutable) in NetworkX, so views of compat graphs get
+them from the NetworkX graph, which may create it. As with other cached backend
+graphs, clear ``G.__networkx_cache__`` after changing attribute dicts directly.
+Views of ``CudaGraph`` objects return read-only copies instead.
+"""
+from __future__ import annotations
+
+import itertools
+from collections.abc import Mapping, Set
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+import cupy as cp
+import networkx as nx
+import numpy as np
+
+import nx_cugraph as nxcg
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+
+    from nx_cugraph.typing import AttrKey, EdgeKey, IndexValue, NodeKey
+
+    from .graph import CudaGraph, Graph
+
+__all__ = [
+    "DiDegreeView",
+    "DegreeView",
+    "InDegreeView",
+    "OutDegreeView",
+    "NodeView",
+    "NodeDataView",
+    "EdgeView",
+    "InEdgeView",
+    "EdgeDataView",
+    "AdjacencyView",
+    "AtlasView",
+]
+
+# The number of nodes or edges to copy to the host at a time when iterating
+_CHUNKSIZE = 2**20
+
+
+def _node_id(G: CudaGraph, n: NodeKey) -> int:
+    if (key_to_id := G.key_to_id) is not None:
+        return key_to_id[n]
+    if n in G:
+        return int(n)
+    raise KeyError(n)
+
+
+def _attr_dict(values, masks, index: int) -> dict:
+    return {
+        key: val[index].tolist()
+        for key, val in values.items()
+        if key not in masks or masks[key][index]
+    }
+
+
+def _iter_data(values, masks, data, default, index, size: int):
+    """Iterate over attribute dicts (if ``data is True``) or values of ``data``."""
+    if data is True:
+        if not values:
+            return ({} for _ in range(size))
+        return nxcg.convert._iter_attr_dicts(
+            {key: val[index] for key, val in values.items()},
+            {key: val[index] for key, val in masks.items()},
+        )
+    if data not in values:
+        return itertools.repeat(default, size)
+    vals = values[data][index].tolist()
+    if data not in masks:
+        return vals
+    return (
+        val if mask else default for val, mask in zip(vals, masks[data][index].tolist())
+    )
+
+
+def _multi_edge_keys(G: CudaGraph) -> list[EdgeKey] | cp.ndarray[IndexValue]:
+    if G.edge_keys is not None:
+        return G.edge_keys
+    if G.edge_indices is None:
+        G._calculate_edge_indices()
+    return G.edge_indices
+
+
+def _slicing_error(view, index: slice) -> nx.NetworkXError:
+    return nx.NetworkXError(
+        f"{type(view).__name__} does not support slicing, try "
+        f"list(view)[{index.start}:{index.stop}:{index.step}]"
+    )
+
+
+def _bincount(indices, N, weights=None):
+    if indices.size == 0:
+        return cp.zeros(N, dtype=np.int64 if weights is None else weights.dtype)
+    rv = cp.bincount(indices, weights=weights, minlength=N)
+    if weights is not None and weights.dtype.kind in "biu":
+        # Weighted bincount always returns floats
+        rv = rv.astype(np.int64)
+    return rv
+
+
+class DiDegreeView:
+    """A view of the degree of nodes in a directed graph.
+
+    This behaves like ``networkx.classes.reportviews.DiDegreeView``, but degrees
+    are computed on the GPU (and cached when unweighted). Degrees of many nodes
+    are copied to the host in a single transfer when iterating.
+    """
+
+    def __init__(
+        self, G: CudaGraph, nbunch=None, weight: AttrKey | None = None
+    ) -> None:
+        self._graph = G
+        self._nodes = None if nbunch is None else list(G.nbunch_iter(nbunch))
+        self._weight = weight
+
+    def __call__(self, nbunch=None, weight: AttrKey | None = None):
+        if nbunch is None:
+            if weight == self._weight:
+                return self
+            return self.__class__(self._graph, None, weight)
+        try:
+            if nbunch in (self._graph if self._nodes is None else self._nodes):
+                if weight == self._weight:
+                    return self[nbunch]
+                return self.__class__(self._graph, None, weight)[nbunch]
+        except TypeError:
+            pass
+        return self.__class__(self._graph, nbunch, weight)
+
+    def __getitem__(self, n: NodeKey) -> int | float:
+        return self._degrees_array()[_node_id(self._graph, n)].item()
+
+    def __iter__(self) -> Iterator[tuple[NodeKey, int | float]]:
+        G = self._graph
+        degrees = self._degrees_array()
+        if self._nodes is None:
+            return zip(G._nodeiter_to_iter(range(G._N)), degrees.tolist())
+        if not self._nodes:
+            return iter([])
+        node_ids = G._list_to_nodearray(self._nodes)
+        return zip(self._nodes, degrees[node_ids].tolist())
+
+    def __len__(self) -> int:
+        if self._nodes is None:
+            return len(self._graph)
+        return len(self._nodes)
+
+    def __str__(self) -> str:
+        return str(list(self))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)})"
+
+    def _edge_weights(self) -> cp.ndarray:
+        return self._graph._subgraph_weights(None, self._weight, 1)
+
+    def _degrees_array(self) -> cp.ndarray[IndexValue]:
+        """Return the degree of each node by node id; don't modify the result."""
+        G = self._graph
+        if self._weight is None:
+            return G._degrees_array()
+        weights = self._edge_weights()
+        return _bincount(G.src_indices, G._N, weights) + _bincount(
+            G.dst_indices, G._N, weights
+        )
+
+
+class DegreeView(DiDegreeView):
+    """A view of the degree of nodes in an undirected graph.
+
+    As in NetworkX, self-loops add two to the degree of a node.
+    """
+
+    def _degrees_array(self) -> cp.ndarray[IndexValue]:
+        """Return the degree of each node by node id; don't modify the result."""
+        G = self._graph
+        if self._weight is None:
+            degrees = G._degrees_array()
+            if not G._has_selfloops():
+                return degrees
+            weights = None
+        else:
+            weights = self._edge_weights()
+            degrees = _bincount(G.src_indices, G._N, weights)
+        # Undirected self-loops are only stored once, but they count twice
+        mask = G.src_indices == G.dst_indices
+        if weights is not None:
+            weights = weights[mask]
+        return degrees + _bincount(G.src_indices[mask], G._N, weights)
+
+
+class InDegreeView(DiDegreeView):
+    """A view of the in-degree of nodes in a directed graph."""
+
+    def _degrees_array(self) -> cp.ndarray[IndexValue]:
+        """Return the in-degree of each node by node id; don't modify the result."""
+        G = self._graph
+        if self._weight is None:
+            return G._in_degrees_array()
+        return _bincount(G.dst_indices, G._N, self._edge_weights())
+
+
+class OutDegreeView(DiDegreeView):
+    """A view of the out-degree of nodes in a directed graph."""
+
+    def _degrees_array(self) -> cp.ndarray[IndexValue]:
+        """Return the out-degree of each node by node id; don't modify the result."""
+        G = self._graph
+        if self._weight is None:
+            return G._out_degrees_array()
+        return _bincount(G.src_indices, G._N, self._edge_weights())
+
+
+class NodeView(Mapping, Set):
+    """A read-only view of the nodes of a graph like ``G.nodes``."""
+
+    # Compat graph to get attribute dicts from; set when dispatched from one
+    _compat_graph: Graph | None = None
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return set(it)
+
+    def __init__(self, G: CudaGraph) -> None:
+        self._graph = G
+
+    def __iter__(self) -> Iterator[NodeKey]:
+        return iter(self._graph)
+
+    def __len__(self) -> int:
+        return len(self._graph)
+
+    def __contains__(self, n: NodeKey) -> bool:
+        return n in self._graph
+
+    def __getitem__(self, n: NodeKey) -> Mapping:
+        if isinstance(n, slice):
+            raise _slicing_error(self, n)
+        if self._compat_graph is not None:
+            return self._compat_graph._node[n]
+        G = self._graph
+        return MappingProxyType(_attr_dict(G.node_values, G.node_masks, _node_id(G, n)))
+
+    def __call__(self, data=False, default=None):
+        if data is False:
+            return self
+        return NodeDataView(self, data, default)
+
+    def data(self, data=True, default=None) -> NodeDataView:
+        if data is False:
+            return self
+        return NodeDataView(self, data, default)
+
+    def items(self) -> NodeDataView:
+        return NodeDataView(self, True)
+
+    def __str__(self) -> str:
+        return str(list(self))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({tuple(self)})"
+
+
+class NodeDataView(Set):
+    """A read-only view of nodes and node data like ``G.nodes(data=True)``."""
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return set(it)
+
+    def __init__(self, nodes: NodeView, data=False, default=None) -> None:
+        self._nodes = nodes
+        self._graph = nodes._graph
+        self._data = data
+        self._default = default
+
+    def __iter__(self) -> Iterator:
+        G = self._graph
+        if self._data is False:
+            return iter(G)
+        if self._data is True and (compat_graph := self._nodes._compat_graph):
+            return iter(compat_graph._node.items())
+        return self._iter_chunks()
+
+    def _iter_chunks(self) -> Iterator[tuple]:
+        G = self._graph
+        N = G._N
+        for start in range(0, N, _CHUNKSIZE):
+            stop = min(start + _CHUNKSIZE, N)
+            index = slice(start, stop)
+            yield from zip(
+                G._nodeiter_to_iter(range(start, stop)),
+                _iter_data(
+                    G.node_values,
+                    G.node_masks,
+                    self._data,
+                    self._default,
+                    index,
+                    stop - start,
+                ),
+            )
+
+    def __len__(self) -> int:
+        return len(self._graph)
+
+    def __contains__(self, n) -> bool:
+        try:
+            node_in = n in self._graph
+        except TypeError:
+            node_in = False
+        if node_in or self._data is False:
+            return node_in
+        try:
+            n, d = n
+        except (TypeError, ValueError):
+            return False
+        return n in self._graph and self[n] == d
+
+    def __getitem__(self, n: NodeKey):
+        if isinstance(n, slice):
+            raise _slicing_error(self, n)
+        if self._data is False or self._data is True:
+            return self._nodes[n]
+        G = self._graph
+        data = self._data
+        index = _node_id(G, n)
+        if data not in G.node_values or (
+            data in G.node_masks and not G.node_masks[data][index]
+        ):
+            return self._default
+        return G.node_values[data][index].tolist()
+
+    def __str__(self) -> str:
+        return str(list(self))
+
+    def __repr__(self) -> str:
+        name = self.__class__.__name__
+        if self._data is False:
+            return f"{name}({tuple(self)})"
+        if self._data is True:
+            return f"{name}({dict(self)})"
+        return f"{name}({dict(self)}, data={self._data!r})"
+
+
+class EdgeView(Set):
+    """A read-only view of the edges of a graph like ``G.edges``.
+
+    This handles all graph types: it behaves like ``EdgeView``, ``OutEdgeView``,
+    ``MultiEdgeView``, or ``OutMultiEdgeView`` from NetworkX depending on the graph.
+    """
+
+    # Compat graph to get attribute dicts from; set when dispatched from one
+    _compat_graph: Graph | None = None
+    # Whether this is a view of in-edges, which are selected and ordered by target
+    _reverse = False
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return set(it)
+
+    def __init__(self, G: CudaGraph) -> None:
+        self._graph = G
+        self._directed = G.is_directed()
+        self._multi = G.is_multigraph()
+
+    def __iter__(self) -> Iterator[tuple]:
+        return iter(EdgeDataView(self, keys=self._multi))
+
+    def __len__(self) -> int:
+        G = self._graph
+        return G.src_indices.size if self._directed else G.size()
+
+    def __contains__(self, e) -> bool:
+        try:
+            keys = self._multi and len(e) == 3
+        except TypeError:
+            return False
+        return e in EdgeDataView(self, keys=keys)
+
+    def __getitem__(self, e) -> Mapping:
+        if isinstance(e, slice):
+            raise _slicing_error(self, e)
+        if self._compat_graph is not None:
+            return self._nx_view()[e]
+        G = self._graph
+        if self._multi:
+            u, v, k = e
+            ddict = G.get_edge_data(u, v, k)
+        else:
+            u, v = e
+            ddict = G.get_edge_data(u, v)
+        if ddict is None:
+            raise KeyError(e)
+        return MappingProxyType(ddict)
+
+    def __call__(self, nbunch=None, data=False, *, default=None, keys=False):
+        keys = keys and self._multi
+        if nbunch is None and data is False and keys == self._multi:
+            return self
+        return EdgeDataView(self, nbunch, data, default=default, keys=keys)
+
+    def data(self, data=True, default=None, nbunch=None, keys=False):
+        keys = keys and self._multi
+        if nbunch is None and data is False and keys == self._multi:
+            return self
+        return EdgeDataView(self, nbunch, data, default=default, keys=keys)
+
+    def _nx_view(self):
+        compat_graph = self._compat_graph
+        attr = "in_edges" if self._reverse else "edges"
+        nx_view = getattr(compat_graph.to_networkx_class(), attr)
+        return nx_view.__get__(compat_graph, type(compat_graph))
+
+    def __str__(self) -> str:
+        return str(list(self))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)})"
+
+
+class InEdgeView(EdgeView):
+    """A read-only view of the in-edges of a directed graph like ``G.in_edges``."""
+
+    _reverse = True
+
+
+class EdgeDataView(Set):
+    """A read-only view of edges and edge data like ``G.edges(data=True)``."""
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return set(it)
+
+    def __init__(
+        self, viewer: EdgeView, nbunch=None, data=False, *, default=None, keys=False
+    ) -> None:
+        self._viewer = viewer
+        self._graph = G = viewer._graph
+        self._nodes = None if nbunch is None else list(G.nbunch_iter(nbunch))
+        self._data = data
+        self._default = default
+        self._keys = keys
+
+    def _edge_indices(self) -> cp.ndarray[IndexValue] | None:
+        """Return the indices of edges in the order to iterate, or None for all."""
+        G = self._graph
+        viewer = self._viewer
+        if viewer._reverse:
+            src_indices, dst_indices = G.dst_indices, G.src_indices
+            is_sorted = G._is_sorted_by_dst
+        else:
+            src_indices, dst_indices = G.src_indices, G.dst_indices
+            is_sorted = G._is_sorted_by_src
+        if self._nodes is None:
+            # Order edges by source node like NetworkX
+            order = src_indices
+            if viewer._directed:
+                if is_sorted:
+                    return None
+                return cp.argsort(order, kind="stable")
+            # Undirected edges are yielded once from the first node
+            mask = src_indices <= dst_indices
+        else:
+            # Order edges by the first node in nbunch
+            positions = cp.full(G._N, -1, dtype=np.int64)
+            node_ids = G._list_to_nodearray(self._nodes)
+            positions[node_ids] = cp.arange(node_ids.size, dtype=np.int64)
+            order = positions[src_indices]
+            mask = order >= 0
+            if not viewer._directed:
+                dst_positions = positions[dst_indices]
+                mask &= (dst_positions < 0) | (order <= dst_positions)
+        indices = cp.nonzero(mask)[0]
+        if self._nodes is not None or not is_sorted:
+            indices = indices[cp.argsort(order[indices], kind="stable")]
+        return indices
+
+    def __iter__(self) -> Iterator[tuple]:
+        if self._data is True and self._viewer._compat_graph is not None:
+            kwargs = {"keys": self._keys} if self._viewer._multi else {}
+            return iter(
+                self._viewer._nx_view()(
+                    self._nodes, data=True, default=self._default, **kwargs
+                )
+            )
+        return self._iter_chunks()
+
+    def _iter_chunks(self) -> Iterator[tuple]:
+        G = self._graph
+        indices = self._edge_indices()
+        size = G.src_indices.size if indices is None else indices.size
+        edge_keys = _multi_edge_keys(G) if self._keys else None
+        for start in range(0, size, _CHUNKSIZE):
+            stop = min(start + _CHUNKSIZE, size)
+            if indices is None:
+                index = slice(start, stop)
+                index_list = range(start, stop)
+            else:
+                index = indices[start:stop]
+                index_list = None
+            columns = [
+                G._nodeiter_to_iter(G.src_indices[index].tolist()),
+                G._nodeiter_to_iter(G.dst_indices[index].tolist()),
+            ]
+            if edge_keys is None:
+                pass
+            elif isinstance(edge_keys, list):
+                if index_list is None:
+                    index_list = index.tolist()
+                columns.append([edge_keys[i] for i in index_list])
+            else:
+                columns.append(edge_keys[index].tolist())
+            if self._data is not False:
+                columns.append(
+                    _iter_data(
+                        G.edge_values,
+                        G.edge_masks,
+                        self._data,
+                        self._default,
+                        index,
+                        stop - start,
+                    )
+                )
+            yield from zip(*columns)
+
+    def __len__(self) -> int:
+        if self._nodes is None:
+            return len(self._viewer)
+        return self._edge_indices().size
+
+    def __contains__(self, e) -> bool:
+        G = self._graph
+        size = 2 + bool(self._keys) + (self._data is not False)
+        try:
+            if len(e) != size:
+                return False
+            u, v = e[:2]
+        except TypeError:
+            return False
+        if self._nodes is not None:
+            if self._viewer._reverse:
+                node_in = v in self._nodes
+            else:
+                node_in = u in self._nodes or (
+                    not self._viewer._directed and v in self._nodes
+                )
+            if not node_in:
+                return False
+        if self._keys:
+            ddict = G.get_edge_data(u, v, e[2])
+        else:
+            ddict = G.get_edge_data(u, v)
+        if ddict is None:
+            return False
+        if self._data is False:
+            return True
+        if self._viewer._multi and not self._keys:
+            ddicts = ddict.values()
+        else:
+            ddicts = [ddict]
+        if self._data is True:
+            return any(d == e[-1] for d in ddicts)
+        return any(d.get(self._data, self._default) == e[-1] for d in ddicts)
+
+    def __str__(self) -> str:
+        return str(list(self))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)})"
+
+
+class AdjacencyView(Mapping):
+    """A read-only view of the adjacency of a graph like ``G.adj`` or ``G.pred``."""
+
+    # Compat graph to get attribute dicts from; set when dispatched from one
+    _compat_graph: Graph | None = None
+
+    def __init__(self, G: CudaGraph, *, reverse: bool = False) -> None:
+        self._graph = G
+        self._reverse = reverse
+
+    def __getitem__(self, n: NodeKey) -> AtlasView:
+        return AtlasView(self, n)
+
+    def __iter__(self) -> Iterator[NodeKey]:
+        return iter(self._graph)
+
+    def __len__(self) -> int:
+        return len(self._graph)
+
+    def __contains__(self, n: NodeKey) -> bool:
+        return n in self._graph
+
+    def __str__(self) -> str:
+        return str(list(self))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)})"
+
+
+class AtlasView(Mapping):
+    """A read-only view of the neighbors of a node like ``G[n]``.
+
+    For multigraphs, each neighbor maps to a dict of edge keys to edge data.
+    """
+
+    def __init__(self, adjacency: AdjacencyView, n: NodeKey) -> None:
+        G = self._graph = adjacency._graph
+        self._adjacency = adjacency
+        self._node = n
+        index = _node_id(G, n)
+        dst_indices = G.src_indices if adjacency._reverse else G.dst_indices
+        # Find the edges of the node from cached offsets instead of scanning edges
+        order, indptr = G._neighbor_edges(reverse=adjacency._reverse)
+        start, stop = indptr[index : index + 2].tolist()
+        if order is None:
+            indices = cp.arange(start, stop, dtype=indptr.dtype)
+        else:
+            indices = order[start:stop]
+        # Copy the neighbors and edge indices of the node to host at once
+        nbrs = G._nodeiter_to_iter(dst_indices[indices].tolist())
+        indices = indices.tolist()
+        if G.is_multigraph():
+            self._nbrs = {}
+            for nbr, edge_index in zip(nbrs, indices):
+                self._nbrs.setdefault(nbr, []).append(edge_index)
+        else:
+            self._nbrs = dict(zip(nbrs, indices))
+
+    def __getitem__(self, nbr: NodeKey) -> Mapping:
+        if (compat_graph := self._adjacency._compat_graph) is not None:
+            adj = compat_graph._pred if self._adjacency._reverse else compat_graph._adj
+            return adj[self._node][nbr]
+        G = self._graph
+        edge_index = self._nbrs[nbr]
+        if not G.is_multigraph():
+            return MappingProxyType(_attr_dict(G.edge_values, G.edge_masks, edge_index))
+        edge_keys = _multi_edge_keys(G)
+        if not isinstance(edge_keys, list):
+            edge_keys = edge_keys[edge_index].tolist()
+        else:
+            edge_keys = [edge_keys[i] for i in edge_index]
+        return MappingProxyType(
+            {
+                key: MappingProxyType(_attr_dict(G.edge_values, G.edge_masks, i))
+                for key, i in zip(edge_keys, edge_index)
+            }
+        )
+
+    def __iter__(self) -> Iterator[NodeKey]:
+        return iter(self._nbrs)
+
+    def __len__(self) -> int:
+        return len(self._nbrs)
+
+    def __contains__(self, nbr: NodeKey) -> bool:
+        try:
+            return nbr in self._nbrs
+        except TypeError:
+            return False
+
+    def __str__(self) -> str:
+        return str(list(self))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)})"
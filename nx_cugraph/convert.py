@@ -16,6 +16,8 @@ import numpy as np
 import nx_cugraph as nxcg
 from nx_cugraph import _nxver
 
+from .cache import _record_hit, _record_miss, _record_set
+from .profiling import _count, _is_profiling, _traced
 from .utils import index_dtype, networkx_algorithm
 from .utils.misc import _And_NotImplementedError
 
@@ -76,6 +78,7 @@ def _fallback_decorator(func):
 
 
 @_fallback_decorator
+@_traced("convert")
 def from_networkx(
     graph: nx.Graph,
     edge_attrs: AttrKey | dict[AttrKey, EdgeValue | None] | None = None,
@@ -91,6 +94,7 @@ def from_networkx(
     name: str | None = None,
     graph_name: str | None = None,
     use_compat_graph: bool | None = False,
+    reorder: str | None = None,
 ) -> nxcg.Graph | nxcg.CudaGraph:
     """Convert a networkx graph to nx_cugraph graph; can convert all attributes.
 
@@ -137,6 +141,14 @@ def from_networkx(
         reside in host (CPU) or device (GPU) memory. The default is False, which
         will return e.g. ``nx_cugraph.CudaGraph`` that only resides on device (GPU)
         and is not fully compatible as a NetworkX graph.
+    reorder : {"degree", "rcm"}, optional
+        Renumber nodes with a locality-friendly ordering, which may speed up
+        traversal-heavy algorithms on large graphs. "degree" orders nodes by
+        decreasing degree, and "rcm" uses reverse Cuthill-McKee ordering. Node
+        keys are preserved, so results still refer to the original nodes, but
+        nodes and edges are iterated in the new order. Reordered graphs are not
+        cached on ``nx_cugraph.Graph`` inputs. Default is to keep the order of
+        nodes in ``G``.
 
     Returns
     -------
@@ -168,7 +180,7 @@ def from_networkx(
             graph = G
         else:
             raise TypeError(f"Expected networkx.Graph; got {type(graph)}")
-    elif isinstance(graph, nxcg.Graph):
+    elif isinstance(graph, nxcg.Graph) and reorder is None:
         if (
             use_compat_graph
             # Use compat graphs by default
@@ -202,7 +214,9 @@ def from_networkx(
                         # This shouldn't happen during normal use, but be extra-careful
                         rv = rv._cudagraph
                     if rv is not None:
+                        _record_hit(graph, compat_key, rv)
                         return rv
+                _record_miss(graph)
 
     if preserve_all_attrs:
         preserve_edge_attrs = True
@@ -549,6 +563,7 @@ def from_networkx(
             key_to_id=key_to_id,
             edge_keys=edge_keys,
             use_compat_graph=False,
+            reorder=reorder,
         )
     else:
         if graph.is_directed() or as_directed:
@@ -565,14 +580,25 @@ def from_networkx(
             node_masks,
             key_to_id=key_to_id,
             use_compat_graph=False,
+            reorder=reorder,
         )
+        # Edges come from dicts of neighbors, so there can't be duplicates
+        rv._structure_cache["has_duplicates"] = False
+    if _is_profiling():
+        _count(bytes_host_to_device=rv._nbytes())
     if preserve_graph_attrs:
         rv.graph.update(graph.graph)  # deepcopy?
-    if _nxver >= (3, 4) and isinstance(graph, nxcg.Graph) and cache is not None:
+    if (
+        _nxver >= (3, 4)
+        and isinstance(graph, nxcg.Graph)
+        and reorder is None
+        and cache is not None
+    ):
         # Make sure this conversion is added to the cache, and make all of
         # our graphs share the same `.graph` attribute for consistency.
         rv.graph = graph.graph
         _set_to_cache(cache, cache_key, rv)
+        _record_set(graph, cache_key, rv)
     if (
         use_compat_graph
         # Use compat graphs by default
@@ -628,6 +654,7 @@ def _iter_attr_dicts(
     return full_dicts
 
 
+@_traced("to_networkx")
 def to_networkx(
     G: nxcg.Graph | nxcg.CudaGraph, *, sort_edges: bool = False
 ) -> nx.Graph:
@@ -659,6 +686,8 @@ def to_networkx(
             return G.to_networkx_class()(G)
         # Should be fine to duck-type as networkx graph; will cleanly fall back to nx
         return G
+    if _is_profiling():
+        _count(bytes_device_to_host=G._nbytes())
     rv = G.to_networkx_class()()
     id_to_key = G.id_to_key
     if sort_edges:
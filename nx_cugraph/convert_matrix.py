@@ -1,23 +1,32 @@
-# SPDX-FileCopyrightText: Copyright (c) 2023-2025, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 
+import itertools
+import statistics
+
 import cupy as cp
 import networkx as nx
 import numpy as np
 
+import nx_cugraph as nxcg
 from nx_cugraph import _nxver
 
+from .classes.reportviews import EdgeDataView, _multi_edge_keys
 from .convert import _to_graph
 from .generators._utils import _create_using_class
 from .utils import (
+    _coo_to_csr,
     _cp_iscopied_asarray,
     index_dtype,
     networkx_algorithm,
 )
 
 __all__ = [
+    "from_edgelist_arrays",
     "from_pandas_edgelist",
     "from_scipy_sparse_array",
+    "to_arrow",
+    "to_pandas_edgelist",
     "to_scipy_sparse_array",
     "to_numpy_array",
 ]
@@ -57,39 +66,19 @@ def from_pandas_edgelist(
         is_dst_copied, dst_array = _cp_iscopied_asarray(
             dst_array, orig_object=dst_series
         )
-        np_or_cp = cp
     except ValueError:
         is_src_copied = is_dst_copied = False
         src_array = np.asarray(src_array)
         dst_array = np.asarray(dst_array)
-        np_or_cp = np
-    # TODO: create renumbering helper function(s)
-    # Renumber step 0: node keys
-    nodes = np_or_cp.unique(np_or_cp.concatenate([src_array, dst_array]))
-    N = nodes.size
+    N, src_indices, dst_indices, id_to_key = _renumber_edgelist(
+        src_array,
+        dst_array,
+        is_src_copied=is_src_copied,
+        is_dst_copied=is_dst_copied,
+    )
     kwargs = {}
-    if N > 0 and (
-        nodes[0] != 0
-        or nodes[N - 1] != N - 1
-        or (
-            nodes.dtype.kind not in {"i", "u"}
-            and not (nodes == np_or_cp.arange(N, dtype=np.int64)).all()
-        )
-    ):
-        # We need to renumber indices--np_or_cp.searchsorted to the rescue!
-        kwargs["id_to_key"] = nodes.tolist()
-        src_indices = cp.asarray(np_or_cp.searchsorted(nodes, src_array), index_dtype)
-        dst_indices = cp.asarray(np_or_cp.searchsorted(nodes, dst_array), index_dtype)
-    else:
-        # Copy if necessary so we don't share ownership of input arrays.
-        if is_src_copied:
-            src_indices = src_array
-        else:
-            src_indices = cp.array(src_array)
-        if is_dst_copied:
-            dst_indices = dst_array
-        else:
-            dst_indices = cp.array(dst_array)
+    if id_to_key is not None:
+        kwargs["id_to_key"] = id_to_key
 
     if not graph_class.is_directed():
         # Symmetrize the edges
@@ -163,13 +152,312 @@ def from_pandas_edgelist(
     return G
 
 
+def _renumber_edgelist(src_array, dst_array, *, is_src_copied, is_dst_copied):
+    """Renumber node keys of an edge list to ``0..N-1``.
+
+    Returns ``N``, new ``src_indices`` and ``dst_indices`` on the device, and
+    ``id_to_key`` (or None if the keys are already ``0..N-1``). Inputs that were
+    not already copied are copied so the graph never shares ownership of them.
+    """
+    np_or_cp = cp if isinstance(src_array, cp.ndarray) else np
+    # Renumber step 0: node keys
+    nodes = np_or_cp.unique(np_or_cp.concatenate([src_array, dst_array]))
+    N = nodes.size
+    if N > 0 and (
+        nodes[0] != 0
+        or nodes[N - 1] != N - 1
+        or (
+            nodes.dtype.kind not in {"i", "u"}
+            and not (nodes == np_or_cp.arange(N, dtype=np.int64)).all()
+        )
+    ):
+        # We need to renumber indices--np_or_cp.searchsorted to the rescue!
+        src_indices = cp.asarray(np_or_cp.searchsorted(nodes, src_array), index_dtype)
+        dst_indices = cp.asarray(np_or_cp.searchsorted(nodes, dst_array), index_dtype)
+        return N, src_indices, dst_indices, nodes.tolist()
+    # Copy if necessary so we don't share ownership of input arrays.
+    src_indices = src_array if is_src_copied else cp.array(src_array)
+    dst_indices = dst_array if is_dst_copied else cp.array(dst_array)
+    return N, src_indices, dst_indices, None
+
+
+def _as_array(values):
+    """Get a CuPy or NumPy array from a 1-d array-like, avoiding copies.
+
+    Device data (CuPy, cuDF, or anything with ``__cuda_array_interface__``)
+    stays on the device, and host data (NumPy, pandas, Arrow) stays on host.
+    """
+    if isinstance(values, cp.ndarray) or hasattr(values, "__cuda_array_interface__"):
+        return cp.asarray(values)
+    if hasattr(values, "to_cupy"):
+        # cudf.Series; may fail for e.g. strings
+        try:
+            return values.to_cupy()
+        except (TypeError, ValueError, NotImplementedError):
+            return values.to_numpy()
+    return np.asarray(values)
+
+
+def _edge_column_to_arrays(values):
+    """Convert an edge attribute column to device ``(values, mask)`` arrays.
+
+    Nulls in Arrow, cuDF, and pandas nullable columns are masked out; ``mask``
+    is None if there are no nulls. NaN in floating point columns is a value.
+    """
+    if getattr(values, "null_count", 0):
+        # Arrow or cuDF
+        if hasattr(values, "fill_null"):
+            mask = values.is_valid()
+            values = values.fill_null(0)
+        else:
+            mask = values.notna()
+            values = values.fillna(0)
+    elif not isinstance(getattr(values, "dtype", None), np.dtype) and getattr(
+        values, "hasnans", False
+    ):
+        # pandas Series with an extension dtype such as "Int64"
+        mask = values.notna()
+        values = values.fillna(0)
+    else:
+        mask = None
+    values = cp.array(_as_array(values))
+    if mask is not None:
+        mask = cp.asarray(_as_array(mask), dtype=bool)
+    return values, mask
+
+
+def _edgelist_to_graph(
+    graph_class, N, src_indices, dst_indices, edge_values, edge_masks, id_to_key
+):
+    """Create a graph from renumbered edges, symmetrizing undirected graphs."""
+    if not graph_class.is_directed():
+        # Symmetrize the edges; self-loops are only included once
+        mask = src_indices != dst_indices
+        if mask.all():
+            src_indices, dst_indices = (
+                cp.hstack((src_indices, dst_indices)),
+                cp.hstack((dst_indices, src_indices)),
+            )
+            edge_values = {
+                key: cp.hstack((val, val)) for key, val in edge_values.items()
+            }
+            edge_masks = {key: cp.hstack((val, val)) for key, val in edge_masks.items()}
+        else:
+            src_indices, dst_indices = (
+                cp.hstack((src_indices, dst_indices[mask])),
+                cp.hstack((dst_indices, src_indices[mask])),
+            )
+            edge_values = {
+                key: cp.hstack((val, val[mask])) for key, val in edge_values.items()
+            }
+            edge_masks = {
+                key: cp.hstack((val, val[mask])) for key, val in edge_masks.items()
+            }
+    return graph_class.from_coo(
+        N,
+        src_indices,
+        dst_indices,
+        edge_values=edge_values,
+        edge_masks=edge_masks,
+        id_to_key=id_to_key,
+    )
+
+
+def from_edgelist_arrays(src, dst, *, create_using=None, **edge_columns):
+    """Create a graph from arrays of source nodes, target nodes, and edge data.
+
+    This is like ``from_pandas_edgelist``, but it does not need a DataFrame.
+    Each array may be any 1-d array-like, such as CuPy or NumPy arrays, pandas
+    or cuDF Series, or Arrow arrays. Arrays already on the GPU are not copied to
+    the host, and nulls in edge data become missing edge attributes.
+
+    Parameters
+    ----------
+    src, dst : array-like
+        Source and target node of each edge. Node keys are renumbered to
+        ``0..N-1`` unless they are already integers ``0..N-1``.
+    create_using : graph type or instance, optional
+        The type of graph to create. Default is ``nx_cugraph.Graph``.
+    **edge_columns : array-like
+        Edge attribute arrays keyed by attribute name.
+
+    Returns
+    -------
+    Graph
+
+    See Also
+    --------
+    from_pandas_edgelist
+    """
+    graph_class, inplace = _create_using_class(create_using)
+    src_array = _as_array(src)
+    dst_array = _as_array(dst)
+    if src_array.ndim != 1 or src_array.shape != dst_array.shape:
+        raise ValueError(
+            "src and dst must be 1-d arrays of the same size; got shapes "
+            f"{src_array.shape} and {dst_array.shape}"
+        )
+    if isinstance(src_array, cp.ndarray) is not isinstance(dst_array, cp.ndarray):
+        src_array = cp.asnumpy(src_array)
+        dst_array = cp.asnumpy(dst_array)
+    N, src_indices, dst_indices, id_to_key = _renumber_edgelist(
+        src_array, dst_array, is_src_copied=False, is_dst_copied=False
+    )
+    edge_values = {}
+    edge_masks = {}
+    for key, values in edge_columns.items():
+        values, mask = _edge_column_to_arrays(values)
+        if values.shape != src_array.shape:
+            raise ValueError(
+                f"Edge attribute {key!r} has shape {values.shape}; "
+                f"expected shape {src_array.shape}"
+            )
+        edge_values[key] = values
+        if mask is not None:
+            edge_masks[key] = mask
+    G = _edgelist_to_graph(
+        graph_class, N, src_indices, dst_indices, edge_values, edge_masks, id_to_key
+    )
+    if inplace:
+        return create_using._become(G)
+    return G
+
+
+def _edgelist_columns(G, source, target, nodelist, edge_key):
+    """Get host columns of an edge list in the order of ``G.edges(nodelist)``.
+
+    Returns source node keys, target node keys, edge keys (or None), and a dict
+    of ``(values, mask)`` per edge attribute where ``mask`` is None if no value
+    is missing. Attributes missing from all selected edges are excluded.
+    """
+    if isinstance(G, nx.Graph):
+        G = nxcg.from_networkx(G, preserve_all_attrs=True)
+    indices = EdgeDataView(G.edges, nodelist)._edge_indices()
+    if indices is None:
+        indices = slice(None)
+    src_ids = cp.asnumpy(G.src_indices[indices])
+    dst_ids = cp.asnumpy(G.dst_indices[indices])
+    if (id_to_key := G.id_to_key) is None:
+        src_keys = src_ids.astype(np.int64)
+        dst_keys = dst_ids.astype(np.int64)
+    else:
+        # Translate node ids to keys with one `take` from an array of keys
+        keys = np.fromiter(id_to_key, dtype=object, count=G._N)
+        src_keys = keys.take(src_ids)
+        dst_keys = keys.take(dst_ids)
+    edge_data = {}
+    for attr, values in G.edge_values.items():
+        mask = G.edge_masks.get(attr)
+        if mask is not None:
+            mask = cp.asnumpy(mask[indices])
+            if not mask.any():
+                continue
+            if mask.all():
+                mask = None
+        edge_data[attr] = (cp.asnumpy(values[indices]), mask)
+    if source in edge_data:
+        raise nx.NetworkXError(f"Source name {source!r} is an edge attr name")
+    if target in edge_data:
+        raise nx.NetworkXError(f"Target name {target!r} is an edge attr name")
+    if G.is_multigraph() and edge_key is not None:
+        if edge_key in edge_data:
+            raise nx.NetworkXError(f"Edge key name {edge_key!r} is an edge attr name")
+        edge_keys = _multi_edge_keys(G)
+        if isinstance(edge_keys, list):
+            # Select explicit keys with one `take` from an array of keys
+            keys = np.fromiter(edge_keys, dtype=object, count=len(edge_keys))
+            if not isinstance(indices, slice):
+                indices = cp.asnumpy(indices)
+            edge_keys = keys[indices].tolist()
+        else:
+            edge_keys = cp.asnumpy(edge_keys[indices]).astype(np.int64)
+    else:
+        edge_keys = None
+    return src_keys, dst_keys, edge_keys, edge_data
+
+
+# rapids-pre-commit-hooks: disable-next-line[verify-hardcoded-version]
+@networkx_algorithm(version_added="26.04")
+def to_pandas_edgelist(
+    G,
+    source="source",
+    target="target",
+    nodelist=None,
+    dtype=None,
+    edge_key=None,
+):
+    import pandas as pd
+
+    src_keys, dst_keys, edge_keys, edge_data = _edgelist_columns(
+        G, source, target, nodelist, edge_key
+    )
+    if src_keys.size == 0:
+        # Match the object dtype networkx gets from empty lists
+        src_keys = dst_keys = []
+    edgelistdict = {source: src_keys, target: dst_keys}
+    if edge_keys is not None:
+        edgelistdict[edge_key] = edge_keys
+    for attr, (values, mask) in edge_data.items():
+        if mask is not None:
+            # Missing values are NaN like networkx
+            if values.dtype.kind in {"i", "u", "f"}:
+                values = values.astype(np.float64)
+            else:
+                values = values.astype(object)
+            values[~mask] = np.nan
+        edgelistdict[attr] = values
+    df = pd.DataFrame(edgelistdict, dtype=dtype)
+    if dtype is None:
+        # Infer dtypes of node key columns such as strings like networkx
+        df = df.infer_objects()
+    return df
+
+
+def to_arrow(G, source="source", target="target", nodelist=None, edge_key=None):
+    """Return the edge list of a graph as a ``pyarrow.Table``.
+
+    Columns are built directly from the graph's arrays without creating Python
+    objects for each edge. Missing edge attributes are nulls.
+
+    Parameters
+    ----------
+    G : graph
+        A NetworkX or nx-cugraph graph.
+    source, target : str
+        Names of the columns for source and target nodes.
+    nodelist : list, optional
+        Only include edges incident to these nodes, like ``G.edges(nodelist)``.
+    edge_key : str, optional
+        Name of the column for edge keys of multigraphs. If None, edge keys are
+        not included.
+
+    Returns
+    -------
+    pyarrow.Table
+
+    See Also
+    --------
+    to_pandas_edgelist
+    from_arrow_edgelist
+    """
+    import pyarrow as pa
+
+    src_keys, dst_keys, edge_keys, edge_data = _edgelist_columns(
+        G, source, target, nodelist, edge_key
+    )
+    columns = {source: pa.array(src_keys), target: pa.array(dst_keys)}
+    if edge_keys is not None:
+        columns[edge_key] = pa.array(edge_keys)
+    for attr, (values, mask) in edge_data.items():
+        columns[attr] = pa.array(values, mask=None if mask is None else ~mask)
+    return pa.table(columns)
+
+
 @networkx_algorithm(version_added="25.06")
 def to_scipy_sparse_array(G, nodelist=None, dtype=None, weight="weight", format="csr"):
     # Future work: allow this to return a cupyx.scipy.sparse object.
     # This code is very well covered by networkx tests, and the logic
     # for raising errors closely matches networkx.
-    import scipy as sp
-
     G = _to_graph(G, weight, 1, dtype)
     if G._N == 0:
         raise nx.NetworkXError("Graph has no nodes or edges")
@@ -203,16 +491,70 @@ def to_scipy_sparse_array(G, nodelist=None, dtype=None, weight="weight", format=
                 src_indices = dst_indices = edge_array = ()
 
     if not is_empty:
-        src_indices = cp.asnumpy(src_indices)
-        dst_indices = cp.asnumpy(dst_indices)
-
         edge_array = G._subgraph_weights(mask, weight, 1)
-        edge_array = cp.asnumpy(edge_array)
-
-    # PERF: convert to desired sparse format on GPU before copying to CPU
-    A = sp.sparse.coo_array(
-        (edge_array, (src_indices, dst_indices)), shape=(nlen, nlen), dtype=dtype
+    return _coo_to_scipy_sparse(
+        nlen,
+        nlen,
+        src_indices,
+        dst_indices,
+        edge_array,
+        dtype=dtype,
+        format=format,
+        # Without nodelist, edges are in the order of the graph
+        is_sorted_by_row=nodelist is None and G._is_sorted_by_src,
+        is_sorted_by_col=nodelist is None and G._is_sorted_by_dst,
     )
+
+
+def _coo_to_scipy_sparse(
+    nrows,
+    ncols,
+    row_indices,
+    col_indices,
+    values,
+    *,
+    dtype=None,
+    format="csr",
+    is_sorted_by_row=False,
+    is_sorted_by_col=False,
+):
+    """Create a scipy.sparse array from COO arrays that may be on device.
+
+    Compressed formats are built on device, so only the compressed arrays are
+    copied to host instead of having SciPy sort and sum duplicates on host.
+    """
+    import scipy as sp
+
+    if format == "coo" or not isinstance(row_indices, cp.ndarray):
+        # Nothing to compress (or no entries)
+        if isinstance(row_indices, cp.ndarray):
+            row_indices = cp.asnumpy(row_indices)
+            col_indices = cp.asnumpy(col_indices)
+            values = cp.asnumpy(values)
+        A = sp.sparse.coo_array(
+            (values, (row_indices, col_indices)), shape=(nrows, ncols), dtype=dtype
+        )
+    elif format == "csc":
+        data, indices, indptr = _coo_to_csr(
+            ncols, col_indices, row_indices, values, is_sorted=is_sorted_by_col
+        )
+        A = sp.sparse.csc_array(
+            (cp.asnumpy(data), cp.asnumpy(indices), cp.asnumpy(indptr)),
+            shape=(nrows, ncols),
+            dtype=dtype,
+        )
+        A.has_canonical_format = True
+    else:
+        # Other formats are converted from CSR on host
+        data, indices, indptr = _coo_to_csr(
+            nrows, row_indices, col_indices, values, is_sorted=is_sorted_by_row
+        )
+        A = sp.sparse.csr_array(
+            (cp.asnumpy(data), cp.asnumpy(indices), cp.asnumpy(indptr)),
+            shape=(nrows, ncols),
+            dtype=dtype,
+        )
+        A.has_canonical_format = True
     try:
         return A.asformat(format)
     except ValueError as exc:
@@ -246,7 +588,42 @@ def from_scipy_sparse_array(
     return G
 
 
-@networkx_algorithm(version_added="25.06")
+# Target size in bytes of each row tile written by blocked `to_numpy_array`
+_TILE_BYTES = 2**28
+
+# `multigraph_weight` functions that can be computed on the GPU
+_MULTIGRAPH_WEIGHT_REDUCTIONS = {
+    sum: "sum",
+    np.sum: "sum",
+    min: "min",
+    np.min: "min",
+    np.amin: "min",
+    max: "max",
+    np.max: "max",
+    np.amax: "max",
+    np.mean: "mean",
+    statistics.mean: "mean",
+    statistics.fmean: "mean",
+}
+
+
+@networkx_algorithm(
+    extra_params={
+        "out : numpy.ndarray, optional": (
+            "Pre-allocated host array of shape (N, N), such as a ``numpy.memmap``, "
+            "to write the result into. It is filled in blocks of rows, so the full "
+            "dense matrix never needs to fit in GPU memory. If given, `out` is "
+            "returned and `order` is ignored."
+        ),
+        "chunksize : int, optional": (
+            "Number of rows to compute on the GPU and copy to the output at a time. "
+            "If None (the default), then the full matrix is computed on the GPU "
+            "unless `out` is given or it does not fit in GPU memory, in which case "
+            "a chunk size is chosen to use about 256 MiB of GPU memory per block."
+        ),
+    },
+    version_added="25.06",
+)
 def to_numpy_array(
     G,
     nodelist=None,
@@ -255,11 +632,21 @@ def to_numpy_array(
     multigraph_weight=sum,
     weight="weight",
     nonedge=0.0,
+    *,
+    out=None,
+    chunksize=None,
 ):
-    """MultiGraphs are not yet supported. Only valid CuPy dtypes are supported."""
+    """Only valid CuPy dtypes are supported.
+
+    For multigraphs, ``multigraph_weight`` of sum, min, max, and mean (such as
+    ``np.mean`` or ``statistics.mean``) are computed on the GPU; other functions
+    are called once per pair of nodes on the host.
+    """
     if dtype is None:
-        dtype = np.float64
+        dtype = np.float64 if out is None else out.dtype
     dtype = np.dtype(dtype)
+    if chunksize is not None and chunksize < 1:
+        raise ValueError(f"chunksize must be a positive integer; got {chunksize}")
 
     G = _to_graph(G, weight, 1, dtype)
 
@@ -276,24 +663,40 @@ def to_numpy_array(
     else:
         N = G._N
 
+    if out is not None:
+        if out.shape != (N, N):
+            raise ValueError(
+                f"out array has shape {out.shape}; expected shape {(N, N)}"
+            )
+        if out.dtype != dtype:
+            raise ValueError(f"out array has dtype {out.dtype}; expected dtype {dtype}")
+
     use_numpy = dtype.names is not None
-    if not use_numpy:
+    # Compute blocks of rows on the GPU and copy each block to the host output
+    blocked = out is not None or chunksize is not None or use_numpy
+    if not blocked:
         # May run out of GPU memory on large graphs
         try:
             A = cp.full((N, N), fill_value=nonedge, dtype=dtype, order=order)
         except MemoryError:
-            use_numpy = True
-    if use_numpy:
+            blocked = True
+    if blocked and out is None:
         # Most likely will also run out of CPU memory on large graphs
-        A = np.full((N, N), fill_value=nonedge, dtype=dtype, order=order)
+        A = np.empty((N, N), dtype=dtype, order=order)
+    elif blocked:
+        A = out
 
     # Case: graph with no nodes
     if N == 0:
-        return cp.asnumpy(A)
+        return A if blocked else cp.asnumpy(A)
 
     # assume edge_attrs is None unless other weight value is specified
     edge_attrs = None
-    if A.dtype.names:
+    if dtype.names:
+        if G.is_multigraph():
+            raise nx.NetworkXError(
+                "Structured arrays are not supported for MultiGraphs"
+            )
         if weight is None:
             edge_attrs = dtype.names
         else:
@@ -320,25 +723,84 @@ def to_numpy_array(
     else:
         edge_array = G._subgraph_weights(mask, weight, 1)
 
+    is_sorted = nodelist is None and G._is_sorted_by_src
+    if G.is_multigraph():
+        # Undirected edges are stored in both directions, so reducing over
+        # each (src, dst) pair also fills the symmetric entry.
+        src_indices, dst_indices, edge_array = _reduce_parallel_edges(
+            N, src_indices, dst_indices, edge_array, multigraph_weight
+        )
+        is_sorted = True
+
+    if not blocked:
+        A[src_indices, dst_indices] = edge_array
+        return cp.asnumpy(A)
+
+    # Blocked export: fill tiles of rows from a row-sorted edge list
     if use_numpy:
+        xp = np
         src_indices = cp.asnumpy(src_indices)
         dst_indices = cp.asnumpy(dst_indices)
-        edge_array = cp.asnumpy(edge_array)
-
-    A[src_indices, dst_indices] = edge_array
-
-    return cp.asnumpy(A)
-
-
-@to_numpy_array._can_run
-def _(
-    G,
-    nodelist=None,
-    dtype=None,
-    order=None,
-    multigraph_weight=sum,
-    weight="weight",
-    nonedge=0.0,
-):
-    # TODO handle multigraphs
-    return not G.is_multigraph()
+    else:
+        xp = cp
+    if chunksize is None:
+        chunksize = max(1, _TILE_BYTES // (N * dtype.itemsize))
+    if not is_sorted:
+        perm = xp.argsort(src_indices)
+        src_indices = src_indices[perm]
+        dst_indices = dst_indices[perm]
+        edge_array = edge_array[perm]
+    row_starts = xp.arange(0, N + chunksize, chunksize).clip(max=N)
+    bounds = cp.asnumpy(xp.searchsorted(src_indices, row_starts)).tolist()
+    for start, stop, lo, hi in zip(
+        row_starts[:-1].tolist(), row_starts[1:].tolist(), bounds[:-1], bounds[1:]
+    ):
+        tile = xp.full((stop - start, N), fill_value=nonedge, dtype=dtype)
+        tile[src_indices[lo:hi] - start, dst_indices[lo:hi]] = edge_array[lo:hi]
+        A[start:stop] = cp.asnumpy(tile)
+    return A
+
+
+def _reduce_parallel_edges(N, src_indices, dst_indices, edge_array, multigraph_weight):
+    """Combine the values of parallel edges with ``multigraph_weight``.
+
+    Returns unique ``(src_indices, dst_indices, values)`` sorted by row.
+    """
+    if src_indices.size == 0:
+        return src_indices, dst_indices, edge_array
+    keys = src_indices.astype(np.int64) * N + dst_indices
+    sort_indices = cp.argsort(keys)
+    keys = keys[sort_indices]
+    edge_array = edge_array[sort_indices]
+    is_start = cp.empty(keys.size, dtype=bool)
+    is_start[0] = True
+    cp.not_equal(keys[1:], keys[:-1], out=is_start[1:])
+    starts = cp.nonzero(is_start)[0]
+    reduction = _MULTIGRAPH_WEIGHT_REDUCTIONS.get(multigraph_weight)
+    if reduction is not None:
+        group_ids = cp.cumsum(is_start) - 1
+        if reduction == "min":
+            values = edge_array[starts]
+            cp.minimum.at(values, group_ids, edge_array)
+        elif reduction == "max":
+            values = edge_array[starts]
+            cp.maximum.at(values, group_ids, edge_array)
+        else:
+            values = cp.zeros(
+                starts.size,
+                dtype=np.float64 if reduction == "mean" else edge_array.dtype,
+            )
+            cp.add.at(values, group_ids, edge_array)
+            if reduction == "mean":
+                values /= cp.diff(starts, append=keys.size)
+    else:
+        # Arbitrary Python function; copy to host once and call it per group
+        host_values = cp.asnumpy(edge_array).tolist()
+        bounds = itertools.pairwise([*cp.asnumpy(starts).tolist(), keys.size])
+        values = cp.array(
+            [multigraph_weight(host_values[start:stop]) for start, stop in bounds]
+        )
+    keys = keys[starts]
+    src_indices = (keys // N).astype(index_dtype)
+    dst_indices = (keys % N).astype(index_dtype)
+    return src_indices, dst_indices, values
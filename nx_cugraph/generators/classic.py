@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2023-2025, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 import itertools
 from numbers import Integral
@@ -10,6 +10,7 @@ import numpy as np
 import nx_cugraph as nxcg
 from nx_cugraph import _nxver
 
+from ..classes import CudaDiGraph, CudaMultiDiGraph, DiGraph, MultiDiGraph
 from ..utils import _get_int_dtype, index_dtype, networkx_algorithm
 from ._utils import (
     _IS_NX32_OR_LESS,
@@ -44,10 +45,10 @@ concat = itertools.chain.from_iterable
 _directed_graph_types = {
     nx.DiGraph,
     nx.MultiDiGraph,
-    nxcg.DiGraph,
-    nxcg.MultiDiGraph,
-    nxcg.CudaDiGraph,
-    nxcg.CudaMultiDiGraph,
+    DiGraph,
+    MultiDiGraph,
+    CudaDiGraph,
+    CudaMultiDiGraph,
 }
 
 
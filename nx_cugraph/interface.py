@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2023-2025, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
@@ -8,10 +8,33 @@ import re
 import networkx as nx
 
 import nx_cugraph as nxcg
+from _nx_cugraph import _info
 from nx_cugraph import _nxver
 
+_graph_classes = {"Graph", "DiGraph", "MultiGraph", "MultiDiGraph"}
 
-class BackendInterface:
+
+class _LazyBackendInterface(type):
+    """Import the rest of nx_cugraph when an algorithm is first accessed.
+
+    Algorithms are registered on ``BackendInterface`` by the ``networkx_algorithm``
+    decorator when their modules are imported. The names of all algorithms are
+    known from the static ``_nx_cugraph._info["functions"]`` table, so loading
+    the backend does not need to import CuPy or run the decorators.
+    """
+
+    def __getattr__(cls, name):
+        if name in _info["functions"] or name in _graph_classes:
+            nxcg._load_all()
+            if name in cls.__dict__:
+                return type.__getattribute__(cls, name)
+        raise AttributeError(f"type object {cls.__name__!r} has no attribute {name!r}")
+
+    def __dir__(cls):
+        return sorted(set(super().__dir__()) | _info["functions"] | _graph_classes)
+
+
+class BackendInterface(metaclass=_LazyBackendInterface):
     # Required conversions
     @staticmethod
     def convert_from_nx(graph, *args, **kwargs):
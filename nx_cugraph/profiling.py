@@ -0,0 +1,260 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION.
+# SPDX-License-Identifier: Apache-2.0
+"""Opt-in tracing of where time goes when calling nx-cugraph algorithms.
+
+Tracing is only done inside ``with nxcg.profile() as report:`` blocks. Outside of
+them, the instrumented functions only check whether any profile is active.
+"""
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import cupy as cp
+
+__all__ = ["ProfileReport", "profile"]
+
+# Phases of traced spans. The time of algorithm calls that is not spent in any
+# nested span is reported as "compute".
+_PHASES = ("convert", "plc_graph", "compute", "result", "to_networkx")
+_COUNTERS = (
+    "bytes_host_to_device",
+    "bytes_device_to_host",
+    "cache_hits",
+    "cache_misses",
+)
+
+_active_reports = []  # Reports of active `profile()` blocks
+_reports_lock = threading.Lock()
+_local = threading.local()  # Per-thread stack of open spans
+
+
+class ProfileReport:
+    """Events and counters recorded by ``nx_cugraph.profile``.
+
+    Attributes
+    ----------
+    events : list of dict
+        One dict per traced span in the order they finished, with keys "name",
+        "phase", "start" and "seconds" (from ``time.perf_counter``),
+        "self_seconds" (excluding nested spans), "thread", "depth", and "args".
+    counters : dict
+        Totals of "bytes_host_to_device", "bytes_device_to_host", "cache_hits",
+        and "cache_misses". Bytes are the sizes of the arrays being converted.
+    """
+
+    def __init__(self):
+        self.events = []
+        self.counters = dict.fromkeys(_COUNTERS, 0)
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<{type(self).__name__} with {len(self.events)} events>"
+
+    def _add_event(self, event):
+        with self._lock:
+            self.events.append(event)
+
+    def _add_counts(self, counts):
+        with self._lock:
+            for key, val in counts.items():
+                self.counters[key] = self.counters.get(key, 0) + val
+
+    def summary(self):
+        """Return total seconds per phase and per algorithm, and counters.
+
+        Returns
+        -------
+        dict
+            With keys "phases" (``{phase: {"count": int, "seconds": float}}``,
+            where seconds exclude nested spans), "calls" (``{name: {"count": int,
+            "seconds": float}}`` of algorithm calls including nested spans), and
+            the counters.
+        """
+        phases = {phase: {"count": 0, "seconds": 0.0} for phase in _PHASES}
+        calls = {}
+        with self._lock:
+            events = list(self.events)
+            rv = dict(self.counters)
+        for event in events:
+            phase = "compute" if event["phase"] == "call" else event["phase"]
+            info = phases.setdefault(phase, {"count": 0, "seconds": 0.0})
+            info["count"] += 1
+            info["seconds"] += event["self_seconds"]
+            if event["phase"] == "call":
+                info = calls.setdefault(event["name"], {"count": 0, "seconds": 0.0})
+                info["count"] += 1
+                info["seconds"] += event["seconds"]
+        rv["phases"] = phases
+        rv["calls"] = calls
+        return rv
+
+    def to_chrome_trace(self, path=None):
+        """Return (and optionally write) events in Chrome trace event format.
+
+        The result can be loaded by ``chrome://tracing`` or Perfetto.
+
+        Parameters
+        ----------
+        path : str or path-like, optional
+            File to write the JSON trace to.
+
+        Returns
+        -------
+        dict
+        """
+        pid = os.getpid()
+        with self._lock:
+            events = list(self.events)
+        trace = {
+            "traceEvents": [
+                {
+                    "name": event["name"],
+                    "cat": event["phase"],
+                    "ph": "X",
+                    "ts": event["start"] * 1e6,
+                    "dur": event["seconds"] * 1e6,
+                    "pid": pid,
+                    "tid": event["thread"],
+                    "args": event["args"],
+                }
+                for event in sorted(events, key=lambda event: event["start"])
+            ],
+            "displayTimeUnit": "ms",
+        }
+        if path is not None:
+            with Path(path).open("w") as f:
+                json.dump(trace, f)
+        return trace
+
+
+@contextlib.contextmanager
+def profile(*, chrome_trace=None):
+    """Trace nx-cugraph algorithm calls, conversions, and cache use in this block.
+
+    Algorithm calls, conversions to and from NetworkX graphs, creating
+    pylibcugraph graphs, and converting results to Python objects are timed.
+    Sizes of converted arrays and hits and misses of the conversion cache of
+    ``nx_cugraph`` graphs are counted. Calls from all threads are recorded.
+
+    GPU work is asynchronous, so the current CUDA stream is synchronized when
+    traced spans start and end. Device work is thus timed in the span that
+    launched it, but code runs slower while profiling, and work on other
+    streams may still be timed in later spans.
+
+    Parameters
+    ----------
+    chrome_trace : str or path-like, optional
+        File to write the events to as Chrome trace JSON when the block exits.
+
+    Yields
+    ------
+    ProfileReport
+
+    Examples
+    --------
+    >>> with nxcg.profile() as report:  # doctest: +SKIP
+    ...     nx.pagerank(G, backend="cugraph")
+    >>> report.summary()["phases"]["convert"]  # doctest: +SKIP
+    {'count': 1, 'seconds': 0.0123}
+    """
+    report = ProfileReport()
+    with _reports_lock:
+        _active_reports.append(report)
+    try:
+        yield report
+    finally:
+        with _reports_lock:
+            _active_reports.remove(report)
+        if chrome_trace is not None:
+            report.to_chrome_trace(chrome_trace)
+
+
+def _is_profiling():
+    return bool(_active_reports)
+
+
+def _span_stack():
+    if (stack := getattr(_local, "stack", None)) is None:
+        stack = _local.stack = []
+    return stack
+
+
+@contextlib.contextmanager
+def _span(name, phase, **args):
+    """Time a span of ``phase`` if profiling; yield its mutable args or None."""
+    reports = list(_active_reports)
+    if not reports:
+        yield None
+        return
+    stack = _span_stack()
+    span = {"args": args, "child_seconds": 0.0}
+    stack.append(span)
+    # Wait for queued device work so it's timed in the span that launched it
+    cp.cuda.get_current_stream().synchronize()
+    start = time.perf_counter()
+    try:
+        yield args
+    finally:
+        cp.cuda.get_current_stream().synchronize()
+        seconds = time.perf_counter() - start
+        stack.pop()
+        if stack:
+            stack[-1]["child_seconds"] += seconds
+        event = {
+            "name": name,
+            "phase": phase,
+            "start": start,
+            "seconds": seconds,
+            "self_seconds": max(seconds - span["child_seconds"], 0.0),
+            "thread": threading.get_ident(),
+            "depth": len(stack),
+            "args": args,
+        }
+        for report in reports:
+            report._add_event(event)
+
+
+def _count(**counts):
+    """Add to counters of active profiles and to the args of the current span."""
+    if not _active_reports:
+        return
+    if stack := getattr(_local, "stack", None):
+        args = stack[-1]["args"]
+        for key, val in counts.items():
+            args[key] = args.get(key, 0) + val
+    for report in _active_reports:
+        report._add_counts(counts)
+
+
+def _device_nbytes(*arrays):
+    return sum(
+        array.nbytes for array in arrays if hasattr(array, "__cuda_array_interface__")
+    )
+
+
+def _traced(phase, *, device_to_host=False):
+    """Decorate a function to trace it as ``phase`` when profiling.
+
+    If ``device_to_host`` is True, the sizes of device array arguments are
+    counted as bytes copied from device to host.
+    """
+
+    def decorator(func):
+        name = func.__qualname__
+
+        @functools.wraps(func)
+        def inner(*args, **kwargs):
+            if not _active_reports:
+                return func(*args, **kwargs)
+            with _span(name, phase):
+                if device_to_host:
+                    _count(bytes_device_to_host=_device_nbytes(*args, *kwargs.values()))
+                return func(*args, **kwargs)
+
+        return inner
+
+    return decorator
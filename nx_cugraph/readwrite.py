@@ -0,0 +1,356 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION.
+# SPDX-License-Identifier: Apache-2.0
+"""Read edge lists from Arrow tables and Parquet or CSV files into graphs.
+
+Data is read one record batch (or Parquet row group, or file) at a time. Node
+keys of each batch are renumbered as they arrive, so a full copy of the edge
+list is never held on the host. The renumbered edges are written into device
+buffers that are allocated once.
+"""
+import collections
+import itertools
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cupy as cp
+import networkx as nx
+import numpy as np
+
+from .convert_matrix import _edge_column_to_arrays, _edgelist_to_graph
+from .generators._utils import _create_using_class
+from .renumber import NodeRenumberer
+from .utils import index_dtype
+
+__all__ = [
+    "from_arrow_edgelist",
+    "read_edgelist_files",
+    "read_parquet_edgelist",
+]
+
+
+def _attr_names(edge_attr, names, source, target):
+    """Get the names of edge attribute columns like ``from_pandas_edgelist``."""
+    if edge_attr is None:
+        return []
+    if edge_attr is True:
+        attr_names = [name for name in names if name not in {source, target}]
+    elif isinstance(edge_attr, (list, tuple)):
+        attr_names = list(edge_attr)
+    else:
+        attr_names = [edge_attr]
+    if len(attr_names) == 0:
+        raise nx.NetworkXError(
+            f"Invalid edge_attr argument: No columns found with name: {attr_names}"
+        )
+    if missing := set(attr_names) - set(names):
+        raise nx.NetworkXError(f"Invalid edge_attr argument: {edge_attr}; {missing}")
+    return attr_names
+
+
+def _from_arrow_batches(batches, num_rows, source, target, attr_names, create_using):
+    graph_class, inplace = _create_using_class(create_using)
+    renumberer = NodeRenumberer()
+    src_indices = cp.empty(num_rows, dtype=index_dtype)
+    dst_indices = cp.empty(num_rows, dtype=index_dtype)
+    edge_values = {}
+    edge_masks = {}
+    start = 0
+    for batch in batches:
+        stop = start + batch.num_rows
+        ids = renumberer.encode(
+            np.concatenate(
+                [np.asarray(batch.column(source)), np.asarray(batch.column(target))]
+            )
+        )
+        src_indices[start:stop] = cp.asarray(ids[: batch.num_rows])
+        dst_indices[start:stop] = cp.asarray(ids[batch.num_rows :])
+        for name in attr_names:
+            values, mask = _edge_column_to_arrays(batch.column(name))
+            if name not in edge_values:
+                edge_values[name] = cp.empty(num_rows, dtype=values.dtype)
+            elif values.dtype != edge_values[name].dtype:
+                # Don't silently cast values, which may truncate them
+                raise TypeError(
+                    f"Edge attribute {name!r} has dtype {values.dtype} in a later "
+                    f"batch, but {edge_values[name].dtype} in the first batch"
+                )
+            edge_values[name][start:stop] = values
+            if mask is not None:
+                if name not in edge_masks:
+                    edge_masks[name] = cp.ones(num_rows, dtype=bool)
+                edge_masks[name][start:stop] = mask
+        start = stop
+    if start != num_rows:
+        raise ValueError(f"Expected {num_rows} rows; got {start}")
+    G = _edgelist_to_graph(
+        graph_class,
+        len(renumberer),
+        src_indices,
+        dst_indices,
+        edge_values,
+        edge_masks,
+        None if renumberer.is_identity else renumberer.id_to_key,
+    )
+    if inplace:
+        return create_using._become(G)
+    return G
+
+
+def from_arrow_edgelist(
+    table, source="source", target="target", edge_attr=None, *, create_using=None
+):
+    """Create a graph from an edge list in a ``pyarrow.Table`` or ``RecordBatch``.
+
+    Columns are read directly from Arrow one record batch at a time without
+    creating a DataFrame. Nulls in edge attribute columns become missing edge
+    attributes. Parameters are the same as ``from_pandas_edgelist``.
+
+    Parameters
+    ----------
+    table : pyarrow.Table or pyarrow.RecordBatch
+    source, target : str
+        Names of the columns with source and target nodes.
+    edge_attr : str, list of str, True, or None
+        Names of columns to use as edge attributes, or True for all other columns.
+    create_using : graph type or instance, optional
+        The type of graph to create. Default is ``nx_cugraph.Graph``.
+
+    Returns
+    -------
+    Graph
+
+    See Also
+    --------
+    from_edgelist_arrays
+    read_parquet_edgelist
+    """
+    attr_names = _attr_names(edge_attr, table.schema.names, source, target)
+    batches = table.to_batches() if hasattr(table, "to_batches") else [table]
+    return _from_arrow_batches(
+        batches, table.num_rows, source, target, attr_names, create_using
+    )
+
+
+def read_parquet_edgelist(
+    path, source="source", target="target", edge_attr=None, *, create_using=None
+):
+    """Read a graph from an edge list in a Parquet file.
+
+    Only the needed columns are read, one row group at a time, and node keys are
+    renumbered incrementally as row groups are read.
+
+    Parameters
+    ----------
+    path : str, path-like, or file-like
+    source, target : str
+        Names of the columns with source and target nodes.
+    edge_attr : str, list of str, True, or None
+        Names of columns to use as edge attributes, or True for all other columns.
+    create_using : graph type or instance, optional
+        The type of graph to create. Default is ``nx_cugraph.Graph``.
+
+    Returns
+    -------
+    Graph
+
+    See Also
+    --------
+    from_arrow_edgelist
+    """
+    import pyarrow.parquet as pq
+
+    pf = pq.ParquetFile(path)
+    attr_names = _attr_names(edge_attr, pf.schema_arrow.names, source, target)
+    columns = [source, target, *attr_names]
+    batches = (pf.read_row_group(i, columns=columns) for i in range(pf.num_row_groups))
+    return _from_arrow_batches(
+        batches, pf.metadata.num_rows, source, target, attr_names, create_using
+    )
+
+
+def _file_format(path, format):
+    if format is not None:
+        if format not in {"csv", "tsv", "parquet"}:
+            raise ValueError(
+                f'format must be "csv", "tsv", "parquet", or None; got {format}'
+            )
+        return format
+    suffixes = [suffix.lower() for suffix in os.fspath(path).split(".")[1:]]
+    if suffixes and suffixes[-1] in {"gz", "bz2", "zst", "lz4"}:
+        # Compressed CSV files such as "edges.csv.gz"
+        suffixes = suffixes[:-1]
+    if suffixes and suffixes[-1] in {"parquet", "pq"}:
+        return "parquet"
+    if suffixes and suffixes[-1] in {"csv", "tsv"}:
+        return suffixes[-1]
+    raise ValueError(f"Unable to determine file format of {path!r}; use `format=`")
+
+
+def _read_table(path, format, columns):
+    if format == "parquet":
+        import pyarrow.parquet as pq
+
+        return pq.read_table(path, columns=columns)
+    import pyarrow.csv as pa_csv
+
+    return pa_csv.read_csv(
+        path,
+        parse_options=pa_csv.ParseOptions(delimiter="\t" if format == "tsv" else ","),
+        convert_options=pa_csv.ConvertOptions(include_columns=columns),
+    )
+
+
+def _unify_schemas(schemas, columns):
+    """Return the schema of ``columns`` that tables of all ``schemas`` cast to.
+
+    Types are inferred per CSV file, so for example a column may be integers in
+    one file and floats in another; these are promoted to a common type.
+    """
+    import pyarrow as pa
+
+    if columns is not None:
+        schemas = [
+            pa.schema([schema.field(name) for name in columns if name in schema.names])
+            for schema in schemas
+        ]
+    return pa.unify_schemas(schemas, promote_options="permissive")
+
+
+def _read_in_order(paths, formats, columns, workers):
+    """Read tables concurrently and yield them in the order of ``paths``.
+
+    At most ``2 * workers`` tables are read ahead of the consumer.
+    """
+    with ThreadPoolExecutor(workers) as executor:
+        it = zip(paths, formats)
+        pending = collections.deque(
+            executor.submit(_read_table, path, fmt, columns)
+            for path, fmt in itertools.islice(it, 2 * workers)
+        )
+        while pending:
+            table = pending.popleft().result()
+            for path, fmt in itertools.islice(it, 1):
+                pending.append(executor.submit(_read_table, path, fmt, columns))
+            yield table
+
+
+def _report_progress(tables, paths, num_rows, progress):
+    """Call ``progress`` after each table has been consumed."""
+    start_time = time.perf_counter()
+    rows_done = 0
+    for files_done, (path, table) in enumerate(zip(paths, tables), 1):
+        yield table
+        rows_done += table.num_rows
+        seconds = time.perf_counter() - start_time
+        progress(
+            {
+                "path": path,
+                "files_done": files_done,
+                "files_total": len(paths),
+                "rows_done": rows_done,
+                "rows_total": num_rows,
+                "seconds": seconds,
+                "rows_per_second": rows_done / seconds if seconds > 0 else float("inf"),
+            }
+        )
+
+
+def read_edgelist_files(
+    paths,
+    source="source",
+    target="target",
+    edge_attr=None,
+    *,
+    create_using=None,
+    workers=None,
+    format=None,
+    progress=None,
+):
+    """Read a graph from an edge list split across many Parquet or CSV files.
+
+    Files are read concurrently by a thread pool. Node keys of every file are
+    encoded through one shared renumbering index (in the order of ``paths``, so
+    results are deterministic), and edges are copied into device buffers that
+    are allocated once for the total number of rows.
+
+    The number of rows of Parquet files is known from their metadata, so they
+    are read a few at a time. CSV files are all read before the graph is built.
+
+    Parameters
+    ----------
+    paths : str, path-like, or list of them
+        Files to read. Format is determined by file extension unless given.
+    source, target : str
+        Names of the columns with source and target nodes.
+    edge_attr : str, list of str, True, or None
+        Names of columns to use as edge attributes, or True for all other columns.
+    create_using : graph type or instance, optional
+        The type of graph to create. Default is ``nx_cugraph.Graph``.
+    workers : int, optional
+        Maximum number of threads used to read files. Default is the default of
+        ``concurrent.futures.ThreadPoolExecutor``.
+    format : {"parquet", "csv", "tsv"}, optional
+        Format of all files. By default, files ending with ".parquet" or ".pq"
+        are Parquet, and files ending with ".csv" or ".tsv" (optionally
+        compressed) are comma- or tab-separated.
+    progress : callable, optional
+        Called with a dict after each file is added to the graph. The dict has
+        keys "path", "files_done", "files_total", "rows_done", "rows_total",
+        "seconds", and "rows_per_second".
+
+    Returns
+    -------
+    Graph
+
+    See Also
+    --------
+    read_parquet_edgelist
+    from_arrow_edgelist
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    paths = list(paths)
+    if len(paths) == 0:
+        raise ValueError("No files to read")
+    formats = [_file_format(path, format) for path in paths]
+    if workers is None:
+        workers = min(32, (os.cpu_count() or 1) + 4)
+    elif workers < 1:
+        raise ValueError(f"workers must be a positive integer; got {workers}")
+    if edge_attr is True:
+        columns = None
+    elif edge_attr is None:
+        columns = [source, target]
+    elif isinstance(edge_attr, (list, tuple)):
+        columns = [source, target, *edge_attr]
+    else:
+        columns = [source, target, edge_attr]
+
+    tables = _read_in_order(paths, formats, columns, workers)
+    if all(fmt == "parquet" for fmt in formats):
+        import pyarrow.parquet as pq
+
+        metadata = [pq.read_metadata(path) for path in paths]
+        num_rows = sum(md.num_rows for md in metadata)
+        schemas = [md.schema.to_arrow_schema() for md in metadata]
+    else:
+        # The number of rows in CSV files is not known until they are read
+        tables = list(tables)
+        num_rows = sum(table.num_rows for table in tables)
+        schemas = [table.schema for table in tables]
+    schema = _unify_schemas(schemas, columns)
+    if progress is not None:
+        tables = _report_progress(tables, paths, num_rows, progress)
+    attr_names = _attr_names(edge_attr, schema.names, source, target)
+    return _from_arrow_batches(
+        (
+            table if table.schema == schema else table.select(schema.names).cast(schema)
+            for table in tables
+        ),
+        num_rows,
+        source,
+        target,
+        attr_names,
+        create_using,
+    )
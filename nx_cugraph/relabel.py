@@ -1,7 +1,6 @@
-# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 import itertools
-from collections import defaultdict
 
 import cupy as cp
 import networkx as nx
@@ -9,7 +8,7 @@ import numpy as np
 
 import nx_cugraph as nxcg
 
-from .utils import _get_int_dtype, _groupby, index_dtype, networkx_algorithm
+from .utils import _get_int_dtype, index_dtype, networkx_algorithm
 
 __all__ = [
     "convert_node_labels_to_integers",
@@ -17,8 +16,181 @@ __all__ = [
 ]
 
 
+def _node_keys_array(G):
+    """Return an array of node keys indexed by node id."""
+    if G.key_to_id is None:
+        return np.arange(G._N)
+    id_to_key = G.id_to_key
+    try:
+        keys = np.array(id_to_key)
+    except ValueError:
+        keys = None
+    if keys is None or keys.ndim != 1 or keys.dtype.kind not in {"i", "u", "f", "b"}:
+        # Avoid NumPy coercing e.g. tuples or mixed types
+        keys = np.fromiter(id_to_key, object, G._N)
+    return keys
+
+
+def _mapping_to_array(G, mapping):
+    """Return new node keys indexed by node id, or None if mapping is not array-like.
+
+    Array-like mappings are NumPy or CuPy arrays indexed by (integer) node keys,
+    pandas or cuDF Series indexed by node keys, or an integer offset.
+    """
+    if isinstance(mapping, (int, np.integer)) and not isinstance(mapping, bool):
+        keys = _node_keys_array(G)
+        if keys.dtype.kind not in {"i", "u"}:
+            raise TypeError("Integer offset mapping requires integer node keys")
+        return keys + mapping
+    if isinstance(mapping, (np.ndarray, cp.ndarray)):
+        if mapping.ndim != 1:
+            raise ValueError(f"Array mapping must be 1-d; got {mapping.ndim} dims")
+        keys = _node_keys_array(G)
+        if keys.dtype.kind not in {"i", "u"}:
+            raise TypeError("Array mapping requires integer node keys")
+        if keys.size > 0 and (keys.min() < 0 or keys.max() >= mapping.size):
+            raise IndexError(
+                f"Array mapping of size {mapping.size} is too small for node keys "
+                f"in the range [{keys.min()}, {keys.max()}]"
+            )
+        if isinstance(mapping, cp.ndarray):
+            keys = cp.asarray(keys)
+        return mapping[keys]
+    if hasattr(mapping, "to_pandas") and hasattr(mapping, "index"):
+        # cudf.Series
+        mapping = mapping.to_pandas()
+    if hasattr(mapping, "to_numpy") and hasattr(
+        getattr(mapping, "index", None), "get_indexer"
+    ):
+        # pandas.Series; nodes not in the index keep their keys like ``dict.get``
+        keys = _node_keys_array(G)
+        indexer = mapping.index.get_indexer(keys)
+        is_found = indexer >= 0
+        if is_found.all():
+            return mapping.to_numpy()[indexer]
+        if not is_found.any():
+            # Such as an empty Series
+            return keys
+        # ``get_indexer`` gives -1 for missing keys, so only index found keys
+        values = mapping.to_numpy()[indexer[is_found]]
+        if values.dtype != keys.dtype:
+            values = values.astype(object)
+            keys = keys.astype(object)
+        keys[is_found] = values
+        return keys
+    return None
+
+
+def _relabeled_ids(previd_to_key):
+    """Compute new node ids from new node keys indexed by previous node ids.
+
+    Nodes with the same new key are merged and numbered by first occurrence.
+    Returns the new number of nodes, ``newid_to_key`` (None if keys are the ids),
+    ``key_to_newid`` (may be None), the previous id to take node data from for
+    each new id, and ``previd -> newid`` translations. The last two are None if
+    node ids do not change.
+    """
+    N = len(previd_to_key)
+    if isinstance(previd_to_key, list):
+        key_to_previd = {val: i for i, val in enumerate(previd_to_key)}
+        newid_to_key = list(key_to_previd)
+        key_to_newid = dict(zip(newid_to_key, range(len(newid_to_key))))
+        if len(key_to_previd) == N:
+            return N, newid_to_key, key_to_newid, None, None
+        # Node data doesn't get merged, so use the data from the last shared index
+        node_indices = np.fromiter(key_to_previd.values(), _get_int_dtype(N - 1))
+        translations = cp.fromiter(
+            (key_to_newid[key] for key in previd_to_key), index_dtype
+        )
+        return (
+            len(key_to_previd),
+            newid_to_key,
+            key_to_newid,
+            node_indices,
+            translations,
+        )
+    xp = cp.get_array_module(previd_to_key)
+    try:
+        uniq, first_index, inverse = xp.unique(
+            previd_to_key, return_index=True, return_inverse=True
+        )
+    except TypeError:
+        # Unorderable keys; use dicts
+        return _relabeled_ids(cp.asnumpy(previd_to_key).tolist())
+    M = uniq.size
+    inverse = inverse.ravel()
+    # Node data doesn't get merged, so use the data from the last shared index
+    last_index = xp.zeros(M, dtype=np.int64)
+    xp.maximum.at(last_index, inverse, xp.arange(N))
+    if previd_to_key.dtype.kind in {"i", "u"} and (
+        M == 0 or uniq[0] == 0 and uniq[M - 1] == M - 1
+    ):
+        # New keys are 0..M-1, so use them as the new ids
+        if M == N and (previd_to_key == xp.arange(N)).all():
+            return N, None, None, None, None
+        translations = cp.asarray(previd_to_key, dtype=index_dtype)
+        return M, None, None, cp.asnumpy(last_index), translations
+    if M == N:
+        # No nodes were merged, so ids don't change
+        return N, previd_to_key.tolist(), None, None, None
+    # Number new keys by first occurrence to match networkx
+    order = xp.argsort(first_index)
+    newid_of_uniq = xp.empty(M, dtype=np.int64)
+    newid_of_uniq[order] = xp.arange(M)
+    translations = cp.asarray(newid_of_uniq[inverse], dtype=index_dtype)
+    node_indices = cp.asnumpy(last_index[order])
+    return M, uniq[order].tolist(), None, node_indices, translations
+
+
+def _renumber_colliding_edge_indices(src_indices, dst_indices, edge_indices):
+    """Make ``(src, dst, edge_index)`` unique by incrementing colliding indices.
+
+    Only edges between node pairs that have collisions are checked in Python.
+    """
+    if edge_indices.size == 0:
+        return edge_indices
+    order = cp.lexsort(cp.vstack((edge_indices, dst_indices, src_indices)))
+    triples = cp.vstack((src_indices, dst_indices, edge_indices))[:, order]
+    is_dup = (triples[:, 1:] == triples[:, :-1]).all(axis=0)
+    if not is_dup.any():
+        return edge_indices
+    # Check all edges that connect the same nodes as an edge with a collision
+    dup_pairs = triples[:2, 1:][:, is_dup]
+    N = int(max(src_indices.max(), dst_indices.max())) + 1
+    pair_ids = src_indices.astype(np.int64) * N + dst_indices
+    check = cp.isin(pair_ids, dup_pairs[0].astype(np.int64) * N + dup_pairs[1])
+    positions = cp.nonzero(check)[0]
+    seen = set()
+    new_edge_indices = []
+    for key in zip(
+        src_indices[positions].tolist(),
+        dst_indices[positions].tolist(),
+        edge_indices[positions].tolist(),
+    ):
+        if key in seen:
+            src, dst, edge_index = key
+            for edge_index in itertools.count(edge_index):
+                if (src, dst, edge_index) not in seen:
+                    seen.add((src, dst, edge_index))
+                    break
+        else:
+            seen.add(key)
+            edge_index = key[2]
+        new_edge_indices.append(edge_index)
+    edge_indices = edge_indices.copy()
+    edge_indices[positions] = cp.array(new_edge_indices, index_dtype)
+    return edge_indices
+
+
 @networkx_algorithm(version_added="24.08")
 def relabel_nodes(G, mapping, copy=True):
+    """Array-like mappings are relabeled with vectorized operations.
+
+    ``mapping`` may also be an integer offset to add to integer node keys, a NumPy
+    or CuPy array indexed by integer node keys, or a pandas or cuDF Series indexed
+    by node keys (nodes not in the index keep their keys). When the new keys are
+    the integers ``0..N-1``, they are used as node ids, so nodes are ordered by key.
+    """
     G_orig = G
     if isinstance(G, nx.Graph):
         is_compat_graph = isinstance(G, nxcg.Graph)
@@ -31,23 +203,29 @@ def relabel_nodes(G, mapping, copy=True):
     else:
         is_compat_graph = False
 
-    it = range(G._N) if G.key_to_id is None else G.id_to_key
-    if callable(mapping):
-        previd_to_key = [mapping(node) for node in it]
-    else:
-        previd_to_key = [mapping.get(node, node) for node in it]
+    previd_to_key = _mapping_to_array(G, mapping)
+    if previd_to_key is None:
+        it = range(G._N) if G.key_to_id is None else G.id_to_key
+        if callable(mapping):
+            previd_to_key = [mapping(node) for node in it]
+        else:
+            previd_to_key = [mapping.get(node, node) for node in it]
     if not copy:
         # Our implementation does not need to raise here, but do so to match networkx.
         it = range(G._N) if G.key_to_id is None else G.id_to_key
-        D = nx.DiGraph([(x, y) for x, y in zip(it, previd_to_key) if x != y])
+        if not isinstance(previd_to_key, list):
+            new_keys = cp.asnumpy(previd_to_key).tolist()
+        else:
+            new_keys = previd_to_key
+        D = nx.DiGraph([(x, y) for x, y in zip(it, new_keys) if x != y])
         if nx.algorithms.dag.has_cycle(D):
             raise nx.NetworkXUnfeasible(
                 "The node label sets are overlapping and no ordering can "
                 "resolve the mapping. Use copy=True."
             )
-    key_to_previd = {val: i for i, val in enumerate(previd_to_key)}
-    newid_to_key = list(key_to_previd)
-    key_to_newid = dict(zip(newid_to_key, range(len(newid_to_key))))
+    N, newid_to_key, key_to_newid, node_indices, translations = _relabeled_ids(
+        previd_to_key
+    )
 
     src_indices = G.src_indices
     dst_indices = G.dst_indices
@@ -58,19 +236,17 @@ def relabel_nodes(G, mapping, copy=True):
     if G.is_multigraph():
         edge_indices = G.edge_indices
         edge_keys = G.edge_keys
-    if len(key_to_previd) != G._N:
+    if node_indices is not None:
+        # Node data may be cupy or numpy arrays
+        node_values = {key: val[node_indices] for key, val in node_values.items()}
+        node_masks = {key: val[node_indices] for key, val in node_masks.items()}
+    if translations is not None and N == G._N:
+        # Nodes were permuted, but not merged
+        src_indices = translations[src_indices]
+        dst_indices = translations[dst_indices]
+    elif translations is not None:
         # Some nodes were combined.
-        # Node data doesn't get merged, so use the data from the last shared index
-        int_dtype = _get_int_dtype(G._N - 1)
-        node_indices = cp.fromiter(key_to_previd.values(), int_dtype)
-        node_indices_np = node_indices.get()  # Node data may be cupy or numpy arrays
-        node_values = {key: val[node_indices_np] for key, val in node_values.items()}
-        node_masks = {key: val[node_indices_np] for key, val in node_masks.items()}
-
         # Renumber, but will have duplicates
-        translations = cp.fromiter(
-            (key_to_newid[key] for key in previd_to_key), index_dtype
-        )
         src_indices_dup = translations[src_indices]
         dst_indices_dup = translations[dst_indices]
 
@@ -105,7 +281,7 @@ def relabel_nodes(G, mapping, copy=True):
                         ]
                     if edge_indices is not None:
                         edge_indices = edge_indices[mask]
-            # Handling of `edge_keys` and `edge_indices` is pure Python to match nx.
+            # Handling of `edge_keys` is pure Python to match nx.
             # This may be slower than we'd like; if it's way too slow, should we
             # direct users to use the defaults of None?
             if edge_keys is not None:
@@ -126,82 +302,36 @@ def relabel_nodes(G, mapping, copy=True):
                     new_edge_keys.append(edge_key)
                 edge_keys = new_edge_keys
             if edge_indices is not None:
-                # PERF: can we do this using cupy?
-                seen = set()
-                new_edge_indices = []
-                for key in zip(
-                    src_indices.tolist(), dst_indices.tolist(), edge_indices.tolist()
-                ):
-                    if key in seen:
-                        src, dst, edge_index = key
-                        for edge_index in itertools.count(edge_index):
-                            if (src, dst, edge_index) not in seen:
-                                seen.add((src, dst, edge_index))
-                                break
-                    else:
-                        seen.add(key)
-                        edge_index = key[2]
-                    new_edge_indices.append(edge_index)
-                edge_indices = cp.array(new_edge_indices, index_dtype)
+                edge_indices = _renumber_colliding_edge_indices(
+                    src_indices, dst_indices, edge_indices
+                )
         else:
             stacked_dup = cp.vstack((src_indices_dup, dst_indices_dup))
             if not edge_values:
                 # Drop duplicates
                 stacked = cp.unique(stacked_dup, axis=1)
             else:
-                # Drop duplicates. This relies heavily on `_groupby`.
-                # It has not been compared to alternative implementations.
-                # I wonder if there are ways to use assignment using duplicate indices.
+                # Drop duplicates and merge edge data: the last value (that is not
+                # masked) of duplicate edges wins.
                 (stacked, ind, inv) = cp.unique(
                     stacked_dup, axis=1, return_index=True, return_inverse=True
                 )
-                if ind.dtype != int_dtype:
-                    ind = ind.astype(int_dtype)
-                if inv.dtype != int_dtype:
-                    inv = inv.astype(int_dtype)
-
-                # We need to merge edge data
-                mask = cp.ones(src_indices.size, dtype=bool)
-                mask[ind] = False
-                edge_data = [val[mask] for val in edge_values.values()]
-                edge_data.extend(val[mask] for val in edge_masks.values())
-                groups = _groupby(inv[mask], edge_data)
-
-                edge_values = {key: val[ind] for key, val in edge_values.items()}
-                edge_masks = {key: val[ind] for key, val in edge_masks.items()}
-
-                value_keys = list(edge_values.keys())
-                mask_keys = list(edge_masks.keys())
-
-                values_to_update = defaultdict(list)
-                masks_to_update = defaultdict(list)
-                for k, v in groups.items():
-                    it = iter(v)
-                    vals = dict(zip(value_keys, it))  # zip(strict=False)
-                    masks = dict(zip(mask_keys, it))  # zip(strict=True)
-                    for key, val in vals.items():
-                        if key in masks:
-                            val = val[masks[key]]
-                            if val.size > 0:
-                                values_to_update[key].append((k, val[-1]))
-                                masks_to_update[key].append((k, True))
-                        else:
-                            values_to_update[key].append((k, val[-1]))
-                            if key in edge_masks:
-                                masks_to_update[key].append((k, True))
-
-                int_dtype = _get_int_dtype(src_indices.size - 1)
-                for k, v in values_to_update.items():
-                    ii, jj = zip(*v)
-                    edge_val = edge_values[k]
-                    edge_val[cp.array(ii, dtype=int_dtype)] = cp.array(
-                        jj, dtype=edge_val.dtype
-                    )
-                for k, v in masks_to_update.items():
-                    ii, jj = zip(*v)
-                    edge_masks[k][cp.array(ii, dtype=int_dtype)] = cp.array(
-                        jj, dtype=bool
-                    )
+                inv = inv.ravel()
+                positions = cp.arange(src_indices.size)
+                new_edge_values = {}
+                new_edge_masks = {}
+                for key, val in edge_values.items():
+                    last_index = cp.full(ind.size, -1, dtype=np.int64)
+                    if (mask := edge_masks.get(key)) is None:
+                        cp.maximum.at(last_index, inv, positions)
+                        new_edge_values[key] = val[last_index]
+                    else:
+                        cp.maximum.at(last_index, inv[mask], positions[mask])
+                        has_value = last_index >= 0
+                        new_edge_values[key] = val[cp.where(has_value, last_index, ind)]
+                        new_edge_masks[key] = has_value
+                edge_values = new_edge_values
+                edge_masks = new_edge_masks
             src_indices = stacked[0]
             dst_indices = stacked[1]
 
@@ -211,7 +341,7 @@ def relabel_nodes(G, mapping, copy=True):
     else:
         extra_kwargs = {}
     rv = G.__class__.from_coo(
-        len(key_to_previd),
+        N,
         src_indices,
         dst_indices,
         edge_values=edge_values,
@@ -230,10 +360,38 @@ def relabel_nodes(G, mapping, copy=True):
     return rv
 
 
+def _degree_ordering(G, ordering):
+    """Return node ids sorted by ``(degree, node)`` like networkx."""
+    degrees = G._degrees_array()
+    if not G.is_directed() and G._has_selfloops():
+        # networkx counts self-loops twice in undirected graphs
+        is_selfloop = G.src_indices == G.dst_indices
+        degrees = degrees + cp.bincount(G.src_indices[is_selfloop], minlength=G._N)
+    if G.key_to_id is None:
+        key_ranks = cp.arange(G._N, dtype=index_dtype)
+    else:
+        try:
+            key_order = np.argsort(_node_keys_array(G), kind="stable")
+        except TypeError:
+            # Unorderable keys, which are only compared to break ties in degree
+            pairs = sorted(zip(degrees.tolist(), G.id_to_key, range(G._N)))
+            order = cp.array([i for _, _, i in pairs], dtype=index_dtype)
+            return order[::-1] if ordering == "decreasing degree" else order
+        key_ranks = cp.empty(G._N, dtype=index_dtype)
+        key_ranks[cp.asarray(key_order)] = cp.arange(G._N, dtype=index_dtype)
+    order = cp.lexsort(cp.vstack((key_ranks, degrees)))
+    return order[::-1] if ordering == "decreasing degree" else order
+
+
 @networkx_algorithm(version_added="24.08")
 def convert_node_labels_to_integers(
     G, first_label=0, ordering="default", label_attribute=None
 ):
+    """Orderings are computed on the GPU and applied by renumbering the graph.
+
+    Nodes are ordered by their new labels, so iteration order may differ from
+    networkx for orderings other than "default".
+    """
     if ordering not in {"default", "sorted", "increasing degree", "decreasing degree"}:
         raise nx.NetworkXError(f"Unknown node ordering: {ordering}")
     if isinstance(G, nx.Graph):
@@ -258,26 +416,22 @@ def convert_node_labels_to_integers(
                     pass
         G.node_values[label_attribute] = prev_vals
         G.node_masks.pop(label_attribute, None)
-    id_to_key = None
-    if ordering == "default" or ordering == "sorted" and G.key_to_id is None:
-        if first_label == 0:
-            G.key_to_id = None
-        else:
-            id_to_key = list(range(first_label, first_label + G._N))
-            G.key_to_id = dict(zip(id_to_key, range(G._N)))
-    elif ordering == "sorted":
-        key_to_id = G.key_to_id
-        G.key_to_id = {
-            i: key_to_id[n] for i, n in enumerate(sorted(key_to_id), first_label)
-        }
+    if ordering == "sorted" and G.key_to_id is not None:
+        order = np.argsort(_node_keys_array(G), kind="stable")
+    elif ordering in {"increasing degree", "decreasing degree"}:
+        order = _degree_ordering(G, ordering)
     else:
-        pairs = sorted(
-            ((d, n) for (n, d) in G._nodearray_to_dict(G._degrees_array()).items()),
-            reverse=ordering == "decreasing degree",
-        )
-        key_to_id = G.key_to_id
-        G.key_to_id = {i: key_to_id[n] for i, (d, n) in enumerate(pairs, first_label)}
-    G._id_to_key = id_to_key
+        order = None
+    if order is None:
+        G.key_to_id = None
+        G._id_to_key = None
+    else:
+        # Node ids become the new labels, so renumber edges and node data
+        G._permute_nodes(order, keep_keys=False)
+    if first_label != 0:
+        id_to_key = list(range(first_label, first_label + G._N))
+        G.key_to_id = dict(zip(id_to_key, range(G._N)))
+        G._id_to_key = id_to_key
     if is_compat_graph:
         return G._to_compat_graph()
     return G
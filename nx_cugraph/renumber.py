@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION.
+# SPDX-License-Identifier: Apache-2.0
+import cupy as cp
+import numpy as np
+
+__all__ = ["NodeRenumberer"]
+
+
+class NodeRenumberer:
+    """Incrementally map node keys to dense integer ids ``0..N-1``.
+
+    Use this to renumber batches of node keys as they arrive, such as when
+    streaming an edge list. Keys get the next ids the first time they are seen
+    (new keys within one batch are numbered in sorted order), and ids of known
+    keys never change. The resulting ``id_to_key`` or
+    ``key_to_id`` may be passed to ``from_coo`` and ``from_csr`` graph methods.
+
+    Known keys are kept in a sorted array so that batches are encoded with
+    vectorized ``searchsorted``. New keys first go into a small overflow hash map
+    and are merged into the sorted array once there are more than
+    ``merge_threshold`` of them, so adding a few keys at a time is cheap.
+
+    Parameters
+    ----------
+    keys : array-like, optional
+        Initial keys to encode.
+    merge_threshold : int, optional
+        Maximum number of keys in the overflow hash map before they are merged
+        into the sorted array. Default is the larger of 65536 and 1/8 of the
+        number of keys.
+
+    Examples
+    --------
+    >>> renumberer = NodeRenumberer()
+    >>> renumberer.encode(["b", "a", "b"])
+    array([1, 0, 1])
+    >>> renumberer.encode(["c", "a"])
+    array([2, 0])
+    >>> renumberer.id_to_key
+    ['a', 'b', 'c']
+    """
+
+    def __init__(self, keys=None, *, merge_threshold=None):
+        if merge_threshold is not None and merge_threshold < 0:
+            raise ValueError(
+                f"merge_threshold must be non-negative; got {merge_threshold}"
+            )
+        self.merge_threshold = merge_threshold
+        self._keys = None  # sorted unique keys
+        self._ids = None  # id of each key in `_keys`
+        self._overflow = {}  # new keys not yet in `_keys`: {key: id}
+        self._overflow_keys = []  # arrays of keys in `_overflow` for merging
+        self._N = 0
+        if keys is not None:
+            self.encode(keys)
+
+    def __len__(self):
+        return self._N
+
+    def __contains__(self, key):
+        if key in self._overflow:
+            return True
+        if self._keys is None:
+            return False
+        try:
+            pos = np.searchsorted(self._keys, key)
+            return pos < self._keys.size and self._keys[pos] == key
+        except TypeError:
+            return False
+
+    def __repr__(self):
+        return f"{type(self).__name__}(<{self._N} keys>)"
+
+    def encode(self, keys):
+        """Return the ids of the given keys, assigning new ids to unseen keys.
+
+        Parameters
+        ----------
+        keys : array-like
+            1-d NumPy, CuPy, Arrow, or pandas array or list of node keys.
+
+        Returns
+        -------
+        numpy.ndarray of int64
+        """
+        keys = cp.asnumpy(keys) if isinstance(keys, cp.ndarray) else np.asarray(keys)
+        uniq, inverse = np.unique(keys, return_inverse=True)
+        if self._keys is None:
+            # First batch: keys are numbered in sorted order
+            self._keys = uniq
+            self._ids = ids = np.arange(uniq.size, dtype=np.int64)
+            self._N = uniq.size
+            return ids[inverse.ravel()]
+        ids = np.full(uniq.size, -1, dtype=np.int64)
+        pos = np.searchsorted(self._keys, uniq)
+        found = pos < self._keys.size
+        found[found] = self._keys[pos[found]] == uniq[found]
+        ids[found] = self._ids[pos[found]]
+        if not found.all():
+            is_missing = ~found
+            missing = uniq[is_missing]
+            if self._overflow:
+                get = self._overflow.get
+                missing_ids = np.fromiter(
+                    (get(key, -1) for key in missing.tolist()),
+                    dtype=np.int64,
+                    count=missing.size,
+                )
+            else:
+                missing_ids = np.full(missing.size, -1, dtype=np.int64)
+            is_new = missing_ids == -1
+            if is_new.any():
+                new_keys = missing[is_new]
+                missing_ids[is_new] = np.arange(self._N, self._N + new_keys.size)
+                self._overflow.update(
+                    zip(new_keys.tolist(), range(self._N, self._N + new_keys.size))
+                )
+                self._overflow_keys.append(new_keys)
+                self._N += new_keys.size
+            ids[is_missing] = missing_ids
+            threshold = self.merge_threshold
+            if threshold is None:
+                threshold = max(65536, self._N // 8)
+            if len(self._overflow) > threshold:
+                self.merge()
+        return ids[inverse.ravel()]
+
+    def decode(self, ids):
+        """Return an array of the keys of the given ids."""
+        ids = cp.asnumpy(ids) if isinstance(ids, cp.ndarray) else np.asarray(ids)
+        if ids.size > 0 and (ids.min() < 0 or ids.max() >= self._N):
+            raise IndexError(f"ids must be in the range [0, {self._N})")
+        return self._id_to_key_array()[ids]
+
+    def merge(self):
+        """Merge keys in the overflow hash map into the sorted array of keys."""
+        if not self._overflow_keys:
+            return
+        new_keys = np.concatenate(self._overflow_keys)
+        new_ids = np.fromiter(
+            map(self._overflow.__getitem__, new_keys.tolist()),
+            dtype=np.int64,
+            count=new_keys.size,
+        )
+        keys = np.concatenate([self._keys, new_keys])
+        ids = np.concatenate([self._ids, new_ids])
+        order = np.argsort(keys, kind="stable")
+        self._keys = keys[order]
+        self._ids = ids[order]
+        self._overflow = {}
+        self._overflow_keys = []
+
+    def _id_to_key_array(self):
+        self.merge()
+        if self._keys is None:
+            return np.empty(0, dtype=np.int64)
+        keys = np.empty(self._N, dtype=self._keys.dtype)
+        keys[self._ids] = self._keys
+        return keys
+
+    @property
+    def id_to_key(self):
+        """List of node keys indexed by id."""
+        return self._id_to_key_array().tolist()
+
+    @property
+    def key_to_id(self):
+        """Dict mapping node keys to ids."""
+        return dict(zip(self.id_to_key, range(self._N)))
+
+    @property
+    def is_identity(self):
+        """Whether every key is an integer equal to its id (no renumbering needed)."""
+        keys = self._id_to_key_array()
+        return keys.dtype.kind in {"i", "u"} and bool(
+            (keys == np.arange(self._N)).all()
+        )
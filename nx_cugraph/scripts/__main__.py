@@ -1,22 +1,29 @@
 #!/usr/bin/env python
-# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 if __name__ == "__main__":
     import argparse
 
-    from nx_cugraph.scripts import print_table, print_tree
+    from nx_cugraph.scripts import print_table, print_tree, profile_startup
 
     parser = argparse.ArgumentParser(
         parents=[
             print_table.get_argumentparser(add_help=False),
             print_tree.get_argumentparser(add_help=False),
+            profile_startup.get_argumentparser(add_help=False),
         ],
         description="Print info about functions implemented by nx-cugraph",
     )
-    parser.add_argument("action", choices=["print_table", "print_tree"])
+    parser.add_argument(
+        "action", choices=["print_table", "print_tree", "profile_startup"]
+    )
     args = parser.parse_args()
     if args.action == "print_table":
         print_table.main()
+    elif args.action == "profile_startup":
+        profile_startup.main(
+            algorithm=args.algorithm, num_nodes=args.num_nodes, top=args.top
+        )
     else:
         print_tree.main(
             by=args.by,
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION.
+# SPDX-License-Identifier: Apache-2.0
+"""Profile how long it takes to import nx-cugraph and dispatch to it the first time.
+
+Measurements are done in a new Python process so that nothing is already imported.
+Per-module import times come from ``python -X importtime``.
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+# Run in a new process; this must not import anything before it is measured.
+_CHILD_CODE = """\
+import json, sys, time
+
+def timed(func):
+    start = time.perf_counter()
+    try:
+        rv = func()
+    except Exception as exc:
+        return None, f"{type(exc).__name__}: {exc}"
+    return time.perf_counter() - start, rv
+
+phases = {}
+errors = {}
+phases["import_networkx"], _ = timed(lambda: __import__("networkx"))
+import networkx as nx
+from _nx_cugraph import _check_networkx_version
+phases["check_networkx_version"], _ = timed(_check_networkx_version)
+phases["import_nx_cugraph"], _ = timed(lambda: __import__("nx_cugraph.interface"))
+for name in ["cupy", "pylibcugraph"]:
+    phases[f"import_{name}"], rv = timed(lambda: __import__(name))
+    if phases[f"import_{name}"] is None:
+        errors[f"import_{name}"] = rv
+import nx_cugraph
+phases["register_algorithms"], rv = timed(nx_cugraph._load_all)
+if phases["register_algorithms"] is None:
+    errors["register_algorithms"] = rv
+    by_module = {}
+else:
+    from nx_cugraph.interface import BackendInterface
+    from nx_cugraph.utils import networkx_algorithm
+    by_module = {}
+    for func in vars(BackendInterface).values():
+        if isinstance(func, networkx_algorithm):
+            by_module[func.__module__] = by_module.get(func.__module__, 0) + 1
+
+def dispatch():
+    G = nx.path_graph(NUM_NODES)
+    rv = getattr(nx, ALGORITHM)(G, backend="cugraph")
+    if hasattr(rv, "__next__"):
+        rv = list(rv)
+    return rv
+
+for phase in ["first_dispatch", "second_dispatch"]:
+    phases[phase], rv = timed(dispatch)
+    if phases[phase] is None:
+        errors[phase] = rv
+        break
+
+json.dump(
+    {
+        "python_version": sys.version.split()[0],
+        "networkx_version": nx.__version__,
+        "nx_cugraph_version": nx_cugraph.__version__,
+        "phases": phases,
+        "errors": errors,
+        "registrations": {
+            "total": sum(by_module.values()),
+            "by_module": dict(sorted(by_module.items())),
+        },
+    },
+    sys.stdout,
+)
+"""
+
+
+def parse_importtime(text):
+    """Parse ``-X importtime`` output into ``{module: (self, cumulative)}`` seconds."""
+    rv = {}
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            # Header line
+            continue
+        rv[module.strip()] = (int(self_us) / 1e6, int(cumulative_us) / 1e6)
+    return rv
+
+
+def profile_startup(*, algorithm="number_connected_components", num_nodes=100):
+    """Return a dict that describes import time and first-dispatch latency."""
+    code = f"ALGORITHM = {algorithm!r}\nNUM_NODES = {num_nodes!r}\n{_CHILD_CODE}"
+    proc = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Profiling process failed:\n{proc.stderr}")
+    rv = json.loads(proc.stdout)
+    modules = parse_importtime(proc.stderr)
+    packages = {}
+    for module, (self_seconds, _) in modules.items():
+        package = module.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_seconds
+    rv["dispatch"] = {"algorithm": algorithm, "num_nodes": num_nodes}
+    rv["packages"] = dict(sorted(packages.items(), key=lambda x: -x[1]))
+    rv["modules"] = [
+        {"module": module, "self_seconds": val[0], "cumulative_seconds": val[1]}
+        for module, val in sorted(modules.items(), key=lambda x: -x[1][1])
+    ]
+    return rv
+
+
+def main(
+    *, algorithm="number_connected_components", num_nodes=100, top=50, file=sys.stdout
+):
+    rv = profile_startup(algorithm=algorithm, num_nodes=num_nodes)
+    if top is not None:
+        rv["packages"] = dict(list(rv["packages"].items())[:top])
+        rv["modules"] = rv["modules"][:top]
+    if file is not None:
+        json.dump(rv, file, indent=2)
+        print(file=file)
+    return rv
+
+
+def get_argumentparser(add_help=True):
+    parser = argparse.ArgumentParser(
+        description=(
+            "Print the time to import nx-cugraph and to first dispatch to it as JSON"
+        ),
+        add_help=add_help,
+    )
+    parser.add_argument(
+        "--algorithm",
+        default="number_connected_components",
+        help="NetworkX function to dispatch with a path graph (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--num-nodes",
+        type=int,
+        default=100,
+        help="Number of nodes of the path graph (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=50,
+        help="Number of slowest modules and packages to include (default: %(default)s)",
+    )
+    return parser
+
+
+if __name__ == "__main__":
+    parser = get_argumentparser()
+    args = parser.parse_args()
+    main(algorithm=args.algorithm, num_nodes=args.num_nodes, top=args.top)
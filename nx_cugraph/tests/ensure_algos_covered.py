@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 """Ensure that all functions wrapped by @networkx_algorithm were called.
 
@@ -8,9 +8,12 @@ import inspect
 import json
 from pathlib import Path
 
+import nx_cugraph
 from nx_cugraph.interface import BackendInterface
 from nx_cugraph.utils import networkx_algorithm
 
+nx_cugraph._load_all()
+
 with Path("coverage.json").open() as f:
     coverage = json.load(f)
 
@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION.
+# SPDX-License-Identifier: Apache-2.0
+import cupy as cp
+import networkx as nx
+import pytest
+
+import nx_cugraph as nxcg
+from _nx_cugraph import _parse_cache_budget, get_info
+from nx_cugraph import _nxver
+from nx_cugraph.classes.graph import _CACHE_KEY
+
+
+def test_cache_info():
+    G = nxcg.Graph(nx.path_graph(5))
+    assert nxcg.cache_info(G) == {"hits": 0, "misses": 0, "entries": [], "nbytes": 0}
+    totals = nxcg.cache_info()
+    Gcg = G._cudagraph
+    assert G._cudagraph is Gcg
+    info = nxcg.cache_info(G)
+    assert info["hits"] == 1
+    assert info["misses"] == 1
+    assert info["nbytes"] == Gcg._nbytes() > 0
+    [entry] = info["entries"]
+    assert entry["key"] == _CACHE_KEY
+    assert entry["canonical"]
+    assert entry["hits"] == 1
+    assert entry["created"] <= entry["last_used"]
+    new_totals = nxcg.cache_info()
+    assert new_totals["hits"] == totals["hits"] + 1
+    assert new_totals["misses"] == totals["misses"] + 1
+    assert new_totals["entries"] >= 1
+
+
+@pytest.mark.skipif(_nxver < (3, 4), reason="Requires networkx cache keys")
+def test_cache_clear():
+    G = nxcg.Graph(nx.path_graph(5))
+    assert G._cudagraph is not None
+    # Cache a variant that doesn't include all attributes, as networkx would
+    weight_key = (frozenset({("weight", 1)}), False)
+    cache = G.__networkx_cache__["backends"]["cugraph"]
+    cache[weight_key] = nxcg.from_networkx(G, use_compat_graph=False).copy()
+    keys = [entry["key"] for entry in nxcg.cache_info(G)["entries"]]
+    assert set(keys) == {_CACHE_KEY, weight_key}
+
+    assert nxcg.cache_clear(G, keep="canonical") == [weight_key]
+    assert nxcg.cache_clear(G, keep=[_CACHE_KEY]) == []
+    assert nxcg.cache_clear(G, keep=lambda key: True) == []
+    assert nxcg.cache_clear(G) == [_CACHE_KEY]
+    assert G._is_on_cpu
+    assert nxcg.cache_info(G)["entries"] == []
+    with pytest.raises(ValueError, match="canonical"):
+        nxcg.cache_clear(G, keep="bad")
+
+    # The canonical conversion is the only copy, so it is not removed
+    H = nxcg.CudaGraph.from_coo(
+        3, cp.array([0, 1]), cp.array([1, 2])
+    )._to_compat_graph()
+    assert not H._is_on_cpu
+    assert nxcg.cache_clear(H) == []
+    assert not H._is_on_cpu
+    assert nxcg.cache_info(H)["entries"][0]["canonical"]
+
+
+@pytest.mark.skipif(_nxver < (3, 4), reason="Requires networkx cache keys")
+def test_cache_budget():
+    G1, G2, G3, G4 = (nxcg.Graph(nx.path_graph(10)) for _ in range(4))
+    nbytes = G1._cudagraph._nbytes()
+    H = nxcg.from_networkx(nx.path_graph(10), use_compat_graph=True)
+    assert not H._is_on_cpu
+    totals = nxcg.cache_info()
+    with nx.config.backends.cugraph(cache_budget=3 * nbytes):
+        # G2 is the least recently used when G3 is cached
+        for G in [G2, H, G1, G3]:
+            assert G._cudagraph is not None
+        assert nxcg.cache_info(G2)["entries"] == []
+        # Graphs that are only on the GPU are copied to host before eviction
+        nxcg.from_networkx(G4, edge_attrs={}, use_compat_graph=False)
+        assert nxcg.cache_info(H)["entries"] == []
+        assert H._is_on_cpu
+        assert nx.utils.graphs_equal(H, nx.path_graph(10))
+        # Non-canonical entries are evicted first even if used more recently
+        assert G2._cudagraph is not None
+        assert nxcg.cache_info(G4)["entries"] == []
+        assert nxcg.cache_info(G1)["entries"] != []
+        assert nxcg.cache_info()["nbytes"] <= 3 * nbytes
+    new_totals = nxcg.cache_info()
+    assert new_totals["evictions"] >= totals["evictions"] + 3
+    assert new_totals["spills"] >= totals["spills"] + 1
+    assert new_totals["budget"] is None
+
+
+def test_cache_budget_env_var(monkeypatch):
+    assert _parse_cache_budget("") is None
+    assert _parse_cache_budget(" 1000 ") == 1000
+    assert _parse_cache_budget("2GB") == 2 * 10**9
+    assert _parse_cache_budget("1.5 MiB") == 3 * 2**19
+    assert _parse_cache_budget("4k") == 4000
+    for budget in ["-1", "2 gigabytes", "iB"]:
+        with pytest.warns(UserWarning, match="NX_CUGRAPH_CACHE_BUDGET"):
+            assert _parse_cache_budget(budget) is None
+    # Invalid values must not break get_info, or NetworkX ignores the backend
+    monkeypatch.setenv("NX_CUGRAPH_CACHE_BUDGET", "lots")
+    with pytest.warns(UserWarning, match="NX_CUGRAPH_CACHE_BUDGET"):
+        info = get_info()
+    assert info["default_config"]["cache_budget"] is None
+    monkeypatch.setenv("NX_CUGRAPH_CACHE_BUDGET", "2GB")
+    assert get_info()["default_config"]["cache_budget"] == 2 * 10**9
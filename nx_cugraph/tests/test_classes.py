@@ -1,5 +1,6 @@
 # SPDX-FileCopyrightText: Copyright (c) 2024-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
+import cupy as cp
 import networkx as nx
 import pytest
 
@@ -137,3 +138,230 @@ def test_dispatch_graph_classes(nxcg_class, use_compat_graphs):
 def test_cache_type(graph_class):
     G = graph_class()
     assert isinstance(G.__networkx_cache__, _GraphCache)
+
+
+def test_symmetrized_indices_cache():
+    G = nx.DiGraph([(0, 1), (1, 0), (1, 2), (3, 2), (3, 3)])
+    Gcg = nxcg.from_networkx(G)
+    src, dst = Gcg._get_symmetrized_indices("union")
+    expected = nx.to_undirected(G)
+    assert sorted(zip(src.tolist(), dst.tolist())) == sorted(
+        (u, v) for u, v in expected.to_directed().edges
+    )
+    assert Gcg._get_symmetrized_indices("union")[0] is src
+    src, dst = Gcg._get_symmetrized_indices("intersection")
+    assert list(zip(src.tolist(), dst.tolist())) == [(0, 1), (1, 0), (3, 3)]
+    with pytest.raises(ValueError, match="symmetrize must be"):
+        Gcg._get_symmetrized_indices("bad")
+
+    # Shared with undirected graph, copies, and reversed graphs
+    H = Gcg.to_undirected()
+    assert H.src_indices.tolist() == Gcg._get_symmetrized_indices("union")[0].tolist()
+    assert H._get_symmetrized_indices("union")[0] is (
+        Gcg._get_symmetrized_indices("union")[0]
+    )
+    assert Gcg.reverse()._symmetrized_indices.keys() == {"union", "intersection"}
+    assert Gcg.copy()._symmetrized_indices.keys() == {"union", "intersection"}
+    assert Gcg.to_directed()._symmetrized_indices.keys() == {"union", "intersection"}
+    assert nxcg.number_weakly_connected_components(Gcg) == 2
+
+    # Invalidated on mutation
+    Gcg.clear_edges()
+    assert Gcg._symmetrized_indices == {}
+    assert Gcg._get_symmetrized_indices("union")[0].size == 0
+
+
+def test_sorted_by_src_flag():
+    G = nx.DiGraph()
+    G.add_nodes_from([0, 1, 2])
+    G.add_edges_from([(0, 2), (0, 1), (2, 1), (1, 0)])
+    Gcg = nxcg.from_networkx(G)
+    assert not Gcg._is_sorted_by_src
+    expected = Gcg._get_symmetrized_indices("union")
+    Gcg._sort_edge_indices()
+    assert Gcg._is_sorted_by_src
+    assert Gcg.src_indices.tolist() == [0, 0, 1, 2]
+    assert Gcg.dst_indices.tolist() == [1, 2, 0, 1]
+    assert Gcg.copy()._is_sorted_by_src
+    assert not Gcg.reverse()._is_sorted_by_src
+    assert Gcg.to_undirected()._is_sorted_by_src
+    Gcg._symmetrized_indices.clear()
+    src, dst = Gcg._get_symmetrized_indices("union")
+    assert src.tolist() == expected[0].tolist()
+    assert dst.tolist() == expected[1].tolist()
+    Gcg._sort_edge_indices("dst")
+    assert not Gcg._is_sorted_by_src
+
+
+def test_structure_metadata():
+    G = nx.DiGraph([(0, 1), (1, 1), (2, 1)])
+    G.add_node(3)
+    Gcg = nxcg.from_networkx(G)
+    assert Gcg._structure_cache == {"has_duplicates": False}
+    assert not Gcg._has_duplicates()
+    assert Gcg._num_selfloops() == nx.number_of_selfloops(G) == 1
+    assert Gcg._has_selfloops()
+    assert Gcg._num_isolates() == nx.number_of_isolates(G) == 1
+    assert nxcg.number_of_isolates(Gcg) == 1
+    assert list(nxcg.isolates(Gcg)) == [3]
+    degrees = Gcg._degrees_array()
+    assert degrees.tolist() == [1, 4, 1, 0]
+    assert Gcg._degrees_array() is degrees
+    assert Gcg._degrees_array(ignore_selfloops=True).tolist() == [1, 2, 1, 0]
+    assert Gcg._in_degrees_array().tolist() == [0, 3, 0, 0]
+    assert Gcg._out_degrees_array(ignore_selfloops=True).tolist() == [1, 0, 1, 0]
+
+    # Shared with copies; in- and out-degrees are not shared when reversing
+    H = Gcg.copy()
+    assert H._degrees_array() is degrees
+    assert H._structure_cache["num_isolates"] == 1
+    H = Gcg.reverse()
+    assert ("in_degrees", False) not in H._structure_cache
+    assert H._in_degrees_array().tolist() == [1, 1, 1, 0]
+    assert H._structure_cache["num_selfloops"] == 1
+
+    # Sorting is skipped when already sorted
+    Gcg._sort_edge_indices("dst")
+    assert Gcg._is_sorted_by_dst
+    assert not Gcg._is_sorted_by_src
+    src_indices = Gcg.src_indices
+    Gcg._sort_edge_indices("dst")
+    assert Gcg.src_indices is src_indices
+    assert Gcg.reverse()._is_sorted_by_src
+
+    # Invalidated on mutation
+    Gcg.clear_edges()
+    assert Gcg._structure_cache == {}
+    assert Gcg._num_isolates() == 4
+    assert Gcg._degrees_array().tolist() == [0, 0, 0, 0]
+
+    # Duplicate edges
+    Gcg = nxcg.CudaGraph.from_coo(
+        3, cp.array([0, 1, 0, 1]), cp.array([1, 0, 1, 0]), use_compat_graph=False
+    )
+    assert Gcg._has_duplicates()
+    assert Gcg._num_isolates() == 1
+
+
+@pytest.mark.parametrize(
+    "graph_class", [nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph]
+)
+def test_degree_views(graph_class):
+    G = graph_class()
+    G.add_edges_from([(0, 1, {"weight": 2}), (1, 2), (2, 2, {"weight": 3.5})])
+    G.add_edge("a", 0, weight=4)
+    G.add_node("b")
+    if G.is_multigraph():
+        G.add_edge(0, 1, weight=5)
+    Gcg = nxcg.from_networkx(G, preserve_edge_attrs=True)
+    H = Gcg._to_compat_graph()
+    assert not H._is_on_cpu
+    names = ["degree", "in_degree", "out_degree"] if G.is_directed() else ["degree"]
+    for name in names:
+        expected = getattr(G, name)
+        for view in [getattr(Gcg, name), getattr(H, name)]:
+            assert type(view).__module__ == "nx_cugraph.classes.reportviews"
+            assert dict(view) == dict(expected)
+            assert len(view) == len(expected)
+            assert view[2] == expected[2]
+            assert view(0) == expected(0)
+            assert view(0, weight="weight") == expected(0, weight="weight")
+            assert dict(view(weight="weight")) == dict(expected(weight="weight"))
+            assert list(view([0, "b", "c"])) == list(expected([0, "b", "c"]))
+            assert view(weight="weight") is not view
+            assert view() is view
+            with pytest.raises(KeyError):
+                view["c"]
+    assert not H._is_on_cpu
+    # Falls back to NetworkX when the graph is on the host
+    H._reify_networkx()
+    H.__networkx_cache__._clear_no_reify_networkx()
+    assert type(H.degree).__module__.startswith("networkx")
+    assert dict(H.degree) == dict(G.degree)
+
+
+def test_degree_view_after_changing_weights():
+    G = nx.Graph([(0, 1, {"weight": 2}), (1, 2, {"weight": 3})])
+    H = nxcg.from_networkx(G, preserve_edge_attrs=True)._to_compat_graph()
+    assert H.size(weight="weight") == 5
+    H._reify_networkx()
+    assert H._is_on_gpu
+    # Changing attributes in-place doesn't clear the cache
+    H[0][1]["weight"] = -5
+    assert type(H.degree).__module__.startswith("networkx")
+    assert H.degree(1, weight="weight") == -2
+    assert H.size(weight="weight") == -2
+
+
+@pytest.mark.parametrize(
+    "graph_class", [nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph]
+)
+def test_graph_views(graph_class):
+    G = graph_class()
+    G.add_edges_from([(0, 1, {"weight": 2}), (1, 2), (2, 2, {"weight": 3.5})])
+    G.add_edge("a", 0, weight=4)
+    G.add_node("b", color="blue")
+    if G.is_multigraph():
+        G.add_edge(0, 1, weight=5)
+    Gcg = nxcg.from_networkx(G, preserve_all_attrs=True)
+    H = Gcg._to_compat_graph()
+    edge_views = ["edges", "in_edges", "out_edges"] if G.is_directed() else ["edges"]
+    for X in [Gcg, H]:
+        assert list(X.nodes) == list(G.nodes)
+        assert list(X.nodes(data="color")) == list(G.nodes(data="color"))
+        assert X.nodes(data="color", default=0)[0] == 0
+        for name in edge_views:
+            expected = getattr(G, name)
+            view = getattr(X, name)
+            assert len(view) == len(expected)
+            assert sorted(view, key=str) == sorted(expected, key=str)
+            for nbunch in [None, [1, 2], 0]:
+                assert sorted(view(nbunch, data="weight"), key=str) == sorted(
+                    expected(nbunch, data="weight"), key=str
+                )
+            assert (0, 1) in view
+            assert ("b", 0) not in view
+        # No host copy of the graph is needed yet
+        assert list(X[0]) == list(G[0])
+        assert 1 in X.adj[0]
+        assert not H._is_on_cpu
+        assert dict(X.nodes(data=True)) == dict(G.nodes(data=True))
+        assert dict(X[0][1]) == dict(G[0][1])
+        assert sorted(X.edges(data=True), key=str) == sorted(
+            G.edges(data=True), key=str
+        )
+    # Attribute dicts of compat graphs are live; clear the cache after changing them
+    H.nodes["b"]["color"] = "red"
+    H.__networkx_cache__.clear()
+    assert H.nodes(data="color")["b"] == "red"
+    with pytest.raises(TypeError):
+        Gcg.nodes["b"]["color"] = "red"
+
+
+def test_graph_views_after_changing_attrs():
+    G = nx.DiGraph([(0, 1, {"weight": 2}), (1, 2, {"weight": 3})])
+    G.add_node(0, color="blue")
+    H = nxcg.from_networkx(G, preserve_all_attrs=True)._to_compat_graph()
+    H._reify_networkx()
+    assert H._is_on_gpu
+    # Changing attributes in-place doesn't clear the cache
+    H[0][1]["weight"] = -5
+    H.nodes[0]["color"] = "red"
+    assert list(H.edges(data="weight")) == [(0, 1, -5), (1, 2, 3)]
+    assert list(H.in_edges(1, data="weight")) == [(0, 1, -5)]
+    assert dict(H.nodes(data="color")) == {0: "red", 1: None, 2: None}
+    assert dict(H.adj[0]) == {1: {"weight": -5}}
+    assert dict(H.pred[1]) == {0: {"weight": -5}}
+
+
+@pytest.mark.parametrize("graph_class", [nx.DiGraph, nx.MultiGraph])
+def test_adjacency_view_after_sorting(graph_class):
+    G = graph_class([(2, 0), (0, 2), (1, 0), (2, 1), (0, 1), (2, 2)])
+    Gcg = nxcg.from_networkx(G)
+    pred = Gcg.pred if G.is_directed() else Gcg.adj
+    for primary in [None, "src", "dst", "src"]:
+        if primary is not None:
+            Gcg._sort_edge_indices(primary)
+        for n in G:
+            assert sorted(Gcg[n]) == sorted(G[n])
+            assert sorted(pred[n]) == sorted(G.pred[n] if G.is_directed() else G[n])
@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2023-2025, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 import cupy as cp
 import networkx as nx
@@ -214,6 +214,31 @@ def test_multigraph(graph_class):
     assert nx.utils.graphs_equal(G, H)
 
 
+@pytest.mark.parametrize(
+    "graph_class", [nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph]
+)
+@pytest.mark.parametrize("reorder", ["degree", "rcm"])
+def test_from_networkx_reorder(graph_class, reorder):
+    G = nx.path_graph([5, 2, 7, 0, 9, 3, 1], create_using=graph_class)
+    G.add_edges_from([(2, 3), (2, 1), (4, 4)], x=1)
+    G.add_node(8, y=2)
+    Gcg = nxcg.from_networkx(G, preserve_all_attrs=True, reorder=reorder)
+    assert sorted(Gcg.id_to_key) == sorted(G)
+    assert Gcg._is_sorted_by_src
+    assert (cp.diff(Gcg.src_indices) >= 0).all()
+    H = nxcg.to_networkx(Gcg)
+    assert nx.utils.graphs_equal(G, H)
+    assert dict(G.nodes(data=True)) == dict(H.nodes(data=True))
+    if reorder == "degree":
+        assert Gcg.id_to_key[0] == 2  # node with the highest degree
+    else:
+        # Path graph is ordered along the path, so edges connect adjacent ids
+        Gcg = nxcg.from_networkx(nx.path_graph([5, 2, 7, 0, 9, 3, 1]), reorder=reorder)
+        assert (abs(Gcg.src_indices - Gcg.dst_indices) == 1).all()
+    with pytest.raises(ValueError, match="reorder must be"):
+        nxcg.from_networkx(G, reorder="bad")
+
+
 def test_to_dict_of_lists():
     G = nx.MultiGraph()
     G.add_edge("a", "b")
@@ -1,17 +1,27 @@
-# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
+import statistics
+
 import networkx as nx
+import numpy as np
 import pandas as pd
 import pytest
 
 import nx_cugraph as nxcg
 from nx_cugraph.utils import _cp_iscopied_asarray
 
+from .testing_utils import assert_graphs_equal
+
 try:
     import cudf
 except ModuleNotFoundError:
     cudf = None
 
+try:
+    import pyarrow as pa
+except ModuleNotFoundError:
+    pa = None
+
 
 DATA = [
     {"source": [0, 1], "target": [1, 2]},  # nodes are 0, 1, 2
@@ -74,3 +84,132 @@ def test_from_pandas_edgelist(data, create_using):
             source.to_numpy(), orig_object=source
         )
         assert is_copied is True
+
+
+@pytest.mark.parametrize("graph_class", [nx.Graph, nx.DiGraph])
+@pytest.mark.parametrize("chunksize", [None, 1, 3, 100])
+@pytest.mark.parametrize("use_nodelist", [False, True])
+def test_to_numpy_array_blocked(graph_class, chunksize, use_nodelist, tmp_path):
+    G = nx.gnp_random_graph(20, 0.3, seed=42, directed=graph_class.is_directed(None))
+    G = graph_class(G)
+    for i, (u, v) in enumerate(G.edges):
+        G.edges[u, v]["weight"] = i + 0.5
+    nodelist = list(range(19, 1, -2)) if use_nodelist else None
+    expected = nx.to_numpy_array(G, nodelist=nodelist, nonedge=-1.0)
+    N = expected.shape[0]
+    out = np.memmap(tmp_path / "A.dat", dtype=np.float64, mode="w+", shape=(N, N))
+    result = nxcg.to_numpy_array(
+        G, nodelist=nodelist, nonedge=-1.0, out=out, chunksize=chunksize
+    )
+    assert result is out
+    np.testing.assert_array_equal(np.asarray(out), expected)
+    if chunksize is not None:
+        result = nxcg.to_numpy_array(
+            G, nodelist=nodelist, nonedge=-1.0, chunksize=chunksize
+        )
+        assert isinstance(result, np.ndarray)
+        np.testing.assert_array_equal(result, expected)
+    with pytest.raises(ValueError, match="shape"):
+        nxcg.to_numpy_array(G, nodelist=nodelist, out=np.empty((N + 1, N)))
+    with pytest.raises(ValueError, match="dtype"):
+        nxcg.to_numpy_array(G, nodelist=nodelist, dtype=np.float32, out=out)
+
+
+@pytest.mark.parametrize("graph_class", [nx.MultiGraph, nx.MultiDiGraph])
+@pytest.mark.parametrize(
+    "multigraph_weight", [sum, min, max, np.mean, statistics.median]
+)
+@pytest.mark.parametrize("use_nodelist", [False, True])
+def test_to_numpy_array_multigraph(graph_class, multigraph_weight, use_nodelist):
+    G = graph_class()
+    G.add_nodes_from(range(6))
+    G.add_weighted_edges_from(
+        [(0, 1, 3), (0, 1, 1), (1, 0, 8), (2, 2, 5), (2, 2, -1), (3, 4, 2), (4, 5, 7)]
+    )
+    G.add_edge(0, 1)  # default weight
+    G.add_edge(5, 3)
+    nodelist = [5, 4, 1, 0, 2] if use_nodelist else None
+    expected = nx.to_numpy_array(
+        G, nodelist=nodelist, multigraph_weight=multigraph_weight
+    )
+    result = nxcg.to_numpy_array(
+        G, nodelist=nodelist, multigraph_weight=multigraph_weight
+    )
+    np.testing.assert_allclose(result, expected)
+    result = nxcg.to_numpy_array(
+        G, nodelist=nodelist, multigraph_weight=multigraph_weight, chunksize=2
+    )
+    np.testing.assert_allclose(result, expected)
+    expected = nx.to_numpy_array(G, nodelist=nodelist, weight=None)
+    result = nxcg.to_numpy_array(G, nodelist=nodelist, weight=None)
+    np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize("data", DATA)
+@pytest.mark.parametrize("create_using", CREATE_USING)
+def test_from_edgelist_arrays(data, create_using):
+    df = pd.DataFrame(data)
+    df["weight"] = pd.Series([1, None], dtype="Int64")
+    expected = create_using()
+    expected.add_edge(*df.loc[0, ["source", "target"]], weight=1)
+    expected.add_edge(*df.loc[1, ["source", "target"]])
+    G = nxcg.from_edgelist_arrays(
+        df["source"],
+        df["target"].to_numpy(),
+        weight=df["weight"],
+        create_using=create_using,
+    )
+    assert G.is_directed() == expected.is_directed()
+    assert G.is_multigraph() == expected.is_multigraph()
+    assert_graphs_equal(expected, G._cudagraph if isinstance(G, nx.Graph) else G)
+    with pytest.raises(ValueError, match="same size"):
+        nxcg.from_edgelist_arrays(df["source"], df["target"][:1])
+    with pytest.raises(ValueError, match="weight"):
+        nxcg.from_edgelist_arrays(df["source"], df["target"], weight=[1, 2, 3])
+
+
+@pytest.mark.parametrize("create_using", CREATE_USING)
+@pytest.mark.parametrize("nodelist", [None, ["c", "b"]])
+def test_to_pandas_edgelist(create_using, nodelist):
+    G = create_using()
+    G.add_edge("a", "b", w=1)
+    G.add_edge("c", "a", w=2, x=3.5)
+    G.add_edge("b", "c")
+    G.add_edge("b", "b", x=1.0)
+    if G.is_multigraph():
+        G.add_edge("a", "b", w=5)
+    edge_key = "key" if G.is_multigraph() and nodelist is None else None
+    expected = nx.to_pandas_edgelist(G, nodelist=nodelist, edge_key=edge_key)
+    result = nxcg.to_pandas_edgelist(G, nodelist=nodelist, edge_key=edge_key)
+    pd.testing.assert_frame_equal(result[expected.columns], expected)
+    with pytest.raises(nx.NetworkXError, match="Source name"):
+        nxcg.to_pandas_edgelist(G, source="w")
+    if pa is None:
+        return
+    table = nxcg.to_arrow(G, nodelist=nodelist, edge_key=edge_key)
+    assert table.column("w").null_count == expected["w"].isna().sum()
+    result = table.to_pandas()
+    pd.testing.assert_frame_equal(result[expected.columns], expected, check_dtype=False)
+
+
+@pytest.mark.parametrize("create_using", [nx.MultiGraph, nx.MultiDiGraph])
+@pytest.mark.parametrize("nodelist", [None, ["c", "b"]])
+def test_to_pandas_edgelist_edge_keys(create_using, nodelist):
+    G = create_using()
+    G.add_edge("a", "b", key="k1", w=1)
+    G.add_edge("a", "b", key="k2", w=2)
+    G.add_edge("b", "c", key=("k", 3))
+    G.add_edge("c", "c", key="k4", w=4)
+    expected = nx.to_pandas_edgelist(G, nodelist=nodelist)
+    # networkx ignores nodelist when getting edge keys, so get them here
+    expected["key"] = [key for *_, key in G.edges(nodelist, keys=True)]
+    result = nxcg.to_pandas_edgelist(G, nodelist=nodelist, edge_key="key")
+    pd.testing.assert_frame_equal(result[expected.columns], expected)
+    if pa is None:
+        return
+    # Tuples can't be Arrow values
+    G.remove_edge("b", "c", key=("k", 3))
+    expected = nx.to_pandas_edgelist(G, nodelist=nodelist)
+    expected["key"] = [key for *_, key in G.edges(nodelist, keys=True)]
+    result = nxcg.to_arrow(G, nodelist=nodelist, edge_key="key").to_pandas()
+    pd.testing.assert_frame_equal(result[expected.columns], expected, check_dtype=False)
@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2023-2025, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 import networkx as nx
 import numpy as np
@@ -170,22 +170,7 @@ GENERATORS_M_N_VANILLA = [
 @pytest.mark.parametrize("create_using", COMPLETE_CREATE_USING)
 def test_generator_noarg(name, create_using):
     print(name, create_using, type(create_using))
-    if isinstance(create_using, nxcg.CudaGraph) and name in {
-        # fmt: off
-        "bull_graph", "chvatal_graph", "cubical_graph", "diamond_graph",
-        "house_graph", "house_x_graph", "icosahedral_graph", "krackhardt_kite_graph",
-        "octahedral_graph", "petersen_graph", "truncated_cube_graph", "tutte_graph",
-        # fmt: on
-    }:
-        # The _raise_on_directed decorator used in networkx doesn't like our graphs.
-        if create_using.is_directed():
-            with pytest.raises(AssertionError):
-                compare(name, create_using)
-        else:
-            with pytest.raises(TypeError):
-                compare(name, create_using)
-    else:
-        compare(name, create_using)
+    compare(name, create_using)
 
 
 @pytest.mark.parametrize("name", GENERATORS_NOARG_VANILLA)
@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION.
+# SPDX-License-Identifier: Apache-2.0
+import json
+import subprocess
+import sys
+
+import pytest
+
+import nx_cugraph as nxcg
+from _nx_cugraph import _info
+from nx_cugraph.interface import BackendInterface
+from nx_cugraph.utils import networkx_algorithm
+
+# Seconds that `import nx_cugraph` may take after networkx is imported. This is
+# generous, since importing nx_cugraph should only need to check versions.
+IMPORT_TIME_BUDGET = 0.5
+
+
+def _run_python(code):
+    proc = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(proc.stdout)
+
+
+def test_import_is_lazy():
+    result = _run_python(
+        "import json, sys, time\n"
+        "import networkx\n"
+        "start = time.perf_counter()\n"
+        "import nx_cugraph\n"
+        "from nx_cugraph.interface import BackendInterface\n"
+        "seconds = time.perf_counter() - start\n"
+        "modules = sorted(\n"
+        "    name for name in sys.modules\n"
+        "    if name.split('.')[0] in {'nx_cugraph', 'cupy', 'pylibcugraph'}\n"
+        ")\n"
+        "print(json.dumps({'seconds': seconds, 'modules': modules}))\n"
+    )
+    assert result["modules"] == ["nx_cugraph", "nx_cugraph.interface"]
+    assert result["seconds"] < IMPORT_TIME_BUDGET
+
+
+def test_lazy_algorithms_are_registered():
+    assert set(dir(BackendInterface)) >= _info["functions"]
+    for name in _info["functions"]:
+        assert isinstance(getattr(BackendInterface, name), networkx_algorithm), name
+    assert not hasattr(BackendInterface, "not_an_algorithm")
+
+
+def test_lazy_attrs_are_current():
+    from _nx_cugraph.core import get_lazy_attrs
+
+    assert nxcg._lazy_attrs == get_lazy_attrs()
+
+
+@pytest.mark.parametrize("modname", sorted(nxcg._submodules))
+def test_import_submodule_first(modname):
+    # Import cycles only show when a submodule is imported first
+    result = _run_python(
+        "import json, importlib\n"
+        f"importlib.import_module('nx_cugraph.{modname}')\n"
+        "print(json.dumps(True))\n"
+    )
+    assert result is True
+
+
+def test_first_access_imports_one_submodule():
+    result = _run_python(
+        "import json, sys\n"
+        "import nx_cugraph\n"
+        "nx_cugraph.Graph\n"
+        "print(json.dumps(sorted(sys.modules)))\n"
+    )
+    assert "nx_cugraph.classes" in result
+    assert "nx_cugraph.algorithms" not in result
+    assert "nx_cugraph.readwrite" not in result
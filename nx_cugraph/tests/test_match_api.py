@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2023-2025, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 import importlib
 import inspect
@@ -11,6 +11,7 @@ from nx_cugraph.utils import networkx_algorithm
 
 def test_match_signature_and_names():
     """Simple test to ensure our signatures and basic module layout match networkx."""
+    nxcg._load_all()
     for name, func in vars(nxcg.interface.BackendInterface).items():
         if not isinstance(func, networkx_algorithm):
             continue
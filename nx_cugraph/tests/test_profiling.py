@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION.
+# SPDX-License-Identifier: Apache-2.0
+import json
+
+import cupy as cp
+import networkx as nx
+
+import nx_cugraph as nxcg
+
+
+def test_profile_convert_and_call(tmp_path):
+    G = nx.path_graph(5)
+    path = tmp_path / "trace.json"
+    with nxcg.profile(chrome_trace=path) as report:
+        Gcg = nxcg.from_networkx(G)
+        assert nxcg.number_of_selfloops(Gcg) == 0
+        assert nxcg.degree_centrality(Gcg)[0] == 0.25
+        H = nxcg.to_networkx(Gcg)
+    assert nx.utils.graphs_equal(G, H)
+    summary = report.summary()
+    assert summary["phases"]["convert"]["count"] == 1
+    assert summary["phases"]["to_networkx"]["count"] == 1
+    assert summary["phases"]["result"]["count"] >= 1
+    assert summary["calls"].keys() == {"number_of_selfloops", "degree_centrality"}
+    assert summary["bytes_host_to_device"] == Gcg.src_indices.nbytes * 2
+    assert summary["bytes_device_to_host"] >= summary["bytes_host_to_device"]
+    # Time of nested spans is excluded from self time
+    calls = [event for event in report.events if event["name"] == "degree_centrality"]
+    assert len(calls) == 1
+    assert calls[0]["self_seconds"] <= calls[0]["seconds"]
+    trace = json.loads(path.read_text())
+    assert len(trace["traceEvents"]) == len(report.events)
+    assert {event["ph"] for event in trace["traceEvents"]} == {"X"}
+
+    # Nothing is recorded outside of the block
+    nxcg.from_networkx(G)
+    assert summary == report.summary()
+
+
+def test_profile_cache_counters():
+    G = nxcg.Graph(nx.path_graph(5))
+    with nxcg.profile() as report:
+        assert G._cudagraph is G._cudagraph
+    assert report.counters["cache_misses"] == 1
+    assert report.counters["cache_hits"] == 1
+    assert report.summary()["phases"]["convert"]["count"] == 1
+
+
+def test_profile_synchronizes_spans(monkeypatch):
+    stream = cp.cuda.get_current_stream()
+    syncs = []
+
+    class Stream:
+        def synchronize(self):
+            syncs.append(True)
+            stream.synchronize()
+
+    # Device work is async, so spans wait for it to be timed in the right span
+    monkeypatch.setattr(cp.cuda, "get_current_stream", Stream)
+    G = nx.path_graph(5)
+    nxcg.from_networkx(G)
+    assert not syncs
+    with nxcg.profile() as report:
+        nxcg.from_networkx(G)
+    assert len(syncs) == 2 * len(report.events) > 0
@@ -0,0 +1,154 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION.
+# SPDX-License-Identifier: Apache-2.0
+import networkx as nx
+import pytest
+
+import nx_cugraph as nxcg
+
+from .testing_utils import assert_graphs_equal
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ModuleNotFoundError:
+    pa = None
+
+DATA = {
+    # Nodes are first seen in a different order than sorted order
+    "src": ["z", "b", "c", "z", "d", "e"],
+    "dst": ["b", "c", "z", "z", "e", "b"],
+    "weight": [1.5, None, 3.0, 4.0, 5.0, None],
+    "label": [1, 2, 3, 4, 5, 6],
+}
+
+
+def _expected_graph(create_using, edge_attrs):
+    G = create_using()
+    for u, v, *values in zip(DATA["src"], DATA["dst"], *map(DATA.get, edge_attrs)):
+        attrs = {k: val for k, val in zip(edge_attrs, values) if val is not None}
+        G.add_edge(u, v, **attrs)
+    return G
+
+
+def _renumbered_nodes(batch_size):
+    """Return nodes by id after renumbering DATA in batches of ``batch_size`` rows.
+
+    New nodes in each batch are numbered in sorted order (see ``NodeRenumberer``).
+    """
+    nodes = {}
+    for i in range(0, len(DATA["src"]), batch_size):
+        batch = DATA["src"][i : i + batch_size] + DATA["dst"][i : i + batch_size]
+        nodes.update(dict.fromkeys(sorted(set(batch) - nodes.keys())))
+    return list(nodes)
+
+
+def _cudagraph(G):
+    return G._cudagraph if isinstance(G, nx.Graph) else G
+
+
+@pytest.mark.skipif("not pa")
+@pytest.mark.parametrize("create_using", [nx.Graph, nx.DiGraph, nx.MultiDiGraph])
+def test_from_arrow_edgelist(create_using):
+    table = pa.table(DATA)
+    G = nxcg.from_arrow_edgelist(
+        table, "src", "dst", edge_attr=True, create_using=create_using
+    )
+    expected = _expected_graph(create_using, ["weight", "label"])
+    assert_graphs_equal(expected, _cudagraph(G))
+    assert list(G) == _renumbered_nodes(table.num_rows)
+    G = nxcg.from_arrow_edgelist(
+        table.to_batches()[0], "src", "dst", create_using=create_using
+    )
+    assert_graphs_equal(_expected_graph(create_using, []), _cudagraph(G))
+    with pytest.raises(nx.NetworkXError, match="Invalid edge_attr"):
+        nxcg.from_arrow_edgelist(table, "src", "dst", edge_attr="missing")
+
+
+@pytest.mark.skipif("not pa")
+@pytest.mark.parametrize("row_group_size", [1, 4, 100])
+def test_read_parquet_edgelist(tmp_path, row_group_size):
+    path = tmp_path / "edges.parquet"
+    pq.write_table(pa.table(DATA), path, row_group_size=row_group_size)
+    G = nxcg.read_parquet_edgelist(
+        path, "src", "dst", edge_attr="weight", create_using=nx.DiGraph
+    )
+    expected = _expected_graph(nx.DiGraph, ["weight"])
+    assert_graphs_equal(expected, _cudagraph(G))
+    # Row groups are renumbered in order; new nodes of each are sorted
+    assert list(G) == _renumbered_nodes(row_group_size)
+    # Integer keys that are already 0..N-1 are not renumbered
+    path = tmp_path / "ints.parquet"
+    pq.write_table(
+        pa.table({"source": [0, 1, 2], "target": [1, 2, 0]}),
+        path,
+        row_group_size=row_group_size,
+    )
+    G = _cudagraph(nxcg.read_parquet_edgelist(path, create_using=nx.DiGraph))
+    assert sorted(G.edges) == [(0, 1), (1, 2), (2, 0)]
+    assert G._id_to_key is None
+
+
+@pytest.mark.skipif("not pa")
+@pytest.mark.parametrize("fmt", ["parquet", "csv", "mixed"])
+@pytest.mark.parametrize("workers", [1, 3])
+def test_read_edgelist_files(tmp_path, fmt, workers):
+    import pyarrow.csv as pa_csv
+
+    table = pa.table(DATA)
+    paths = []
+    for i in range(table.num_rows // 2):
+        shard = table.slice(2 * i, 2)
+        if fmt == "parquet" or fmt == "mixed" and i % 2 == 0:
+            paths.append(tmp_path / f"part-{i}.parquet")
+            pq.write_table(shard, paths[-1])
+        else:
+            paths.append(tmp_path / f"part-{i}.csv")
+            pa_csv.write_csv(shard, paths[-1])
+    reports = []
+    G = nxcg.read_edgelist_files(
+        paths,
+        "src",
+        "dst",
+        edge_attr=["weight"],
+        create_using=nx.DiGraph,
+        workers=workers,
+        progress=reports.append,
+    )
+    expected = _expected_graph(nx.DiGraph, ["weight"])
+    assert_graphs_equal(expected, _cudagraph(G))
+    # Files are renumbered in order of paths
+    assert list(G) == _renumbered_nodes(2)
+    assert [report["path"] for report in reports] == paths
+    assert [report["rows_done"] for report in reports] == [2, 4, 6]
+    assert all(report["rows_total"] == 6 for report in reports)
+    G = nxcg.read_edgelist_files(paths, "src", "dst", edge_attr=True, workers=workers)
+    assert_graphs_equal(_expected_graph(nx.Graph, ["weight", "label"]), _cudagraph(G))
+    with pytest.raises(ValueError, match="file format"):
+        nxcg.read_edgelist_files([tmp_path / "edges"])
+
+
+@pytest.mark.skipif("not pa")
+@pytest.mark.parametrize("fmt", ["parquet", "csv", "tsv"])
+def test_read_edgelist_files_mixed_dtypes(tmp_path, fmt):
+    import pyarrow.csv as pa_csv
+
+    # Types are inferred per CSV file, so "weight" is int64 in the first file
+    shards = [
+        pa.table({"source": [0, 1], "target": [1, 2], "weight": [1, 2]}),
+        pa.table({"source": [2, 3], "target": [3, 0], "weight": [1.5, 2.5]}),
+    ]
+    paths = [tmp_path / f"part-{i}.{fmt}" for i in range(len(shards))]
+    for shard, path in zip(shards, paths):
+        if fmt == "parquet":
+            pq.write_table(shard, path)
+        else:
+            delimiter = "\t" if fmt == "tsv" else ","
+            pa_csv.write_csv(shard, path, pa_csv.WriteOptions(delimiter=delimiter))
+    G = _cudagraph(nxcg.read_edgelist_files(paths, edge_attr="weight"))
+    assert G.edge_values["weight"].dtype.kind == "f"
+    expected = nx.Graph()
+    expected.add_weighted_edges_from([(0, 1, 1), (1, 2, 2), (2, 3, 1.5), (3, 0, 2.5)])
+    assert_graphs_equal(expected, G)
+    # The delimiter of ".txt" files is unknown
+    with pytest.raises(ValueError, match="file format"):
+        nxcg.read_edgelist_files([tmp_path / "edges.txt"])
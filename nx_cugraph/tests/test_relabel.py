@@ -1,6 +1,8 @@
-# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
+import cupy as cp
 import networkx as nx
+import numpy as np
 import pytest
 
 import nx_cugraph as nxcg
@@ -51,3 +53,79 @@ def test_relabel_nx_input():
     Hnx = nx.relabel_nodes(G, {0: 1}, copy=True)
     Hcg = nxcg.relabel_nodes(G, {0: 1}, copy=True)
     assert_graphs_equal(Hnx, Hcg)
+
+
+@pytest.mark.parametrize(
+    "create_using", [nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph]
+)
+@pytest.mark.parametrize("xp", [np, cp])
+def test_relabel_array_mapping(create_using, xp):
+    G = nx.complete_graph(4, create_using=create_using)
+    G.add_edge(0, 3, a=1)
+    G.add_edge(1, 2, a=2, b=3)
+    G.add_edge(2, 3, b=4)
+    G.nodes[1]["x"] = 5
+    for new_keys in [
+        [3, 1, 0, 2],  # permutation
+        [10, 20, 30, 40],  # integer keys
+        [0, 2, 2, 1],  # merge into 0..M-1
+        [7, 5, 5, 7],  # merge
+    ]:
+        mapping = xp.array(new_keys)
+        Hnx = nx.relabel_nodes(G, dict(enumerate(new_keys)))
+        Hcg = nxcg.relabel_nodes(G, mapping)
+        assert_graphs_equal(Hnx, Hcg)
+    with pytest.raises(IndexError, match="too small"):
+        nxcg.relabel_nodes(G, xp.arange(3))
+
+
+def test_relabel_offset_and_series_mapping():
+    pd = pytest.importorskip("pandas")
+    G = nx.path_graph(5)
+    G.add_edge(1, 2, weight=3)
+    Hnx = nx.relabel_nodes(G, {n: n + 100 for n in G})
+    Hcg = nxcg.relabel_nodes(G, 100)
+    assert_graphs_equal(Hnx, Hcg)
+    mapping = {0: "a", 2: "b", 4: "a"}
+    Hnx = nx.relabel_nodes(G, mapping)
+    Hcg = nxcg.relabel_nodes(G, pd.Series(mapping))
+    assert_graphs_equal(Hnx, Hcg)
+    with pytest.raises(TypeError, match="integer node keys"):
+        nxcg.relabel_nodes(nx.path_graph("abc"), 1)
+
+
+def test_relabel_empty_and_partial_series_mapping():
+    pd = pytest.importorskip("pandas")
+    for G in [nx.path_graph(5), nx.path_graph("abcde")]:
+        # An empty Series is an identity mapping
+        Hcg = nxcg.relabel_nodes(G, pd.Series([], dtype=object))
+        assert_graphs_equal(G, Hcg)
+        assert list(Hcg) == list(G)
+        # Series that map some nodes, with the same or a different dtype
+        nodes = list(G)
+        for mapping in [
+            {nodes[1]: nodes[0], nodes[3]: nodes[4]},
+            {nodes[0]: 10, nodes[4]: 20},
+            {nodes[2]: "x", "missing": "y"},
+        ]:
+            Hnx = nx.relabel_nodes(G, mapping)
+            Hcg = nxcg.relabel_nodes(G, pd.Series(mapping))
+            assert_graphs_equal(Hnx, Hcg)
+
+
+@pytest.mark.parametrize(
+    "create_using", [nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph]
+)
+@pytest.mark.parametrize(
+    "ordering", ["default", "sorted", "increasing degree", "decreasing degree"]
+)
+def test_convert_node_labels_to_integers(create_using, ordering):
+    G = nx.path_graph(["d", "b", "a", "c", "e"], create_using=create_using)
+    G.add_edge("a", "a", weight=2)
+    G.add_edge("c", "d")
+    G.nodes["b"]["x"] = 1
+    for first_label in [0, 10]:
+        Hnx = nx.convert_node_labels_to_integers(G, first_label, ordering, "old")
+        Hcg = nxcg.convert_node_labels_to_integers(G, first_label, ordering, "old")
+        assert_graphs_equal(Hnx, Hcg)
+        assert dict(Hnx.nodes(data=True)) == dict(Hcg.nodes(data=True))
@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION.
+# SPDX-License-Identifier: Apache-2.0
+import numpy as np
+import pytest
+
+import nx_cugraph as nxcg
+
+
+@pytest.mark.parametrize("merge_threshold", [None, 0, 3])
+def test_node_renumberer(merge_threshold):
+    rng = np.random.default_rng(42)
+    renumberer = nxcg.NodeRenumberer(merge_threshold=merge_threshold)
+    expected = {}
+    for _ in range(20):
+        keys = rng.integers(1000, 1100, size=rng.integers(0, 20))
+        # New keys of each batch are numbered in sorted order
+        for key in sorted(set(keys.tolist())):
+            expected.setdefault(key, len(expected))
+        ids = renumberer.encode(keys)
+        assert ids.dtype == np.int64
+        assert ids.tolist() == [expected[key] for key in keys.tolist()]
+        assert len(renumberer) == len(expected)
+    assert renumberer.key_to_id == expected
+    assert renumberer.id_to_key == list(expected)
+    assert renumberer.decode([2, 0]).tolist() == [
+        renumberer.id_to_key[2],
+        renumberer.id_to_key[0],
+    ]
+    assert 1000 + 200 not in renumberer
+    assert next(iter(expected)) in renumberer
+    assert not renumberer.is_identity
+    with pytest.raises(IndexError):
+        renumberer.decode([len(expected)])
+
+
+def test_node_renumberer_strings():
+    renumberer = nxcg.NodeRenumberer(["b", "a", "b"], merge_threshold=1)
+    assert renumberer.encode(["c", "a"]).tolist() == [2, 0]
+    assert renumberer.encode(["dd", "c", "e"]).tolist() == [3, 2, 4]
+    assert renumberer.id_to_key == ["a", "b", "c", "dd", "e"]
+    assert "dd" in renumberer
+    assert "d" not in renumberer
+    G = nxcg.CudaDiGraph.from_coo(
+        len(renumberer),
+        renumberer.encode(["a", "dd"]),
+        renumberer.encode(["e", "b"]),
+        id_to_key=renumberer.id_to_key,
+    )
+    assert sorted(G.edges) == [("a", "e"), ("dd", "b")]
+    with pytest.raises(ValueError, match="merge_threshold"):
+        nxcg.NodeRenumberer(merge_threshold=-1)
+
+
+def test_node_renumberer_identity():
+    renumberer = nxcg.NodeRenumberer([0, 1, 1])
+    renumberer.encode([2, 0, 3])
+    assert renumberer.is_identity
+    renumberer.encode([5])
+    assert not renumberer.is_identity
+    assert nxcg.NodeRenumberer().is_identity
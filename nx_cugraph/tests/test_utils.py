@@ -1,10 +1,15 @@
-# SPDX-FileCopyrightText: Copyright (c) 2023-2024, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 import cupy as cp
 import numpy as np
 import pytest
 
-from nx_cugraph.utils import _cp_iscopied_asarray, _get_int_dtype
+from nx_cugraph.utils import (
+    _coo_to_csr,
+    _cp_iscopied_asarray,
+    _get_int_dtype,
+    _symmetrize_sorted_indices,
+)
 
 
 def test_get_int_dtype():
@@ -93,3 +98,87 @@ def test_cp_iscopied_asarray():
     assert isinstance(a, cp.ndarray)
     assert repr(a) == "array([1, 2, 3])"
     assert _cp_iscopied_asarray(a)[0] is False
+
+
+@pytest.mark.parametrize("xp", [np, cp])
+@pytest.mark.parametrize("symmetrize", ["union", "intersection"])
+@pytest.mark.parametrize("chunk_size", [None, 7])
+def test_symmetrize_sorted_indices(xp, symmetrize, chunk_size, monkeypatch):
+    if chunk_size is not None:
+        monkeypatch.setattr("nx_cugraph.utils.misc._SYMMETRIZE_CHUNK_SIZE", chunk_size)
+    rng = np.random.default_rng(42)
+    N = 50
+    src_indices = rng.integers(0, N, 500).astype(np.int32)
+    dst_indices = rng.integers(0, N, 500).astype(np.int32)
+    indices = np.lexsort((dst_indices, src_indices))
+    src_indices = src_indices[indices]
+    dst_indices = dst_indices[indices]
+    keys = N * src_indices.astype(np.int64) + dst_indices
+    keys_T = src_indices + N * dst_indices.astype(np.int64)
+    if symmetrize == "union":
+        expected = np.union1d(keys, keys_T)
+    else:
+        expected = np.intersect1d(keys, keys_T)
+    src, dst = _symmetrize_sorted_indices(
+        N, xp.asarray(src_indices), xp.asarray(dst_indices), symmetrize
+    )
+    assert isinstance(src, xp.ndarray)
+    assert src.dtype == dst.dtype == np.int32
+    src = xp.asnumpy(src) if xp is cp else src
+    dst = xp.asnumpy(dst) if xp is cp else dst
+    np.testing.assert_array_equal(N * src.astype(np.int64) + dst, expected)
+
+    src, dst = _symmetrize_sorted_indices(
+        N, xp.empty(0, np.int32), xp.empty(0, np.int32), symmetrize
+    )
+    assert src.size == dst.size == 0
+    with pytest.raises(ValueError, match="symmetrize must be"):
+        _symmetrize_sorted_indices(N, src, dst, "bad")
+
+
+@pytest.mark.parametrize("xp", [np, cp])
+@pytest.mark.parametrize("dtype", [np.float64, np.int64, bool])
+def test_coo_to_csr(xp, dtype):
+    import scipy as sp
+
+    rng = np.random.default_rng(42)
+    nrows, ncols = 30, 20
+    row_indices = rng.integers(0, nrows, 200).astype(np.int32)
+    col_indices = rng.integers(0, ncols, 200).astype(np.int32)
+    values = rng.integers(0, 3, 200).astype(dtype)
+    expected = sp.sparse.coo_array(
+        (values, (row_indices, col_indices)), shape=(nrows, ncols)
+    ).tocsr()
+    expected.sum_duplicates()
+    data, indices, indptr = _coo_to_csr(
+        nrows, xp.asarray(row_indices), xp.asarray(col_indices), xp.asarray(values)
+    )
+    assert isinstance(data, xp.ndarray)
+    assert data.dtype == dtype
+    if xp is cp:
+        data, indices, indptr = (
+            cp.asnumpy(data),
+            cp.asnumpy(indices),
+            cp.asnumpy(indptr),
+        )
+    np.testing.assert_array_equal(indptr, expected.indptr)
+    np.testing.assert_array_equal(indices, expected.indices)
+    np.testing.assert_array_equal(data, expected.data)
+
+    # Already sorted
+    data, indices, indptr = _coo_to_csr(
+        ncols,
+        xp.asarray(np.repeat(np.arange(ncols, dtype=np.int32), 2)),
+        xp.asarray(np.tile(np.array([1, 3], dtype=np.int32), ncols)),
+        xp.ones(2 * ncols, dtype=dtype),
+        is_sorted=True,
+    )
+    assert indptr.tolist() == list(range(0, 2 * ncols + 1, 2))
+    assert indices.tolist() == [1, 3] * ncols
+
+    # Empty
+    data, indices, indptr = _coo_to_csr(
+        nrows, xp.empty(0, np.int32), xp.empty(0, np.int32), xp.empty(0, dtype)
+    )
+    assert data.size == indices.size == 0
+    assert indptr.tolist() == [0] * (nrows + 1)
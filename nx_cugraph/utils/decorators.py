@@ -1,8 +1,8 @@
-# SPDX-FileCopyrightText: Copyright (c) 2023-2025, NVIDIA CORPORATION.
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
-from functools import partial, update_wrapper
+from functools import cached_property, partial, update_wrapper
 from textwrap import dedent
 
 import networkx as nx
@@ -12,6 +12,7 @@ from networkx.utils.decorators import nodes_or_number, not_implemented_for
 import nx_cugraph as nxcg
 from nx_cugraph import _nxver
 from nx_cugraph.interface import BackendInterface
+from nx_cugraph.profiling import _active_reports, _span
 
 from .misc import _And_NotImplementedError
 
@@ -147,6 +148,12 @@ class networkx_algorithm:
         self.should_run = func
 
     def __call__(self, /, *args, **kwargs):
+        if _active_reports:
+            with _span(self.name, "call"):
+                return self._call(*args, **kwargs)
+        return self._call(*args, **kwargs)
+
+    def _call(self, /, *args, **kwargs):
         if not self.fallback:
             return self.__wrapped__(*args, **kwargs)
         try:
@@ -201,6 +208,28 @@ def _gpu_cpu_api(nx_class, module_name):
         prevents creating NetworkX data structures.
         """
         nx_func = getattr(nx_class, attr)
+        if isinstance(nx_func, (property, cached_property)):
+            # Views such as ``G.degree`` are (cached) properties in NetworkX
+            def fget(self):
+                # Attribute dicts on host may be changed in-place (which doesn't
+                # clear the cache), so use the host graph whenever it exists.
+                if self._is_on_cpu:
+                    return nx_func.__get__(self, type(self))
+                cuda_graph = self._get_cudagraph(
+                    edge_data=edge_data, node_data=node_data
+                )
+                if cuda_graph is None:
+                    return nx_func.__get__(self, type(self))
+                rv = getattr(cuda_graph, attr)
+                if hasattr(rv, "_compat_graph"):
+                    # Let the view get (mutable) attribute dicts from this graph
+                    rv._compat_graph = self
+                return rv
+
+            fget.__name__ = attr
+            fget.__qualname__ = f"{nx_class.__name__}.{attr}"
+            fget.__module__ = module_name
+            return property(fget, doc=nx_func.__doc__)
 
         def inner(self, *args, **kwargs):
             cuda_graph = self._get_cudagraph(edge_data=edge_data, node_data=node_data)
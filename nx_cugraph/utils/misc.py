@@ -24,6 +24,8 @@ if TYPE_CHECKING:
 __all__ = [
     "index_dtype",
     "_groupby",
+    "_symmetrize_sorted_indices",
+    "_coo_to_csr",
     "_seed_to_int",
     "_get_int_dtype",
     "_get_float_dtype",
@@ -104,6 +106,166 @@ def _groupby(
     return {group: sorted_values[start:end] for group, (start, end) in it}
 
 
+# Number of reverse edges to compute keys for at a time when symmetrizing
+_SYMMETRIZE_CHUNK_SIZE = 2**24
+
+
+def _symmetrize_sorted_indices(
+    N: int,
+    src_indices: cp.ndarray | np.ndarray,
+    dst_indices: cp.ndarray | np.ndarray,
+    symmetrize: str = "union",
+) -> tuple[cp.ndarray, cp.ndarray] | tuple[np.ndarray, np.ndarray]:
+    """Symmetrize edges that are already sorted by (src, dst) without a global sort.
+
+    The reverse edges are computed with a stable sort of ``dst_indices`` alone,
+    which keeps them sorted by (dst, src). The edges and reverse edges are then
+    merged as two sorted sequences. This avoids sorting ``2 * E`` int64 keys as
+    done by e.g. ``union1d``, and it works with both CuPy and NumPy arrays.
+    Keys of reverse edges are computed in chunks, so at most two arrays of
+    ``E`` int64 are used for keys and merge positions.
+
+    Parameters
+    ----------
+    N : int
+        The number of nodes.
+    src_indices : cp.ndarray or np.ndarray
+    dst_indices : cp.ndarray or np.ndarray
+        The edges, which must be sorted by (src, dst). Duplicates are allowed.
+    symmetrize : {"union", "intersection"}, default "union"
+        Whether to keep edges that exist in either or both directions.
+
+    Returns
+    -------
+    tuple of arrays ``(src_indices, dst_indices)`` sorted by (src, dst) with
+    duplicate edges removed.
+    """
+    if symmetrize not in {"union", "intersection"}:
+        raise ValueError(
+            f'symmetrize must be "union" or "intersection"; got "{symmetrize}"'
+        )
+    xp = cp.get_array_module(src_indices)
+    size = src_indices.size
+    if size == 0:
+        return src_indices[:0].copy(), dst_indices[:0].copy()
+    # Keys of edges are sorted. Keys of reverse edges are computed in chunks, so
+    # at most two arrays of E int64 exist at a time.
+    keys = N * src_indices.astype(np.int64)
+    keys += dst_indices
+    chunks = [
+        slice(start, start + _SYMMETRIZE_CHUNK_SIZE)
+        for start in range(0, size, _SYMMETRIZE_CHUNK_SIZE)
+    ]
+    if symmetrize == "intersection":
+        # Keep edges whose reverse edge exists
+        mask = xp.empty(size, dtype=bool)
+        for chunk in chunks:
+            keys_T = N * dst_indices[chunk].astype(np.int64)
+            keys_T += src_indices[chunk]
+            idx = xp.searchsorted(keys, keys_T)
+            idx[idx == size] = 0
+            mask[chunk] = keys[idx] == keys_T
+        # Drop duplicate edges
+        mask[1:] &= keys[1:] != keys[:-1]
+        return src_indices[mask], dst_indices[mask]
+    # Stable sort keeps reverse edges sorted by (src_T, dst_T) == (dst, src)
+    order = xp.argsort(dst_indices, kind="stable")
+    src_indices_T = dst_indices[order]
+    dst_indices_T = src_indices[order]
+    del order
+    # Merge: ties place edges before reverse edges, so positions are unique
+    positions_T = xp.empty(size, dtype=np.int64)
+    for chunk in chunks:
+        keys_T = N * src_indices_T[chunk].astype(np.int64)
+        keys_T += dst_indices_T[chunk]
+        positions_T[chunk] = xp.searchsorted(keys, keys_T, side="right")
+        positions_T[chunk] += xp.arange(chunk.start, min(chunk.stop, size))
+    del keys, keys_T
+    # Edges keep their order when merged, so they fill the remaining positions
+    mask = xp.ones(2 * size, dtype=bool)
+    mask[positions_T] = False
+    new_src_indices = xp.empty(2 * size, dtype=src_indices.dtype)
+    new_dst_indices = xp.empty(2 * size, dtype=dst_indices.dtype)
+    new_src_indices[mask] = src_indices
+    new_dst_indices[mask] = dst_indices
+    new_src_indices[positions_T] = src_indices_T
+    new_dst_indices[positions_T] = dst_indices_T
+    del positions_T, src_indices_T, dst_indices_T
+    # Drop duplicate edges
+    mask[0] = True
+    mask[1:] = (new_src_indices[1:] != new_src_indices[:-1]) | (
+        new_dst_indices[1:] != new_dst_indices[:-1]
+    )
+    return new_src_indices[mask], new_dst_indices[mask]
+
+
+def _coo_to_csr(
+    nrows: int,
+    row_indices: cp.ndarray | np.ndarray,
+    col_indices: cp.ndarray | np.ndarray,
+    values: cp.ndarray | np.ndarray,
+    *,
+    is_sorted: bool = False,
+) -> (
+    tuple[cp.ndarray, cp.ndarray, cp.ndarray]
+    | tuple[np.ndarray, np.ndarray, np.ndarray]
+):
+    """Compute the CSR arrays of a sparse matrix in COO format.
+
+    Entries are sorted by (row, col), and duplicate entries are summed. This works
+    with both CuPy and NumPy arrays, so CSR matrices can be built on device and only
+    the compressed arrays need to be copied to host. Swap ``row_indices`` and
+    ``col_indices`` (and use the number of columns) to compute CSC arrays instead.
+
+    Parameters
+    ----------
+    nrows : int
+        The number of rows.
+    row_indices : cp.ndarray or np.ndarray
+    col_indices : cp.ndarray or np.ndarray
+    values : cp.ndarray or np.ndarray
+        The COO entries, which may include duplicates.
+    is_sorted : bool, default False
+        Whether the entries are already sorted by (row, col).
+
+    Returns
+    -------
+    tuple of arrays ``(data, indices, indptr)`` as expected by e.g.
+    ``scipy.sparse.csr_array``.
+    """
+    xp = cp.get_array_module(row_indices)
+    size = row_indices.size
+    indptr_dtype = np.int32 if size <= np.iinfo(np.int32).max else np.int64
+    indptr = xp.zeros(nrows + 1, dtype=indptr_dtype)
+    if size == 0:
+        return values, col_indices, indptr
+    if not is_sorted:
+        sorter = xp.lexsort(xp.vstack((col_indices, row_indices)))
+        row_indices = row_indices[sorter]
+        col_indices = col_indices[sorter]
+        values = values[sorter]
+        del sorter
+    is_first = xp.empty(size, dtype=bool)
+    is_first[0] = True
+    is_first[1:] = (row_indices[1:] != row_indices[:-1]) | (
+        col_indices[1:] != col_indices[:-1]
+    )
+    if not is_first.all():
+        # Sum duplicate entries
+        groups = xp.cumsum(is_first) - 1
+        row_indices = row_indices[is_first]
+        col_indices = col_indices[is_first]
+        if values.dtype == bool:
+            summed = xp.zeros(row_indices.size, dtype=bool)
+            summed[groups[values]] = True
+        else:
+            summed = xp.zeros(row_indices.size, dtype=values.dtype)
+            xp.add.at(summed, groups, values)
+        values = summed
+    indptr[1:] = xp.cumsum(xp.bincount(row_indices, minlength=nrows))
+    return values, col_indices, indptr
+
+
 def _seed_to_int(seed: int | Random | np.random.RandomState | None) -> int:
     """Handle any valid seed argument and convert it to an int if necessary."""
     if seed is None: